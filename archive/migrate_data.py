@@ -6,42 +6,242 @@ Exports all data from SQLite database and imports into Supabase,
 maintaining foreign key relationships and data integrity.
 """
 
+import csv
+import io
+import os
+import queue
 import sqlite3
 import json
+import threading
+import time
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Iterable, Iterator, Callable
+import httpx
+from dotenv import load_dotenv
+from postgrest.exceptions import APIError
 from supabase_client import get_supabase_client
 
+# Load environment variables
+load_dotenv()
 
-# Migration order (respects foreign key dependencies)
-MIGRATION_ORDER = [
+# Try to import psycopg2 for direct database access (much faster bulk load)
+try:
+    import psycopg2
+    import psycopg2.extras
+    from psycopg2 import sql
+    HAS_PSYCOPG2 = True
+except ImportError:
+    HAS_PSYCOPG2 = False
+
+
+# Migration tiers (respects foreign key dependencies).
+# Tables within a tier are independent and can be migrated concurrently;
+# each tier must finish before the next one starts.
+MIGRATION_TIERS = [
     # Tier 1: No dependencies
-    ('posts', 'post_id'),
-    ('profiles', 'profile_id'),
-    ('tags', 'tag_id'),
-    ('download_runs', 'run_id'),
+    [
+        ('posts', 'post_id'),
+        ('profiles', 'profile_id'),
+        ('tags', 'tag_id'),
+        ('download_runs', 'run_id'),
+    ],
 
     # Tier 2: Depends on Tier 1
-    ('profile_tags', 'profile_tag_id'),
-    ('post_tags', 'post_tag_id'),
-    ('data_downloads', 'download_id'),
-    ('action_queue', 'queue_id'),
-    ('post_media', 'media_id'),
+    [
+        ('profile_tags', 'profile_tag_id'),
+        ('post_tags', 'post_tag_id'),
+        ('data_downloads', 'download_id'),
+        ('action_queue', 'queue_id'),
+        ('post_media', 'media_id'),
+    ],
 ]
 
-# Boolean fields that need conversion (0/1 → True/False)
+# Flat migration order (tier by tier)
+MIGRATION_ORDER = [table for tier in MIGRATION_TIERS for table in tier]
+
+# Primary key per table (conflict target for idempotent re-runs)
+PRIMARY_KEYS = dict(MIGRATION_ORDER)
+
+# Large tables loaded with COPY on the direct PostgreSQL path
+COPY_TABLES = {'posts', 'data_downloads'}
+
+# Large tables whose secondary indexes are dropped during the bulk load
+# and rebuilt afterwards (psycopg2 path only)
+INDEX_REBUILD_TABLES = {'posts', 'data_downloads', 'post_tags'}
+
+# Definitions of dropped indexes are saved here before the drop, so they can
+# be restored by hand if the migration dies before rebuilding them
+INDEX_BACKUP_DIR = Path("data/index_backups")
+
+# Approximate PostgREST request body limit for coalesced REST inserts
+REST_MAX_PAYLOAD_BYTES = 1_000_000
+
+# REST insert retries for transient failures (delay doubles each attempt)
+INSERT_ATTEMPTS = 4
+RETRY_BASE_DELAY = 0.2
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Return True for errors worth retrying (network/timeouts, HTTP 5xx)."""
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    if isinstance(error, APIError):
+        # postgrest-py raises APIError for every non-2xx response. Gateway
+        # failures carry the HTTP status as their code; PostgREST and
+        # SQLSTATE codes (e.g. "PGRST116", "23505") fall outside 5xx
+        try:
+            return 500 <= int(error.code) <= 599
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+# Boolean fields that need conversion (0/1 → True/False).
+# The REST path converts them in Python; the psycopg2 path casts in SQL.
 BOOLEAN_FIELDS = {
     'posts': ['is_read', 'is_marked'],
     'profiles': ['is_active'],
 }
 
 
+def _make_transform(fields: List[str]) -> Callable[[Dict[str, Any]], None]:
+    """Build an in-place row transform converting `fields` (0/1) to booleans."""
+    def transform(row: Dict[str, Any]) -> None:
+        for field in fields:
+            value = row.get(field)
+            if value is not None:
+                row[field] = bool(value)
+    return transform
+
+
+# Per-table row transforms; tables without an entry need no conversion
+TRANSFORMS = {table: _make_transform(fields) for table, fields in BOOLEAN_FIELDS.items()}
+
+# Read-side pragmas for bulk export: no writes, large page cache, mmap'd reads
+SQLITE_READ_PRAGMAS = [
+    "PRAGMA query_only=ON",
+    "PRAGMA cache_size=-262144",   # 256 MiB
+    f"PRAGMA mmap_size={1 << 34}",
+]
+
+
+def open_sqlite_readonly(db_path: str) -> sqlite3.Connection:
+    """Open a SQLite database read-only, tuned for sequential bulk reads."""
+    conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True)
+    for pragma in SQLITE_READ_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+# Maximum number of tables migrated concurrently within a tier
+MAX_WORKERS = 4
+
+# Number of exported batches buffered ahead of the importer
+PREFETCH_BATCHES = 4
+
+
+def prefetch(items: Iterable[Any], maxsize: int = PREFETCH_BATCHES) -> Iterator[Any]:
+    """Iterate `items` on a background thread, buffering up to `maxsize` ahead.
+
+    Lets the SQLite export (producer) overlap with the network import
+    (consumer). Exceptions raised by the producer (any BaseException) are
+    re-raised here.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=maxsize)
+    done = object()
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        end = done
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as e:
+            # Forward everything, KeyboardInterrupt and SystemExit included,
+            # so the consumer is never left waiting on a dead producer
+            end = e
+        finally:
+            try:
+                # Close a generator here rather than on garbage collection, so its
+                # cleanup (e.g. closing a SQLite connection) runs on this thread
+                close = getattr(items, 'close', None)
+                if close is not None:
+                    close()
+            finally:
+                put(end)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+class BatchCounter:
+    """Wrap an iterable of batches, counting the rows that pass through."""
+
+    def __init__(self, batches: Iterable[list]):
+        self._batches = iter(batches)
+        self.rows = 0
+
+    def __iter__(self):
+        for batch in self._batches:
+            self.rows += len(batch)
+            yield batch
+
+    def drain(self):
+        """Consume (and count) any batches not yet iterated."""
+        for _ in self:
+            pass
+
+
 class DataMigrator:
     """Handles migration from SQLite to Supabase."""
 
-    def __init__(self, sqlite_db_path: str = "data/posts_v2.db"):
+    def __init__(
+        self,
+        sqlite_db_path: str = "data/posts_v2.db",
+        max_workers: int = MAX_WORKERS,
+        strict: bool = False
+    ):
         self.sqlite_db_path = sqlite_db_path
+        self.max_workers = max_workers
+        # Always run a COUNT(*) verification, even when the commit already proves the load
+        self.strict = strict
         self.supabase_client = get_supabase_client()
+
+        # Request builders are stateless, so one handle per table is reused
+        # for every insert/verify call (all share the client's HTTP session)
+        self._tables = {
+            table_name: self.supabase_client.table(table_name)
+            for table_name, _ in MIGRATION_ORDER
+        }
+
+        # Direct PostgreSQL connection string; falls back to REST inserts if unavailable
+        self.pg_db_url = os.getenv("SUPABASE_DB_URL") if HAS_PSYCOPG2 else None
+
         self.stats = {
             'tables': {},
             'total_rows': 0,
@@ -49,96 +249,643 @@ class DataMigrator:
             'start_time': None,
             'end_time': None,
         }
+        self._stats_lock = threading.Lock()
+        self._schema_cache: Dict[str, Tuple[List[str], List[str]]] = {}
+
+    def count_sqlite_rows(self, table_names: Iterable[str]) -> Dict[str, int]:
+        """Count rows per table in SQLite over a single connection."""
+        conn = open_sqlite_readonly(self.sqlite_db_path)
+        try:
+            return {
+                table_name: conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+                for table_name in table_names
+            }
+        finally:
+            conn.close()
+
+    def iter_table_batches(
+        self,
+        table_name: str,
+        batch_size: int = 100
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream rows from a SQLite table in batches.
 
-    def export_table_from_sqlite(self, table_name: str) -> List[Dict[str, Any]]:
-        """Export all rows from a SQLite table.
+        Boolean fields (0/1) are converted to Python booleans as each
+        batch is built, so only one batch is held in memory at a time.
 
         Args:
             table_name: Name of table to export
+            batch_size: Number of rows per batch
 
-        Returns:
-            List of dictionaries (one per row)
+        Yields:
+            Lists of row dictionaries
         """
-        conn = sqlite3.connect(self.sqlite_db_path)
+        transform = TRANSFORMS.get(table_name)
+        columns, _ = self._schema(table_name)
+
+        conn = open_sqlite_readonly(self.sqlite_db_path)
         conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT {', '.join(columns)} FROM {table_name}")
 
-        cursor.execute(f"SELECT * FROM {table_name}")
-        rows = cursor.fetchall()
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
 
-        # Convert to list of dicts
-        data = [dict(row) for row in rows]
+                batch = [dict(row) for row in rows]
+                if transform is not None:
+                    for row in batch:
+                        transform(row)
+                yield batch
+        finally:
+            conn.close()
 
-        conn.close()
-        return data
+    def _schema(self, table_name: str, conn: sqlite3.Connection = None) -> Tuple[List[str], List[str]]:
+        """Return (column names, declared types) for a SQLite table.
 
-    def convert_boolean_fields(self, table_name: str, row: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert SQLite boolean fields (0/1) to Python booleans.
+        PRAGMA table_info is read once per table and memoized, so the
+        export SELECT and the target INSERT always use the same column order.
 
         Args:
             table_name: Name of table
-            row: Row data dictionary
+            conn: Optional open connection to reuse
 
         Returns:
-            Row with converted boolean fields
+            Tuple of (columns, types) in declaration order
+        """
+        schema = self._schema_cache.get(table_name)
+        if schema is not None:
+            return schema
+
+        owns_conn = conn is None
+        if owns_conn:
+            conn = open_sqlite_readonly(self.sqlite_db_path)
+        try:
+            info = conn.execute(f"PRAGMA table_info({table_name})").fetchall()
+        finally:
+            if owns_conn:
+                conn.close()
+
+        schema = ([row[1] for row in info], [row[2] for row in info])
+        self._schema_cache[table_name] = schema
+        return schema
+
+    def load_schemas(self, table_names: Iterable[str]):
+        """Warm the schema cache for several tables over one connection."""
+        conn = open_sqlite_readonly(self.sqlite_db_path)
+        try:
+            for table_name in table_names:
+                self._schema(table_name, conn)
+        finally:
+            conn.close()
+
+    def iter_table_tuples(
+        self,
+        table_name: str,
+        columns: List[str],
+        batch_size: int = 1000
+    ) -> Iterator[List[tuple]]:
+        """Stream rows from a SQLite table as tuples in `columns` order.
+
+        Used by the direct PostgreSQL path, which takes positional rows, so
+        no per-row dict is ever built. Boolean columns are left as 0/1 and
+        cast by PostgreSQL (see values_template).
+
+        Args:
+            table_name: Name of table to export
+            columns: Columns to select (and their order in each tuple)
+            batch_size: Number of rows per batch
+
+        Yields:
+            Lists of row tuples
+        """
+        conn = open_sqlite_readonly(self.sqlite_db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT {', '.join(columns)} FROM {table_name}")
+
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            conn.close()
+
+    def _insert_with_retry(self, table_name: str, rows: List[Dict[str, Any]]):
+        """Insert rows via REST, retrying transient failures with exponential backoff.
+
+        Uses ON CONFLICT DO NOTHING semantics, so re-running a partially
+        completed migration is safe.
+
+        Raises:
+            The last exception if the insert still fails (or fails permanently)
         """
-        if table_name in BOOLEAN_FIELDS:
-            for field in BOOLEAN_FIELDS[table_name]:
-                if field in row and row[field] is not None:
-                    row[field] = bool(row[field])
-        return row
+        for attempt in range(INSERT_ATTEMPTS):
+            try:
+                # Rows already present (from an earlier partial run) are skipped
+                self._tables[table_name].upsert(
+                    rows, on_conflict=PRIMARY_KEYS[table_name], ignore_duplicates=True
+                ).execute()
+                return
+            except Exception as e:
+                if attempt == INSERT_ATTEMPTS - 1 or not is_transient_error(e):
+                    raise
+                time.sleep(RETRY_BASE_DELAY * 2 ** attempt)
 
-    def import_table_to_supabase(
+    def _insert_batch(
         self,
         table_name: str,
-        data: List[Dict[str, Any]],
-        batch_size: int = 100
+        batch: List[Dict[str, Any]],
+        batch_number: int
     ) -> Tuple[int, int]:
-        """Import data into Supabase table in batches.
+        """Insert one batch into Supabase, bisecting to isolate bad rows on failure.
+
+        Transient errors (timeouts, 5xx) are retried with backoff first. If
+        the batch still fails it is split in half recursively, so k bad rows
+        cost O(k log n) requests rather than one request per row.
 
         Args:
             table_name: Name of table to import into
-            data: List of row dictionaries
-            batch_size: Number of rows per batch
+            batch: List of row dictionaries
+            batch_number: 1-based batch number (for progress output)
 
         Returns:
             Tuple of (successful_count, error_count)
         """
-        if not data:
-            return 0, 0
+        try:
+            # Attempt batch insert
+            self._insert_with_retry(table_name, batch)
+            print(f"  ✓ Inserted batch {batch_number} ({len(batch)} rows)")
+            return len(batch), 0
 
+        except Exception as e:
+            print(f"  ⚠ Batch insert failed, bisecting to isolate bad rows: {e}")
+            batch_error = e
+
+        successful = 0
+        errors = 0
+
+        def bisect(rows: List[Dict[str, Any]], error: Exception):
+            """Split failed rows in half until each failure is a single row."""
+            nonlocal successful, errors
+            if len(rows) <= 1:
+                errors += len(rows)
+                # Print first few errors only
+                if rows and errors <= 5:
+                    print(f"  ✗ Error inserting row: {error}")
+                return
+
+            mid = len(rows) // 2
+            for half in (rows[:mid], rows[mid:]):
+                try:
+                    self._insert_with_retry(table_name, half)
+                    successful += len(half)
+                except Exception as half_error:
+                    bisect(half, half_error)
+
+        bisect(batch, batch_error)
+        return successful, errors
+
+    @staticmethod
+    def values_template(table_name: str, columns: List[str]) -> str:
+        """Build a VALUES row template that casts SQLite 0/1 booleans server-side.
+
+        COPY needs no cast: PostgreSQL's boolean input already accepts '0'/'1'.
+        """
+        bool_fields = BOOLEAN_FIELDS.get(table_name, ())
+        placeholders = ['%s::boolean' if col in bool_fields else '%s' for col in columns]
+        return f"({', '.join(placeholders)})"
+
+    def _copy_batch(self, cursor, table_name: str, columns: List[str], batch: List[tuple]):
+        """Load one batch with COPY ... FROM STDIN (CSV).
+
+        COPY has no ON CONFLICT clause, so rows go into a temp staging table
+        first and are then moved with INSERT ... ON CONFLICT DO NOTHING.
+
+        NULLs are written as unquoted empty fields and every other value is
+        quoted, so empty strings and NULLs stay distinct.
+        """
+        stage = f"migrate_stage_{table_name}"
+        column_list = ', '.join(columns)
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, quoting=csv.QUOTE_NOTNULL)
+        writer.writerows(batch)
+        buffer.seek(0)
+
+        cursor.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {stage} "
+            f"(LIKE {table_name} INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        cursor.execute(f"TRUNCATE {stage}")
+        cursor.copy_expert(f"COPY {stage} ({column_list}) FROM STDIN WITH (FORMAT csv)", buffer)
+        cursor.execute(
+            f"INSERT INTO {table_name} ({column_list}) SELECT {column_list} FROM {stage} "
+            f"ON CONFLICT ({PRIMARY_KEYS[table_name]}) DO NOTHING"
+        )
+
+    def _insert_rows_postgres(
+        self,
+        cursor,
+        table_name: str,
+        columns: List[str],
+        batch: List[tuple]
+    ) -> Tuple[int, int]:
+        """Insert a failed batch row-by-row, isolating bad rows with savepoints.
+
+        Returns:
+            Tuple of (successful_count, error_count)
+        """
+        insert_sql = (
+            f"INSERT INTO {table_name} ({', '.join(columns)}) "
+            f"VALUES {self.values_template(table_name, columns)} "
+            f"ON CONFLICT ({PRIMARY_KEYS[table_name]}) DO NOTHING"
+        )
         successful = 0
         errors = 0
 
-        # Process in batches
-        for i in range(0, len(data), batch_size):
-            batch = data[i:i+batch_size]
+        for row in batch:
+            cursor.execute("SAVEPOINT migrate_row")
+            try:
+                cursor.execute(insert_sql, row)
+                cursor.execute("RELEASE SAVEPOINT migrate_row")
+                successful += 1
+            except psycopg2.Error as row_error:
+                cursor.execute("ROLLBACK TO SAVEPOINT migrate_row")
+                errors += 1
+                # Print first few errors only
+                if errors <= 5:
+                    print(f"  ✗ Error inserting row: {row_error}")
+
+        return successful, errors
 
-            # Convert boolean fields for entire batch
-            batch = [self.convert_boolean_fields(table_name, row) for row in batch]
+    def _load_table_postgres(
+        self,
+        cursor,
+        table_name: str,
+        columns: List[str],
+        batches: Iterable[List[tuple]]
+    ) -> Tuple[int, int]:
+        """Load batches into a table inside the caller's open transaction.
+
+        Each batch runs under a savepoint so a bad row only forces that batch
+        to be retried row-by-row instead of aborting the whole load. Rows
+        whose primary key already exists are skipped, so re-runs are
+        idempotent. Nothing is committed here.
+
+        Returns:
+            Tuple of (successful_count, error_count)
+        """
+        successful = 0
+        errors = 0
+        use_copy = table_name in COPY_TABLES
+        template = self.values_template(table_name, columns)
 
+        for batch_number, batch in enumerate(batches, start=1):
+            cursor.execute("SAVEPOINT migrate_batch")
             try:
-                # Attempt batch insert
-                result = self.supabase_client.table(table_name).insert(batch).execute()
+                if use_copy:
+                    self._copy_batch(cursor, table_name, columns, batch)
+                else:
+                    psycopg2.extras.execute_values(
+                        cursor,
+                        f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES %s "
+                        f"ON CONFLICT ({PRIMARY_KEYS[table_name]}) DO NOTHING",
+                        batch,
+                        template=template,
+                        page_size=1000
+                    )
+                cursor.execute("RELEASE SAVEPOINT migrate_batch")
                 successful += len(batch)
-                print(f"  ✓ Inserted batch {i//batch_size + 1} ({len(batch)} rows)")
+                print(f"  ✓ Loaded batch {batch_number} ({len(batch)} rows)")
 
-            except Exception as e:
+            except psycopg2.Error as e:
                 # If batch fails, try one-by-one
-                print(f"  ⚠ Batch insert failed, trying row-by-row: {e}")
-
-                for row in batch:
-                    try:
-                        self.supabase_client.table(table_name).insert(row).execute()
-                        successful += 1
-                    except Exception as row_error:
-                        errors += 1
-                        # Print first few errors only
-                        if errors <= 5:
-                            print(f"  ✗ Error inserting row: {row_error}")
+                cursor.execute("ROLLBACK TO SAVEPOINT migrate_batch")
+                print(f"  ⚠ Batch load failed, trying row-by-row: {e}")
+                batch_successful, batch_errors = self._insert_rows_postgres(
+                    cursor, table_name, columns, batch
+                )
+                successful += batch_successful
+                errors += batch_errors
 
         return successful, errors
 
+    def _import_table_postgres(
+        self,
+        table_name: str,
+        columns: List[str],
+        batches: Iterable[List[tuple]]
+    ) -> Tuple[int, int, int]:
+        """Import batches over a direct PostgreSQL connection.
+
+        Each table gets its own connection (tables in a tier load concurrently)
+        and is loaded in a single transaction, committed once at the end.
+
+        Args:
+            table_name: Name of table to import into
+            columns: Column names matching the tuple positions
+            batches: Iterable of row-tuple batches (e.g. from iter_table_tuples)
+
+        Returns:
+            Tuple of (exported_count, successful_count, error_count)
+        """
+        counter = BatchCounter(batches)
+
+        conn = psycopg2.connect(self.pg_db_url)
+        conn.autocommit = False
+        try:
+            with conn.cursor() as cursor:
+                successful, errors = self._load_table_postgres(cursor, table_name, columns, counter)
+
+            conn.commit()
+            return counter.rows, successful, errors
+
+        except Exception as e:
+            conn.rollback()
+            print(f"  ✗ Load failed, rolled back {table_name}: {e}")
+            # Drain the remaining batches so the export count stays accurate
+            counter.drain()
+            return counter.rows, 0, counter.rows
+
+        finally:
+            conn.close()
+
+    def fk_constraints_deferrable(self) -> bool:
+        """Return True if every foreign key in the public schema is DEFERRABLE."""
+        conn = psycopg2.connect(self.pg_db_url)
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT COUNT(*) FROM pg_constraint
+                    WHERE contype = 'f'
+                      AND connamespace = 'public'::regnamespace
+                      AND NOT condeferrable
+                    """
+                )
+                return cursor.fetchone()[0] == 0
+        finally:
+            conn.close()
+
+    def migrate_tables_deferred(self, table_names: List[str]) -> List[Dict[str, Any]]:
+        """Load all tables in one transaction with FK checks deferred to COMMIT.
+
+        With `SET CONSTRAINTS ALL DEFERRED` the load order no longer has to
+        follow the dependency tiers, there is no barrier between tiers, and
+        the whole migration commits (or rolls back) atomically. Requires FK
+        constraints declared DEFERRABLE (see fk_constraints_deferrable).
+
+        Args:
+            table_names: Tables to migrate, in load order
+
+        Returns:
+            List of per-table statistics dictionaries
+        """
+        results = {}
+        dropped_indexes = {}
+        try:
+            # Dropped inside the try, so if a later table's drop fails the
+            # indexes already dropped are still rebuilt below
+            for table_name in table_names:
+                if table_name in INDEX_REBUILD_TABLES:
+                    dropped_indexes[table_name] = self.pre_migration_sql(table_name)
+
+            conn = psycopg2.connect(self.pg_db_url)
+            conn.autocommit = False
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute("SET CONSTRAINTS ALL DEFERRED")
+
+                    for table_name in table_names:
+                        print(f"\n{'='*60}")
+                        print(f"Migrating table: {table_name}")
+                        print(f"{'='*60}")
+
+                        columns, _ = self._schema(table_name)
+                        counter = BatchCounter(prefetch(self.iter_table_tuples(table_name, columns)))
+                        successful, errors = self._load_table_postgres(cursor, table_name, columns, counter)
+                        results[table_name] = (counter.rows, successful, errors)
+
+                # Deferred FK checks run here
+                conn.commit()
+
+            except Exception as e:
+                conn.rollback()
+                print(f"\n  ✗ Deferred load failed, rolled back all tables: {e}")
+                counts = self.count_sqlite_rows(table_names)
+                results = {table_name: (counts[table_name], 0, counts[table_name]) for table_name in table_names}
+
+            finally:
+                conn.close()
+
+        finally:
+            # post_migration_sql reports its own failures, so every table is rebuilt
+            for table_name, indexes in dropped_indexes.items():
+                self.post_migration_sql(table_name, indexes)
+
+        return [
+            self._finish_table(table_name, *results[table_name])
+            for table_name in table_names
+        ]
+
+    def pre_migration_sql(self, table_name: str) -> List[Tuple[str, str]]:
+        """Drop a table's secondary indexes before bulk load.
+
+        Indexes backing constraints (primary key, unique) and standalone
+        unique indexes are kept, so ON CONFLICT and uniqueness checks still
+        work during the load.
+
+        The definitions are printed and written to INDEX_BACKUP_DIR before
+        anything is dropped, so a crash or Ctrl-C mid-load can't lose them.
+        If a drop fails, the indexes already dropped are rebuilt first.
+
+        Returns:
+            (index name, definition) of each dropped index, for post_migration_sql
+        """
+        conn = psycopg2.connect(self.pg_db_url)
+        # DROP/CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        conn.autocommit = True
+        dropped = []
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT i.indexname, i.indexdef
+                    FROM pg_indexes i
+                    WHERE i.schemaname = 'public'
+                      AND i.tablename = %s
+                      AND i.indexdef NOT LIKE 'CREATE UNIQUE INDEX%%'
+                      AND NOT EXISTS (
+                          SELECT 1 FROM pg_constraint c
+                          WHERE c.conindid = format('%%I.%%I', i.schemaname, i.indexname)::regclass
+                      )
+                    """,
+                    (table_name,)
+                )
+                indexes = cursor.fetchall()
+                if not indexes:
+                    return []
+
+                backup_path = self._save_index_defs(table_name, indexes)
+                print(f"  → Dropping {len(indexes)} secondary indexes on {table_name} "
+                      f"(definitions saved to {backup_path}):")
+                for _, index_def in indexes:
+                    print(f"      {index_def};")
+
+                for index_name, index_def in indexes:
+                    cursor.execute(
+                        sql.SQL("DROP INDEX CONCURRENTLY IF EXISTS {}").format(
+                            sql.Identifier('public', index_name)
+                        )
+                    )
+                    dropped.append((index_name, index_def))
+        except Exception:
+            if dropped:
+                self.post_migration_sql(table_name, dropped)
+            raise
+        finally:
+            conn.close()
+
+        return dropped
+
+    @staticmethod
+    def _save_index_defs(table_name: str, indexes: List[Tuple[str, str]]) -> Path:
+        """Write index definitions to a SQL file that restores them if run."""
+        INDEX_BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+        path = INDEX_BACKUP_DIR / f"{table_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.sql"
+        path.write_text(''.join(f"{index_def};\n" for _, index_def in indexes))
+        return path
+
+    def post_migration_sql(self, table_name: str, indexes: List[Tuple[str, str]]):
+        """Recreate indexes dropped by pre_migration_sql.
+
+        Each index is built in its own statement, so one failure doesn't stop
+        the rest. A failed CREATE INDEX CONCURRENTLY can leave an INVALID
+        index behind, so indisvalid is checked afterwards and invalid indexes
+        are dropped and built once more. Indexes that still fail are reported
+        with their DDL. Never raises.
+        """
+        if not indexes:
+            return
+
+        failed = {}
+        try:
+            conn = psycopg2.connect(self.pg_db_url)
+        except Exception as e:
+            failed = {index_name: (index_def, e) for index_name, index_def in indexes}
+        else:
+            conn.autocommit = True
+            try:
+                with conn.cursor() as cursor:
+                    for index_name, index_def in indexes:
+                        try:
+                            self._create_index(cursor, index_def)
+                        except Exception as e:
+                            failed[index_name] = (index_def, e)
+
+                    # Retry whatever was left invalid (or failed) once, from scratch
+                    for index_name, index_def in indexes:
+                        if self._index_valid(cursor, index_name):
+                            failed.pop(index_name, None)
+                            continue
+                        try:
+                            cursor.execute(
+                                sql.SQL("DROP INDEX CONCURRENTLY IF EXISTS {}").format(
+                                    sql.Identifier('public', index_name)
+                                )
+                            )
+                            self._create_index(cursor, index_def)
+                        except Exception as e:
+                            failed[index_name] = (index_def, e)
+                            continue
+                        if self._index_valid(cursor, index_name):
+                            failed.pop(index_name, None)
+                        else:
+                            failed[index_name] = (index_def, "index is INVALID after rebuild")
+            except Exception as e:
+                for index_name, index_def in indexes:
+                    if index_name not in failed:
+                        failed[index_name] = (index_def, e)
+            finally:
+                conn.close()
+
+        rebuilt = len(indexes) - len(failed)
+        if rebuilt:
+            print(f"  ✓ Rebuilt {rebuilt} secondary indexes on {table_name}")
+        for index_name, (index_def, error) in failed.items():
+            print(f"  ✗ Failed to rebuild index {index_name} on {table_name}: {error}")
+            print(f"      Run manually: {index_def};")
+
+    @staticmethod
+    def _create_index(cursor, index_def: str):
+        """Run a pg_indexes definition as CREATE INDEX CONCURRENTLY."""
+        cursor.execute(index_def.replace(" INDEX ", " INDEX CONCURRENTLY ", 1))
+
+    @staticmethod
+    def _index_valid(cursor, index_name: str) -> bool:
+        """Return True if the public index exists and is valid."""
+        cursor.execute(
+            """
+            SELECT i.indisvalid
+            FROM pg_index i
+            WHERE i.indexrelid = to_regclass(format('%%I.%%I', 'public', %s))
+            """,
+            (index_name,)
+        )
+        row = cursor.fetchone()
+        return bool(row and row[0])
+
+    def import_table_to_supabase(
+        self,
+        table_name: str,
+        batches: Iterable[List[Dict[str, Any]]]
+    ) -> Tuple[int, int, int]:
+        """Import batches of rows into a Supabase table through the REST API.
+
+        Args:
+            table_name: Name of table to import into
+            batches: Iterable of row-dictionary batches (e.g. from iter_table_batches)
+
+        Returns:
+            Tuple of (exported_count, successful_count, error_count)
+        """
+        exported = 0
+        successful = 0
+        errors = 0
+
+        # Coalesce batches into payloads up to the PostgREST body limit so
+        # each request (and its commit) covers as many rows as possible
+        payload: List[Dict[str, Any]] = []
+        payload_bytes = 0
+        request_number = 0
+
+        for batch in batches:
+            exported += len(batch)
+            batch_bytes = len(json.dumps(batch, default=str))
+
+            if payload and payload_bytes + batch_bytes > REST_MAX_PAYLOAD_BYTES:
+                request_number += 1
+                batch_successful, batch_errors = self._insert_batch(table_name, payload, request_number)
+                successful += batch_successful
+                errors += batch_errors
+                payload = []
+                payload_bytes = 0
+
+            payload.extend(batch)
+            payload_bytes += batch_bytes
+
+        if payload:
+            request_number += 1
+            batch_successful, batch_errors = self._insert_batch(table_name, payload, request_number)
+            successful += batch_successful
+            errors += batch_errors
+
+        return exported, successful, errors
+
     def verify_table(self, table_name: str, expected_count: int) -> bool:
         """Verify table migration was successful.
 
@@ -149,7 +896,7 @@ class DataMigrator:
         Returns:
             True if verification passed
         """
-        result = self.supabase_client.table(table_name).select('*', count='exact').execute()
+        result = self._tables[table_name].select('*', count='exact', head=True).execute()
         actual_count = result.count if result.count is not None else 0
 
         if actual_count == expected_count:
@@ -173,12 +920,32 @@ class DataMigrator:
         print(f"Migrating table: {table_name}")
         print(f"{'='*60}")
 
-        # Export from SQLite
-        print("Exporting from SQLite...")
-        data = self.export_table_from_sqlite(table_name)
-        print(f"  ✓ Exported {len(data)} rows")
+        # Stream rows from SQLite straight into Supabase, one batch at a time.
+        # The direct PostgreSQL path (COPY / execute_values) carries rows as
+        # tuples; the REST fallback needs dicts for its JSON payloads.
+        print("Exporting from SQLite and importing to Supabase...")
+        if self.pg_db_url:
+            columns, _ = self._schema(table_name)
+            dropped_indexes = (
+                self.pre_migration_sql(table_name) if table_name in INDEX_REBUILD_TABLES else []
+            )
+            try:
+                exported, successful, errors = self._import_table_postgres(
+                    table_name, columns, prefetch(self.iter_table_tuples(table_name, columns))
+                )
+            finally:
+                self.post_migration_sql(table_name, dropped_indexes)
+        else:
+            exported, successful, errors = self.import_table_to_supabase(
+                table_name, prefetch(self.iter_table_batches(table_name))
+            )
+        return self._finish_table(table_name, exported, successful, errors)
 
-        if len(data) == 0:
+    def _finish_table(self, table_name: str, exported: int, successful: int, errors: int) -> Dict[str, Any]:
+        """Report a table's load results, verify it, and build its statistics."""
+        print(f"  ✓ Exported {exported} rows ({table_name})")
+
+        if exported == 0:
             print("  → Table is empty, skipping")
             return {
                 'table': table_name,
@@ -188,18 +955,20 @@ class DataMigrator:
                 'verified': True
             }
 
-        # Import to Supabase
-        print("Importing to Supabase...")
-        successful, errors = self.import_table_to_supabase(table_name, data)
         print(f"  ✓ Imported {successful} rows ({errors} errors)")
 
-        # Verify
-        print("Verifying...")
-        verified = self.verify_table(table_name, len(data))
+        # Verify. On the psycopg2 path the load is transactional and idempotent,
+        # so a clean commit of every exported row already proves the count.
+        if self.pg_db_url and not self.strict:
+            verified = successful == exported
+            print(f"  {'✓' if verified else '✗'} Verified by commit: {successful}/{exported} rows")
+        else:
+            print("Verifying...")
+            verified = self.verify_table(table_name, exported)
 
         return {
             'table': table_name,
-            'exported': len(data),
+            'exported': exported,
             'imported': successful,
             'errors': errors,
             'verified': verified
@@ -224,16 +993,44 @@ class DataMigrator:
 
         self.stats['start_time'] = datetime.now()
 
-        # Migrate each table in order
-        for table_name, primary_key in MIGRATION_ORDER:
+        # Read every table's column list and row count up front
+        selected_tables = [
+            table_name for table_name, _ in MIGRATION_ORDER
+            if not tables_filter or table_name in tables_filter
+        ]
+        self.load_schemas(selected_tables)
+        row_counts = self.count_sqlite_rows(selected_tables)
+
+        # With deferrable FKs, load everything in one transaction regardless of tiers
+        if self.pg_db_url and self.fk_constraints_deferrable():
+            print("FK constraints are deferrable: loading all tables in one transaction")
+            ordered = sorted(selected_tables, key=lambda table_name: row_counts[table_name], reverse=True)
+            for table_stats in self.migrate_tables_deferred(ordered):
+                self._record_table_stats(table_stats)
+            tiers = []
+        else:
+            tiers = MIGRATION_TIERS
+
+        # Migrate tier by tier; tables within a tier run concurrently
+        for tier in tiers:
             # Skip if filtering and table not in filter
-            if tables_filter and table_name not in tables_filter:
+            tier = [
+                (table_name, primary_key) for table_name, primary_key in tier
+                if not tables_filter or table_name in tables_filter
+            ]
+            if not tier:
                 continue
 
-            table_stats = self.migrate_table(table_name, primary_key)
-            self.stats['tables'][table_name] = table_stats
-            self.stats['total_rows'] += table_stats['imported']
-            self.stats['total_errors'] += table_stats['errors']
+            # Largest tables first so the longest load never starts last
+            tier.sort(key=lambda table: row_counts[table[0]], reverse=True)
+
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tier))) as executor:
+                futures = {
+                    executor.submit(self.migrate_table, table_name, primary_key): table_name
+                    for table_name, primary_key in tier
+                }
+                for future in as_completed(futures):
+                    self._record_table_stats(future.result())
 
         self.stats['end_time'] = datetime.now()
 
@@ -242,6 +1039,13 @@ class DataMigrator:
 
         return self.stats
 
+    def _record_table_stats(self, table_stats: Dict[str, Any]):
+        """Record per-table statistics (safe to call from worker threads)."""
+        with self._stats_lock:
+            self.stats['tables'][table_stats['table']] = table_stats
+            self.stats['total_rows'] += table_stats['imported']
+            self.stats['total_errors'] += table_stats['errors']
+
     def print_summary(self):
         """Print migration summary."""
         duration = (self.stats['end_time'] - self.stats['start_time']).total_seconds()
@@ -294,6 +1098,17 @@ def main():
         action="store_true",
         help="Export data but don't import (for testing)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_WORKERS,
+        help=f"Maximum tables migrated concurrently per tier (default: {MAX_WORKERS})"
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Always verify row counts with COUNT(*) on Supabase (slower on large tables)"
+    )
     parser.add_argument(
         "--tables",
         nargs='+',
@@ -309,15 +1124,15 @@ def main():
         return 1
 
     # Create migrator
-    migrator = DataMigrator(sqlite_db_path=args.db)
+    migrator = DataMigrator(sqlite_db_path=args.db, max_workers=args.workers, strict=args.strict)
 
     if args.dry_run:
         print("\n=== DRY RUN MODE ===")
         print("Exporting data from SQLite (will not import to Supabase)")
 
         for table_name, _ in MIGRATION_ORDER:
-            data = migrator.export_table_from_sqlite(table_name)
-            print(f"{table_name}: {len(data)} rows")
+            row_count = sum(len(batch) for batch in migrator.iter_table_batches(table_name))
+            print(f"{table_name}: {row_count} rows")
 
         return 0
 
@@ -9,7 +9,9 @@ Requirements:
     - For manual execution: Use Supabase SQL Editor in dashboard
 """
 import os
+import re
 import sys
+from typing import List
 from dotenv import load_dotenv
 from supabase_client import get_supabase_client
 
@@ -23,6 +25,79 @@ try:
 except ImportError:
     HAS_PSYCOPG2 = False
 
+# Opening tag of a dollar-quoted string: $$ or $tag$
+DOLLAR_QUOTE_RE = re.compile(r"\$([A-Za-z_][A-Za-z0-9_]*)?\$")
+
+
+def split_sql_statements(sql: str) -> List[str]:
+    """
+    Split a SQL script into individual statements.
+
+    Unlike sql.split(';'), semicolons inside quoted strings, dollar-quoted
+    bodies ($$...$$, $tag$...$tag$) and comments do not end a statement.
+    Chunks containing only comments/whitespace are dropped.
+    """
+    statements = []
+    start = 0
+    has_code = False
+    i = 0
+    n = len(sql)
+
+    while i < n:
+        ch = sql[i]
+
+        if sql.startswith('--', i):
+            end = sql.find('\n', i)
+            i = n if end == -1 else end + 1
+            continue
+
+        if sql.startswith('/*', i):
+            end = sql.find('*/', i + 2)
+            i = n if end == -1 else end + 2
+            continue
+
+        if ch in ("'", '"'):
+            # Quotes are escaped by doubling them
+            j = i + 1
+            while True:
+                j = sql.find(ch, j)
+                if j == -1:
+                    j = n
+                    break
+                if sql.startswith(ch * 2, j):
+                    j += 2
+                    continue
+                j += 1
+                break
+            i = j
+            has_code = True
+            continue
+
+        if ch == '$':
+            match = DOLLAR_QUOTE_RE.match(sql, i)
+            if match:
+                tag = match.group(0)
+                end = sql.find(tag, match.end())
+                i = n if end == -1 else end + len(tag)
+                has_code = True
+                continue
+
+        if ch == ';':
+            if has_code:
+                statements.append(sql[start:i].strip())
+            start = i + 1
+            has_code = False
+        elif not ch.isspace():
+            has_code = True
+
+        i += 1
+
+    if has_code:
+        statements.append(sql[start:].strip())
+
+    return statements
+
+
 def read_schema_file(filename: str = "schema_postgres.sql") -> str:
     """Read the PostgreSQL schema file."""
     with open(filename, 'r') as f:
@@ -44,13 +119,27 @@ def execute_schema_direct(schema_sql: str) -> bool:
         print("  Add to .env: SUPABASE_DB_URL=postgresql://...")
         return False
 
+    statements = split_sql_statements(schema_sql)
+
     try:
         print("\nConnecting to Supabase database...")
         conn = psycopg2.connect(db_url)
         cursor = conn.cursor()
 
         print("Executing schema SQL...")
-        cursor.execute(schema_sql)
+        for number, statement in enumerate(statements, start=1):
+            try:
+                cursor.execute(statement)
+            except Exception as e:
+                conn.rollback()
+                first_line = next(
+                    (line for line in statement.splitlines() if not line.lstrip().startswith('--')),
+                    statement
+                ).strip()
+                print(f"✗ Error in statement {number}/{len(statements)} ({first_line}): {e}")
+                cursor.close()
+                conn.close()
+                return False
 
         conn.commit()
         cursor.close()
@@ -76,7 +165,7 @@ def execute_schema(schema_sql: str, auto: bool = True) -> bool:
         bool: True if executed successfully, False otherwise
     """
     # Split the schema into individual statements for counting
-    statements = [s.strip() for s in schema_sql.split(';') if s.strip() and not s.strip().startswith('--')]
+    statements = split_sql_statements(schema_sql)
     print(f"Found {len(statements)} SQL statements to execute\n")
 
     # Try automatic execution if requested and available
@@ -3,6 +3,42 @@
 
 import sqlite3
 from supabase_client import get_supabase_client
+from migrate_data import open_sqlite_readonly
+
+
+def fetch_all_rows(supabase, table: str, columns: str, order_by: str, page_size: int = 1000) -> list:
+    """Fetch every row of a Supabase table, paging with .range().
+
+    Pages are ordered by `order_by`, which must be a unique key, so they
+    neither overlap nor skip rows. Paging stops on an empty page rather than
+    a short one, as the server's max-rows setting may cap pages below
+    `page_size`.
+    """
+    rows = []
+    start = 0
+    while True:
+        result = (
+            supabase.table(table).select(columns).order(order_by)
+            .range(start, start + page_size - 1).execute()
+        )
+        if not result.data:
+            return rows
+        rows.extend(result.data)
+        start += len(result.data)
+
+
+def fetch_id_set(supabase, table: str, column: str) -> set:
+    """Fetch all values of a key column from a Supabase table as a set."""
+    return {row[column] for row in fetch_all_rows(supabase, table, column, order_by=column)}
+
+
+def fetch_existing_ids(supabase, table: str, column: str, values) -> set:
+    """Return which of `values` exist in a table's key column (one in.() query)."""
+    values = list(values)
+    if not values:
+        return set()
+    result = supabase.table(table).select(column).in_(column, values).execute()
+    return {row[column] for row in result.data}
 
 
 def verify_migration():
@@ -11,8 +47,8 @@ def verify_migration():
     print("VERIFYING DATA MIGRATION")
     print("="*60)
 
-    # Connect to both databases
-    sqlite_conn = sqlite3.connect("data/posts_v2.db")
+    # Connect to both databases (one SQLite connection for the whole run)
+    sqlite_conn = open_sqlite_readonly("data/posts_v2.db")
     supabase = get_supabase_client()
 
     tables_to_verify = [
@@ -29,14 +65,17 @@ def verify_migration():
 
     all_passed = True
 
+    # Count rows in SQLite for every table in a single statement
+    counts_sql = " UNION ALL ".join(
+        f"SELECT '{table}', COUNT(*) FROM {table}" for table in tables_to_verify
+    )
+    sqlite_counts = dict(sqlite_conn.execute(counts_sql).fetchall())
+
     for table in tables_to_verify:
-        # Count rows in SQLite
-        cursor = sqlite_conn.cursor()
-        cursor.execute(f"SELECT COUNT(*) FROM {table}")
-        sqlite_count = cursor.fetchone()[0]
+        sqlite_count = sqlite_counts[table]
 
         # Count rows in Supabase
-        result = supabase.table(table).select('*', count='exact').execute()
+        result = supabase.table(table).select('*', count='exact', head=True).execute()
         supabase_count = result.count if result.count is not None else 0
 
         # Compare
@@ -46,8 +85,6 @@ def verify_migration():
 
         print(f"{status} {table:<20} SQLite: {sqlite_count:<6} Supabase: {supabase_count:<6}")
 
-    sqlite_conn.close()
-
     print()
     print("="*60)
 
@@ -66,21 +103,20 @@ def verify_migration():
     # Check foreign key relationships
     print("\n1. Checking foreign key relationships...")
 
-    # Check profile_tags references
-    result = supabase.table('profile_tags').select('profile_id, tag_id').execute()
-    profile_tags = result.data
+    # Check profile_tags references (anti-join against the referenced key sets)
+    profile_tags = fetch_all_rows(supabase, 'profile_tags', 'profile_id, tag_id', order_by='profile_tag_id')
+    profile_ids = fetch_id_set(supabase, 'profiles', 'profile_id')
+    tag_ids = fetch_id_set(supabase, 'tags', 'tag_id')
 
     orphaned = 0
     for pt in profile_tags:
         # Check profile exists
-        p_result = supabase.table('profiles').select('profile_id').eq('profile_id', pt['profile_id']).execute()
-        if not p_result.data:
+        if pt['profile_id'] not in profile_ids:
             orphaned += 1
             print(f"  ✗ Orphaned profile_tag: profile {pt['profile_id']} doesn't exist")
 
         # Check tag exists
-        t_result = supabase.table('tags').select('tag_id').eq('tag_id', pt['tag_id']).execute()
-        if not t_result.data:
+        if pt['tag_id'] not in tag_ids:
             orphaned += 1
             print(f"  ✗ Orphaned profile_tag: tag {pt['tag_id']} doesn't exist")
 
@@ -91,18 +127,13 @@ def verify_migration():
     print("\n2. Checking data_downloads foreign keys...")
     result = supabase.table('data_downloads').select('post_id, run_id').limit(100).execute()
     downloads = result.data
+    post_ids = fetch_existing_ids(supabase, 'posts', 'post_id', {dl['post_id'] for dl in downloads})
+    run_ids = fetch_existing_ids(supabase, 'download_runs', 'run_id', {dl['run_id'] for dl in downloads})
 
-    orphaned_downloads = 0
-    for dl in downloads:
-        # Check post exists
-        p_result = supabase.table('posts').select('post_id').eq('post_id', dl['post_id']).execute()
-        if not p_result.data:
-            orphaned_downloads += 1
-
-        # Check run exists
-        r_result = supabase.table('download_runs').select('run_id').eq('run_id', dl['run_id']).execute()
-        if not r_result.data:
-            orphaned_downloads += 1
+    orphaned_downloads = sum(
+        (dl['post_id'] not in post_ids) + (dl['run_id'] not in run_ids)
+        for dl in downloads
+    )
 
     if orphaned_downloads == 0:
         print(f"  ✓ Checked {len(downloads)} data_downloads - all have valid foreign keys")
@@ -113,9 +144,8 @@ def verify_migration():
     print("\n3. Checking sample data integrity...")
 
     # Get a random post from SQLite
-    sqlite_conn = sqlite3.connect("data/posts_v2.db")
-    sqlite_conn.row_factory = sqlite3.Row
     cursor = sqlite_conn.cursor()
+    cursor.row_factory = sqlite3.Row
     cursor.execute("SELECT * FROM posts LIMIT 1")
     sqlite_post = dict(cursor.fetchone())
 
@@ -6,93 +6,187 @@ This script:
 1. Finds all posts that have media in their raw_json
 2. Checks if media records already exist
 3. Downloads and caches missing media
-4. Creates post_media records
+4. Creates post_media records (one bulk insert per batch)
 
 Usage:
     python backfill_media.py                    # Process all posts
     python backfill_media.py --limit 10         # Process first 10 posts
     python backfill_media.py --start-date 2025-11-01  # Posts since date
     python backfill_media.py --dry-run          # Show what would be done
-    python backfill_media.py --sleep-min 1 --sleep-max 3  # Custom sleep to avoid rate limits
+    python backfill_media.py --rpm 120          # Cap media downloads per minute
 """
 
 import argparse
 import json
 import logging
+import logging.handlers
+import math
+import threading
 import time
-import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from typing import List, Dict
+from itertools import batched, islice
+from typing import Dict, Iterator, List
 
 from supabase_client import get_supabase_client
-from manage_data import extract_and_store_media
-
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
+from manage_data import extract_media_rows, get_media_urls, store_media_rows
+
+# Use orjson for the raw_json fallback parse if available (several times faster)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Setup logging: records are buffered and written in batches (at the end
+# of each backfill batch, when the buffer fills, or at once on errors)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+log_buffer = logging.handlers.MemoryHandler(
+    capacity=1024,
+    flushLevel=logging.ERROR,
+    target=_stream_handler
 )
+logging.basicConfig(level=logging.INFO, handlers=[log_buffer])
 logger = logging.getLogger(__name__)
 
 
-def get_posts_needing_media(client, limit: int = None, start_date: str = None) -> List[Dict]:
+def positive_float(value: str) -> float:
+    """argparse type for options that must be a finite number greater than zero."""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: {value!r}")
+    if not (number > 0 and math.isfinite(number)):
+        raise argparse.ArgumentTypeError(f"must be a finite number greater than 0, got {value}")
+    return number
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by all backfill workers.
+
+    Tokens refill continuously at `rpm` per minute, with up to one second's
+    worth banked for bursts, so workers only wait when they would exceed the
+    rate instead of sleeping after every post.
+    """
+
+    def __init__(self, rpm: float):
+        if rpm <= 0:
+            raise ValueError(f"rpm must be positive, got {rpm}")
+        self.rate = rpm / 60.0
+        self.capacity = max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1):
+        """
+        Take `tokens` from the bucket, blocking until they are available.
+
+        Args:
+            tokens: Number of requests about to be made
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # Reserve the tokens now; a negative balance is time still owed
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+def get_posts_needing_media(
+    client,
+    limit: int = None,
+    start_date: str = None,
+    page_size: int = 500
+) -> Iterator[Dict]:
     """
-    Get posts that have media in raw_json but no media records.
+    Stream posts that have media in raw_json but no media records.
+
+    Posts are fetched a page at a time with keyset pagination on
+    (first_seen_at, post_id), newest first, so memory stays bounded and
+    processing can start before the whole result set is read. Posts with no
+    first_seen_at come last and are paged by post_id.
 
     Args:
         client: Supabase client
         limit: Optional limit on number of posts to return
         start_date: Optional start date filter (YYYY-MM-DD)
+        page_size: Number of posts fetched per request
 
-    Returns:
-        List of post dictionaries
+    Yields:
+        Post dictionaries
     """
     logger.info("Querying posts that need media extraction...")
 
-    # Build query
-    query = client.table('posts').select('post_id, raw_json, first_seen_at')
-
-    # Add date filter if specified
-    if start_date:
-        query = query.gte('first_seen_at', f"{start_date}T00:00:00Z")
+    after = None
+    remaining = limit
+    found = 0
+
+    while remaining is None or remaining > 0:
+        page_limit = page_size if remaining is None else min(page_size, remaining)
+
+        # Single anti-join in Postgres: posts with media and no post_media rows
+        # (see supabase/migrations/*_paginate_posts_needing_media.sql)
+        result = client.rpc('posts_needing_media', {
+            'start_date': f"{start_date}T00:00:00Z" if start_date else None,
+            'lim': page_limit,
+            'after_first_seen_at': after[0] if after else None,
+            'after_post_id': after[1] if after else None
+        }).execute()
+        page = result.data
+
+        # raw_json comes back as parsed JSON; parse only if a string slipped through.
+        # Media filtering already happened in Postgres, so this loop does no real
+        # CPU work per page and stays in-process (a process pool would spend more
+        # pickling 500 parsed posts back than it could save).
+        for post in page:
+            try:
+                raw_data = post['raw_json']
+                if isinstance(raw_data, (str, bytes)):
+                    raw_data = json_loads(raw_data)
+            except Exception as e:
+                logger.error(f"Error checking post {post['post_id']}: {e}")
+                continue
 
-    # Order by newest first
-    query = query.order('first_seen_at', desc=True)
+            found += 1
+            yield {
+                'post_id': post['post_id'],
+                'raw_data': raw_data,
+                'first_seen_at': post.get('first_seen_at')
+            }
 
-    # Add limit if specified
-    if limit:
-        query = query.limit(limit)
+        if len(page) < page_limit:
+            break
 
-    result = query.execute()
-    posts = result.data
+        after = (page[-1]['first_seen_at'], page[-1]['post_id'])
+        if remaining is not None:
+            remaining -= len(page)
 
-    logger.info(f"Found {len(posts)} posts to check")
+    logger.info(f"Found {found} posts needing media extraction")
 
-    # Filter to posts that have media in raw_json
-    posts_with_media = []
-    for post in posts:
-        try:
-            raw_data = json.loads(post['raw_json'])
-            media = raw_data.get('media', {})
 
-            if media and media.get('type'):
-                # Check if media records already exist
-                existing = client.table('post_media').select('media_id').eq(
-                    'post_id', post['post_id']
-                ).execute()
+def process_post(client, post: Dict, limiter: RateLimiter) -> Dict:
+    """
+    Download media and build post_media rows for one post (runs on a worker thread).
 
-                if not existing.data:
-                    posts_with_media.append({
-                        'post_id': post['post_id'],
-                        'raw_data': raw_data,
-                        'first_seen_at': post.get('first_seen_at')
-                    })
-        except Exception as e:
-            logger.error(f"Error checking post {post['post_id']}: {e}")
-            continue
+    Args:
+        client: Supabase client
+        post: Post dictionary from get_posts_needing_media
+        limiter: Rate limiter shared by all workers
 
-    logger.info(f"Found {len(posts_with_media)} posts needing media extraction")
-    return posts_with_media
+    Returns:
+        Media extraction statistics from extract_media_rows (rows not yet stored)
+    """
+    # One token per media download this post will make
+    limiter.acquire(max(1, len(get_media_urls(post['raw_data']))))
+    # Candidates have no post_media rows, so skip the existence lookup
+    return extract_media_rows(client, post['post_id'], post['raw_data'], skip_existing=False)
 
 
 def backfill_media(
@@ -100,8 +194,8 @@ def backfill_media(
     limit: int = None,
     start_date: str = None,
     batch_size: int = 10,
-    sleep_min: float = 0.5,
-    sleep_max: float = 2.0
+    rpm: float = 600,
+    concurrency: int = 16
 ) -> Dict:
     """
     Backfill media for existing posts.
@@ -111,8 +205,8 @@ def backfill_media(
         limit: Optional limit on number of posts to process
         start_date: Optional start date filter (YYYY-MM-DD)
         batch_size: Number of posts to process in each batch
-        sleep_min: Minimum sleep time between posts (seconds)
-        sleep_max: Maximum sleep time between posts (seconds)
+        rpm: Maximum media downloads per minute across all workers
+        concurrency: Number of posts processed in parallel
 
     Returns:
         Dictionary with backfill statistics
@@ -129,21 +223,26 @@ def backfill_media(
         'posts_failed': 0
     }
 
-    # Get posts needing media extraction
+    # Stream posts needing media extraction
     posts = get_posts_needing_media(client, limit=limit, start_date=start_date)
-    stats['posts_checked'] = limit or len(posts)
-    stats['posts_with_media'] = len(posts)
-
-    if not posts:
-        logger.info("No posts need media extraction")
-        return stats
 
     if dry_run:
+        preview = list(islice(posts, 10))
+        total = len(preview) + sum(1 for _ in posts)
+        stats['posts_checked'] = limit or total
+        stats['posts_with_media'] = total
+
+        if not total:
+            logger.info("No posts need media extraction")
+            log_buffer.flush()
+            return stats
+
+        log_buffer.flush()
         print("\n" + "=" * 70)
         print("DRY RUN - No changes will be made")
         print("=" * 70)
-        print(f"\nWould process {len(posts)} posts:")
-        for i, post in enumerate(posts[:10], 1):
+        print(f"\nWould process {total} posts:")
+        for i, post in enumerate(preview, 1):
             raw_data = post['raw_data']
             media = raw_data.get('media', {})
             media_type = media.get('type', 'unknown')
@@ -158,59 +257,94 @@ def backfill_media(
 
             print(f"  {i}. {post['post_id']} - {media_type} ({count} item(s))")
 
-        if len(posts) > 10:
-            print(f"  ... and {len(posts) - 10} more")
+        if total > 10:
+            print(f"  ... and {total - 10} more")
 
         return stats
 
     # Process posts in batches
-    print("\n" + "=" * 70)
-    print("Backfilling Media")
-    print("=" * 70)
-    print(f"Processing {len(posts)} posts in batches of {batch_size}...")
-    print()
-
-    for i in range(0, len(posts), batch_size):
-        batch = posts[i:i + batch_size]
-        batch_num = (i // batch_size) + 1
-        total_batches = (len(posts) + batch_size - 1) // batch_size
-
-        print(f"\nBatch {batch_num}/{total_batches} ({len(batch)} posts)")
-        print("-" * 70)
-
-        for post in batch:
-            post_id = post['post_id']
-            raw_data = post['raw_data']
+    logger.info(f"Backfilling media: processing posts in batches of {batch_size}...")
 
-            try:
-                # Extract and store media
-                media_stats = extract_and_store_media(client, post_id, raw_data)
+    limiter = RateLimiter(rpm)
 
-                stats['posts_processed'] += 1
-                stats['media_total'] += media_stats['media_count']
-                stats['media_cached'] += media_stats['media_cached']
-                stats['media_errors'] += media_stats['media_errors']
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for batch_num, batch in enumerate(batched(posts, batch_size), 1):
+            stats['posts_with_media'] += len(batch)
 
-                if media_stats['media_cached'] > 0:
-                    print(f"  ✓ {post_id}: Cached {media_stats['media_cached']}/{media_stats['media_count']} media")
-                elif media_stats['media_count'] > 0:
-                    print(f"  ✗ {post_id}: Failed to cache media")
-                else:
-                    print(f"  - {post_id}: No media found")
+            logger.info(f"Batch {batch_num} ({len(batch)} posts)")
 
-            except Exception as e:
-                logger.error(f"Error processing post {post_id}: {e}")
-                stats['posts_failed'] += 1
-                print(f"  ✗ {post_id}: Error - {e}")
+            # Rows from the whole batch are stored with one upsert below
+            pending_rows = []
+
+            # Media downloads are I/O-bound, so posts in a batch run concurrently
+            future_to_post_id = {
+                executor.submit(process_post, client, post, limiter): post['post_id']
+                for post in batch
+            }
+
+            for future in as_completed(future_to_post_id):
+                post_id = future_to_post_id[future]
+
+                try:
+                    media_stats = future.result()
+                    pending_rows.extend(media_stats['rows'])
+
+                    stats['posts_processed'] += 1
+                    stats['media_total'] += media_stats['media_count']
+                    stats['media_cached'] += media_stats['media_cached']
+                    stats['media_errors'] += media_stats['media_errors']
+
+                    if media_stats['media_cached'] > 0:
+                        logger.info(f"  ✓ {post_id}: Cached {media_stats['media_cached']}/{media_stats['media_count']} media")
+                    elif media_stats['media_count'] > 0:
+                        logger.info(f"  ✗ {post_id}: Failed to cache media")
+                    else:
+                        logger.info(f"  - {post_id}: No media found")
+
+                except Exception as e:
+                    logger.error(f"  ✗ {post_id}: Error processing post - {e}")
+                    stats['posts_failed'] += 1
+
+            if flush_media_rows(client, pending_rows):
+                if pending_rows:
+                    logger.info(f"  → Stored {len(pending_rows)} media records")
+            else:
+                stats['media_cached'] -= len(pending_rows)
+                stats['media_errors'] += len(pending_rows)
+
+            # Write this batch's progress in one go
+            log_buffer.flush()
 
-            # Sleep between posts to avoid rate limiting
-            if sleep_min > 0 and post != batch[-1]:  # Don't sleep after last post in batch
-                sleep_time = random.uniform(sleep_min, sleep_max)
-                time.sleep(sleep_time)
+    stats['posts_checked'] = limit or stats['posts_with_media']
+    if not stats['posts_with_media']:
+        logger.info("No posts need media extraction")
 
+    log_buffer.flush()
     return stats
 
 
+def flush_media_rows(client, rows: List[Dict]) -> bool:
+    """
+    Store buffered post_media rows with a single insert (duplicates ignored).
+
+    Args:
+        client: Supabase client
+        rows: post_media rows built by extract_media_rows
+
+    Returns:
+        True if the rows were stored, False otherwise
+    """
+    if not rows:
+        return True
+
+    try:
+        store_media_rows(client, rows)
+        return True
+    except Exception as e:
+        logger.error(f"Error storing {len(rows)} media records: {e}")
+        return False
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -223,7 +357,8 @@ Examples:
   python backfill_media.py --start-date 2025-11-01  # Posts since date
   python backfill_media.py --dry-run                # Show what would be done
   python backfill_media.py --batch-size 5           # Process 5 posts at a time
-  python backfill_media.py --sleep-min 1 --sleep-max 3  # Custom sleep range
+  python backfill_media.py --rpm 120                # Cap media downloads per minute
+  python backfill_media.py --concurrency 4          # Process 4 posts in parallel
         """
     )
 
@@ -248,16 +383,17 @@ Examples:
         help='Number of posts to process in each batch (default: 10)'
     )
     parser.add_argument(
-        '--sleep-min',
-        type=float,
-        default=0.5,
-        help='Minimum sleep time between posts in seconds (default: 0.5)'
+        '--rpm',
+        type=positive_float,
+        default=600,
+        help='Maximum media downloads per minute across all workers (default: 600)'
     )
+
     parser.add_argument(
-        '--sleep-max',
-        type=float,
-        default=2.0,
-        help='Maximum sleep time between posts in seconds (default: 2.0)'
+        '--concurrency',
+        type=int,
+        default=16,
+        help='Number of posts to process in parallel (default: 16)'
     )
 
     args = parser.parse_args()
@@ -268,8 +404,8 @@ Examples:
             limit=args.limit,
             start_date=args.start_date,
             batch_size=args.batch_size,
-            sleep_min=args.sleep_min,
-            sleep_max=args.sleep_max
+            rpm=args.rpm,
+            concurrency=args.concurrency
         )
 
         # Print summary
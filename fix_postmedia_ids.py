@@ -5,7 +5,7 @@ Fix PostMedia IDs from pm- prefix to med- prefix for consistency.
 This script:
 1. Finds all post_media records with pm- prefix
 2. Generates new med- prefix IDs
-3. Updates the records in the database
+3. Updates the records in the database (one rename_media_ids RPC per chunk)
 
 Usage:
     python fix_postmedia_ids.py           # Dry run (shows what would be changed)
@@ -13,13 +13,22 @@ Usage:
 """
 
 import argparse
-import uuid
+import os
 from supabase_client import get_supabase_client
 
+# ID pairs per rename_media_ids call (keeps request payloads small)
+RENAME_CHUNK_SIZE = 5000
 
-def generate_new_media_id():
-    """Generate a new media ID with med- prefix."""
-    return f"med-{uuid.uuid4().hex[:8]}"
+
+def generate_new_media_ids(n):
+    """
+    Generate n new media IDs with med- prefix.
+
+    Reads all the randomness in one os.urandom() call rather than one per
+    ID; each ID keeps the usual 8 hex characters (see db_utils.generate_aws_id).
+    """
+    raw = os.urandom(4 * n)
+    return [f"med-{raw[i * 4:(i + 1) * 4].hex()}" for i in range(n)]
 
 
 def find_pm_records(client):
@@ -27,25 +36,45 @@ def find_pm_records(client):
     print("Querying database for pm- prefixed records...")
 
     # Fetch all records with pm- prefix
-    result = client.table('post_media').select('*').like('media_id', 'pm-%').execute()
+    result = client.table('post_media').select('media_id, post_id, media_type').like('media_id', 'pm-%').execute()
 
     return result.data
 
 
-def update_record(client, old_id, new_id, dry_run=True):
-    """Update a single record from old_id to new_id."""
+def rename_records(client, updates, dry_run=True):
+    """
+    Rename records from old_id to new_id in chunks of RENAME_CHUNK_SIZE.
+
+    Each chunk is a single rename_media_ids RPC call (see
+    supabase/migrations/*_create_rename_media_ids_function.sql).
+
+    Returns:
+        Tuple of (records updated, records that failed)
+    """
     if dry_run:
-        print(f"  [DRY RUN] Would update: {old_id} -> {new_id}")
-        return True
+        for old_id, new_id in updates:
+            print(f"  [DRY RUN] Would update: {old_id} -> {new_id}")
+        return len(updates), 0
 
-    try:
-        # Update the record
-        client.table('post_media').update({'media_id': new_id}).eq('media_id', old_id).execute()
-        print(f"  ✓ Updated: {old_id} -> {new_id}")
-        return True
-    except Exception as e:
-        print(f"  ✗ Error updating {old_id}: {e}")
-        return False
+    success_count = 0
+    error_count = 0
+
+    for i in range(0, len(updates), RENAME_CHUNK_SIZE):
+        chunk = updates[i:i + RENAME_CHUNK_SIZE]
+        try:
+            result = client.rpc('rename_media_ids', {
+                'old_ids': [old_id for old_id, _ in chunk],
+                'new_ids': [new_id for _, new_id in chunk]
+            }).execute()
+            updated = result.data or 0
+            success_count += updated
+            error_count += len(chunk) - updated
+            print(f"  ✓ Updated {updated}/{len(chunk)} records")
+        except Exception as e:
+            error_count += len(chunk)
+            print(f"  ✗ Error updating {len(chunk)} records starting at {chunk[0][0]}: {e}")
+
+    return success_count, error_count
 
 
 def main():
@@ -103,21 +132,11 @@ Examples:
     print("=" * 70 + "\n")
 
     # Generate mapping of old IDs to new IDs
-    updates = []
-    for record in pm_records:
-        old_id = record['media_id']
-        new_id = generate_new_media_id()
-        updates.append((old_id, new_id))
+    new_ids = generate_new_media_ids(len(pm_records))
+    updates = [(record['media_id'], new_id) for record, new_id in zip(pm_records, new_ids)]
 
     # Update records
-    success_count = 0
-    error_count = 0
-
-    for old_id, new_id in updates:
-        if update_record(client, old_id, new_id, dry_run=not args.apply):
-            success_count += 1
-        else:
-            error_count += 1
+    success_count, error_count = rename_records(client, updates, dry_run=not args.apply)
 
     # Summary
     print("\n" + "=" * 70)
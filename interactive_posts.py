@@ -4,30 +4,55 @@ Interactive LinkedIn posts viewer with marking and TODO list functionality.
 Now supports Supabase database backend for deduplication and management.
 """
 
+import io
 import json
-import glob
+import os
+import pickle
 import argparse
-import base64
 import sys
 import asyncio
 import websockets
 import hashlib
+import shutil
 import subprocess
+import functools
 import logging
+import threading
+import webbrowser
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from itertools import combinations
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime, timedelta, timezone
-from supabase_client import get_supabase_client
 from textual.app import App, ComposeResult
 from textual.widgets import DataTable, Footer, Header, Static, Input, Checkbox
 from textual.containers import Container, VerticalScroll, Horizontal
 from textual.binding import Binding
 from textual.screen import Screen
-from textual import events
+from textual import events, work
+from rich.text import Text
+
+# Use orjson for parsing and pretty-printing posts if available (several times faster)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
 
 # Cache directory for downloaded images
 CACHE_DIR = Path("cache/images")
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+# Parsed legacy JSON dumps are cached here between launches
+POSTS_CACHE_DIR = Path("cache/posts")
+
+# Images of the newest posts are downloaded into the cache in the background
+# after loading, so viewing them doesn't wait on the network
+PREFETCH_IMAGE_LIMIT = 50
+PREFETCH_WORKERS = 4
+
 # Setup debug logging
 LOG_DIR = Path("log")
 LOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -43,12 +68,162 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared read-only default for missing nested post fields, so lookups like
+# (post.get("author") or _EMPTY).get(...) don't allocate a dict per miss
+_EMPTY = MappingProxyType({})
+
+# Media types that PostDetailScreen can describe / display
+_MEDIA_TYPES = frozenset(("image", "video"))
+_IMAGE_MEDIA_TYPES = frozenset(("image", "images"))
+
+# Filters that compare against a bound rather than match a substring
+_RANGE_FILTER_TYPES = frozenset(("min_date", "max_date", "min_engagements"))
+
+# Joins the posts' search texts into one corpus; never typed into a filter
+_SEARCH_SEPARATOR = b"\x1f"
+
+# Two-letter platform codes shown in the posts table
+PLATFORM_CODES = {
+    'linkedin': 'LI',
+    'substack': 'SB',
+    'youtube': 'YT',
+    'twitter': 'X',
+    'instagram': 'IG',
+    'bluesky': 'BS'
+}
+
+
+def json_serializer(obj):
+    """Handle datetime and Path serialization for json.dumps."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+
+def assemble_lines(lines: list) -> Text:
+    """
+    Join display lines into one styled Text without going through markup.
+
+    Building Text from (text, style) segments skips the markup parser, and
+    post content containing square brackets is shown verbatim.
+
+    Args:
+        lines: Lines, each a list of plain strings and (text, style) pairs
+
+    Returns:
+        Text with the lines separated by newlines
+    """
+    return Text("\n").join(Text.assemble(*line) for line in lines)
+
+
+def format_json(data) -> str:
+    """
+    Pretty-print data as JSON with 2-space indentation.
+
+    Args:
+        data: JSON-serializable data (datetimes and Paths are allowed)
+
+    Returns:
+        Indented JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=json_serializer,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode('utf-8')
+    return json.dumps(data, indent=2, default=json_serializer)
+
+
+def load_posts_file(file_path: str) -> list:
+    """
+    Load posts from a JSON dump file.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        List of posts, or an empty list if the file doesn't hold a list
+    """
+    with open(file_path, 'rb') as f:
+        data = json_loads(f.read())
+    return data if isinstance(data, list) else []
+
+
+def load_posts_dir(data_dir: str) -> list:
+    """
+    Load the posts from every JSON dump in a directory.
+
+    The parsed posts are pickled to POSTS_CACHE_DIR under a key built from
+    each file's name, size and mtime, so later launches with unchanged dumps
+    read one pickle instead of parsing every JSON file.
+
+    Args:
+        data_dir: Directory containing the JSON dump files
+
+    Returns:
+        List of posts from all files
+    """
+    # scandir's entries carry the file type from the directory read,
+    # so this avoids glob's extra stat per entry
+    try:
+        with os.scandir(data_dir) as entries:
+            json_files = sorted(
+                (entry.name, entry.path, entry.stat()) for entry in entries
+                if entry.name.endswith('.json') and not entry.name.startswith('.') and entry.is_file()
+            )
+    except FileNotFoundError:
+        return []
+    if not json_files:
+        return []
+
+    dir_key = hashlib.md5(str(Path(data_dir).resolve()).encode('utf-8'), usedforsecurity=False).hexdigest()[:12]
+    files_key = hashlib.md5(
+        repr([(name, st.st_size, st.st_mtime_ns) for name, _, st in json_files]).encode('utf-8'),
+        usedforsecurity=False
+    ).hexdigest()
+    cache_path = POSTS_CACHE_DIR / f"legacy_{dir_key}_{files_key}.pkl"
+
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable posts cache {cache_path}: {e}")
+
+    # File reads release the GIL, so load the dumps concurrently
+    posts = []
+    with ThreadPoolExecutor(max_workers=min(16, len(json_files))) as executor:
+        for file_posts in executor.map(load_posts_file, [path for _, path, _ in json_files]):
+            posts.extend(file_posts)
+
+    # Replace this directory's previous cache; a failed write only costs speed
+    try:
+        POSTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in POSTS_CACHE_DIR.glob(f"legacy_{dir_key}_*.pkl"):
+            stale.unlink(missing_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(posts, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write posts cache {cache_path}: {e}")
+
+    return posts
 
+
+@functools.lru_cache(maxsize=4096)
 def get_cached_image_path(image_url: str) -> Path:
     """
     Get the cached image path for a given URL.
     Creates a cache filename based on MD5 hash of the URL.
 
+    Results are memoized, so repeat lookups for the same image (prefetch,
+    then display) skip the hashing and URL parsing.
+
     Args:
         image_url: URL of the image
 
@@ -56,12 +231,15 @@ def get_cached_image_path(image_url: str) -> Path:
         Path to the cached image file
     """
     # Generate MD5 hash of URL
-    url_hash = hashlib.md5(image_url.encode('utf-8')).hexdigest()
+    url_hash = hashlib.md5(image_url.encode('utf-8'), usedforsecurity=False).hexdigest()
 
-    # Try to determine extension from URL
-    from urllib.parse import urlparse
-    parsed = urlparse(image_url)
-    path = parsed.path.lower()
+    # Try to determine extension from the URL path. Sliced out by hand
+    # (dropping fragment, query, scheme and host) as urlparse costs far more
+    path = image_url.split('#', 1)[0].split('?', 1)[0].lower()
+    host_start = path.find('://')
+    if host_start >= 0:
+        path_start = path.find('/', host_start + 3)
+        path = path[path_start:] if path_start >= 0 else ''
 
     # Default to jpg if we can't determine extension
     ext = '.jpg'
@@ -75,64 +253,270 @@ def get_cached_image_path(image_url: str) -> Path:
     return CACHE_DIR / f"{url_hash}{ext}"
 
 
-def download_image(image_url: str) -> bytes:
+@functools.lru_cache(maxsize=1)
+def get_image_http_client():
     """
-    Download an image from URL with proper User-Agent header.
+    Get the HTTP client shared by all image downloads in this session.
 
-    Args:
-        image_url: URL of the image
+    Keeping one client keeps connections to the image CDN alive between
+    views, so only the first image pays for DNS and the TLS handshake.
+    httpx asks for gzip/deflate and decodes the response transparently.
 
     Returns:
-        Image data as bytes
+        httpx.Client instance
     """
-    from urllib.request import Request, urlopen
+    import httpx
 
-    req = Request(
-        image_url,
+    return httpx.Client(
         headers={
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
-        }
+        },
+        timeout=10,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=4, max_keepalive_connections=4)
     )
-    with urlopen(req, timeout=10) as response:
-        return response.read()
 
 
-def get_image_data(image_url: str) -> bytes:
+def download_image(image_url: str, dest_path: Path):
+    """
+    Download an image from URL with proper User-Agent header.
+
+    The response is streamed to disk in blocks rather than read into memory,
+    and only moved into place once complete so a failed download never
+    leaves a partial file in the cache.
+
+    Args:
+        image_url: URL of the image
+        dest_path: Path to save the image to
+    """
+    # Per-thread part file, so a background prefetch and a foreground view of
+    # the same image can't write into each other's download
+    part_path = dest_path.with_name(f"{dest_path.name}.{threading.get_ident()}.part")
+    with get_image_http_client().stream('GET', image_url) as response:
+        response.raise_for_status()
+        with open(part_path, 'wb') as f:
+            for block in response.iter_bytes(65536):
+                f.write(block)
+    part_path.replace(dest_path)
+
+
+def get_image_path(image_url: str) -> Path:
     """
-    Get image data, using cache if available, otherwise download and cache.
+    Get a local path for an image, downloading it into the cache if needed.
 
     Args:
         image_url: URL or path to the image
 
     Returns:
-        Image data as bytes
+        Path to the local image file
     """
-    from urllib.parse import urlparse
-
-    parsed = urlparse(image_url)
-
-    # If it's a local file, just read it
-    if parsed.scheme not in ('http', 'https'):
-        with open(image_url, 'rb') as f:
-            return f.read()
+    # If it's a local file, use it directly
+    if not image_url.startswith(('http://', 'https://')):
+        return Path(image_url)
 
     # Check cache first
     cache_path = get_cached_image_path(image_url)
     if cache_path.exists():
         print(f"Using cached image: {cache_path.name}")
-        with open(cache_path, 'rb') as f:
-            return f.read()
+        return cache_path
 
     # Download and cache
     print(f"Downloading image...")
-    image_data = download_image(image_url)
-
-    # Save to cache
-    with open(cache_path, 'wb') as f:
-        f.write(image_data)
+    download_image(image_url, cache_path)
     print(f"Cached image: {cache_path.name}")
 
-    return image_data
+    return cache_path
+
+
+def prefetch_image(image_url: str):
+    """
+    Download an image into the cache if it isn't there yet, without output.
+
+    Runs on a background thread; failures are only logged, since the image
+    is fetched again when it is actually viewed.
+
+    Args:
+        image_url: URL of the image
+    """
+    try:
+        cache_path = get_cached_image_path(image_url)
+        if not cache_path.exists():
+            download_image(image_url, cache_path)
+    except Exception as e:
+        logger.debug(f"Image prefetch failed for {image_url}: {e}")
+
+
+def prefetch_images(image_urls: list) -> list:
+    """
+    Start downloading images into the cache in parallel, without output.
+
+    Args:
+        image_urls: URLs of the images
+
+    Returns:
+        One future per URL, done once that image is cached (or failed)
+    """
+    if not image_urls:
+        return []
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(PREFETCH_WORKERS, len(image_urls)),
+        thread_name_prefix="image-prefetch"
+    )
+    futures = [executor.submit(prefetch_image, url) for url in image_urls]
+    executor.shutdown(wait=False)
+    return futures
+
+
+def get_search_text(post: dict) -> bytes:
+    """
+    Build the lowercased text that the content filter searches for a post.
+
+    The text is kept as UTF-8 bytes so the per-keystroke substring test is
+    a plain byte search rather than the unicode-aware str search.
+
+    Args:
+        post: Post dictionary
+
+    Returns:
+        Username, author name and post text, lowercased and UTF-8 encoded
+    """
+    author = post.get("author") or _EMPTY
+    name = author.get('name') or f"{author.get('first_name') or ''} {author.get('last_name') or ''}"
+    username = post.get("author_username") or author.get('username') or ""
+    return f"{username} {name} {post.get('text') or ''}".lower().encode('utf-8')
+
+
+def get_post_image_urls(post: dict) -> list:
+    """
+    Get the URLs of a post's images.
+
+    Args:
+        post: Post dictionary
+
+    Returns:
+        List of image URLs (empty for posts without images)
+    """
+    media = post.get("media") or _EMPTY
+    media_type = media.get("type")
+    if media_type == "image":
+        url = media.get("url")
+        return [url] if url else []
+    if media_type == "images":
+        return [img["url"] for img in media.get("images", []) if img.get("url")]
+    return []
+
+
+@functools.lru_cache(maxsize=1)
+def find_icat_cmd():
+    """
+    Find a command that displays images with Kitty's icat kitten.
+
+    The result is cached, so the lookup only happens on the first image view.
+
+    Returns:
+        Command as a list (e.g. ['kitty', '+icat']), or None if not found
+    """
+    for cmd in ['kitty', 'icat', '/Applications/Kitty.app/Contents/MacOS/kitty']:
+        if shutil.which(cmd):
+            return [cmd] if cmd == 'icat' else [cmd, '+icat']
+    return None
+
+
+# Kitty graphics protocol framing, kept as bytes so chunks are joined as-is.
+# The first chunk carries the transmit-and-display header (plus any extra
+# control keys); m=1 means more chunks follow and m=0 marks the last one.
+_KITTY_HDR = b"\033_Ga=T,f=100,"
+_KITTY_MORE = b"m=1;"
+_KITTY_LAST = b"m=0;"
+_KITTY_MID = b"\033_Gm=1;"
+_KITTY_END = b"\033_Gm=0;"
+_KITTY_TERM = b"\033\\"
+
+# Delete every image placement on screen, without a reply from the terminal
+_KITTY_DELETE_ALL = "\033_Ga=d,q=2\033\\"
+
+
+def build_kitty_sequence(image_file, size: int, keys: bytes = b"") -> bytes:
+    """
+    Build the Kitty graphics protocol escape sequences that transmit and show a PNG.
+
+    The data is encoded in 3072-byte blocks, each of which becomes exactly
+    one 4096-character base64 chunk, so the image is never held in memory
+    twice.
+
+    Args:
+        image_file: Binary file object positioned at the start of the PNG data
+        size: Size of the PNG data in bytes
+        keys: Extra control keys for the first chunk, each followed by a comma
+
+    Returns:
+        The escape sequences, ready to be written in one call
+    """
+    import base64
+
+    block_size = 3072
+    num_chunks = max(1, -(-size // block_size))
+    last = num_chunks - 1
+
+    parts = []
+    for i in range(num_chunks):
+        if i == 0:
+            parts.extend((_KITTY_HDR, keys, _KITTY_LAST if i == last else _KITTY_MORE))
+        else:
+            parts.append(_KITTY_END if i == last else _KITTY_MID)
+        parts.append(base64.standard_b64encode(image_file.read(block_size)))
+        parts.append(_KITTY_TERM)
+    return b"".join(parts)
+
+
+def load_png_for_kitty(image_path: Path) -> tuple:
+    """
+    Read an image as PNG data for the Kitty graphics protocol (f=100).
+
+    Other formats (JPEG, WebP, ...) are converted with Pillow.
+
+    Args:
+        image_path: Path to the image file
+
+    Returns:
+        Tuple of (png_bytes, width, height) with the size in pixels
+    """
+    from PIL import Image
+
+    with Image.open(image_path) as img:
+        width, height = img.size
+        if img.format == 'PNG':
+            return image_path.read_bytes(), width, height
+        if img.mode not in ('RGB', 'RGBA', 'L', 'LA', 'P'):
+            img = img.convert('RGBA')
+        buf = io.BytesIO()
+        img.save(buf, format='PNG')
+        return buf.getvalue(), width, height
+
+
+def terminal_writer(app: App):
+    """
+    Return the app's driver for writing raw escape sequences, or None.
+
+    Textual has no public API for this (app.console writes to a null file),
+    and going through the driver keeps our output ordered with Textual's own
+    screen updates. The driver is private, so it is looked up defensively;
+    callers fall back to suspending the app and using icat when it is missing.
+    """
+    driver = getattr(app, '_driver', None)
+    if callable(getattr(driver, 'write', None)) and callable(getattr(driver, 'flush', None)):
+        return driver
+    return None
+
+
+def kitty_inline_supported(app: App) -> bool:
+    """Check whether images can be drawn inside the running app (Kitty terminal, real driver)."""
+    return (
+        bool(os.environ.get("KITTY_WINDOW_ID"))
+        and not app.is_headless
+        and terminal_writer(app) is not None
+    )
 
 
 def display_image_kitty_to_terminal(image_url: str):
@@ -144,44 +528,22 @@ def display_image_kitty_to_terminal(image_url: str):
         image_url: URL or path to the image
     """
     import subprocess
-    import tempfile
-    from urllib.request import urlopen
-    from urllib.parse import urlparse
 
     try:
-        # Get image data (from cache or download)
-        image_data = get_image_data(image_url)
+        # Get the image file (from cache or download)
+        image_path = get_image_path(image_url)
+        image_size = image_path.stat().st_size
 
         # Method 1: Try using icat command (most reliable for Kitty)
         try:
-            # Try different icat command variations
-            icat_cmd = None
-            for cmd in ['kitty', 'icat', '/Applications/Kitty.app/Contents/MacOS/kitty']:
-                try:
-                    result = subprocess.run([cmd, '+icat' if cmd == 'kitty' else '--version'],
-                                          capture_output=True,
-                                          timeout=1)
-                    if result.returncode == 0:
-                        icat_cmd = [cmd, '+icat'] if cmd == 'kitty' else [cmd]
-                        break
-                except (FileNotFoundError, subprocess.TimeoutExpired):
-                    continue
-
+            icat_cmd = find_icat_cmd()
             if not icat_cmd:
                 raise FileNotFoundError("icat not found")
 
-            # Save to temp file
-            with tempfile.NamedTemporaryFile(mode='wb', suffix='.jpg', delete=False) as tmp:
-                tmp.write(image_data)
-                tmp_path = tmp.name
-
-            # Display with icat
-            print(f"Image size: {len(image_data):,} bytes\n")
-            display_cmd = icat_cmd + ['--align', 'left', tmp_path]
+            # Display with icat straight from the image file
+            print(f"Image size: {image_size:,} bytes\n")
+            display_cmd = icat_cmd + ['--align', 'left', str(image_path)]
             subprocess.run(display_cmd)
-
-            # Clean up
-            Path(tmp_path).unlink()
             return
 
         except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.CalledProcessError):
@@ -189,25 +551,12 @@ def display_image_kitty_to_terminal(image_url: str):
             pass
 
         # Method 2: Use Kitty graphics protocol directly
-        print(f"Image size: {len(image_data):,} bytes")
-
-        # Encode image as base64
-        encoded = base64.standard_b64encode(image_data).decode('ascii')
-
-        # Split into chunks
-        chunk_size = 4096
-        chunks = [encoded[i:i+chunk_size] for i in range(0, len(encoded), chunk_size)]
-        print(f"Transmitting {len(chunks)} chunks...\n")
-
-        # Output Kitty graphics protocol escape sequences
-        for i, chunk in enumerate(chunks):
-            if i == 0:
-                sys.stdout.buffer.write(f"\033_Ga=T,f=100;{chunk}\033\\".encode('ascii'))
-            elif i == len(chunks) - 1:
-                sys.stdout.buffer.write(f"\033_Gm=0;{chunk}\033\\".encode('ascii'))
-            else:
-                sys.stdout.buffer.write(f"\033_Gm=1;{chunk}\033\\".encode('ascii'))
+        print(f"Image size: {image_size:,} bytes")
+        print(f"Transmitting {max(1, -(-image_size // 3072))} chunks...\n")
 
+        # Write the whole escape sequence in one call instead of one per chunk
+        with open(image_path, 'rb') as f:
+            sys.stdout.buffer.write(build_kitty_sequence(f, image_size))
         sys.stdout.buffer.flush()
         print("\n(Image should appear above if you're in Kitty terminal)")
 
@@ -228,6 +577,8 @@ class RawJsonScreen(Screen):
     def __init__(self, post_data: dict):
         super().__init__()
         self.post_data = post_data
+        # Serialize once; compose and copy both reuse the string
+        self._pretty = format_json(post_data)
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -238,13 +589,7 @@ class RawJsonScreen(Screen):
 
     def _format_json(self) -> str:
         """Format post data as pretty JSON."""
-        def json_serializer(obj):
-            """Handle datetime serialization."""
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            raise TypeError(f"Type {type(obj)} not serializable")
-
-        return json.dumps(self.post_data, indent=2, default=json_serializer)
+        return self._pretty
 
     def action_dismiss(self):
         """Return to previous screen."""
@@ -265,6 +610,131 @@ class RawJsonScreen(Screen):
             self.notify(f"Error copying to clipboard: {e}", severity="error")
 
 
+class KittyImageScreen(Screen):
+    """Screen that draws post images inline using the Kitty graphics protocol."""
+
+    BINDINGS = [
+        Binding("escape", "dismiss", "Back", priority=True),
+        Binding("n", "next_image", "Next Image"),
+        Binding("p", "previous_image", "Previous Image"),
+    ]
+
+    CSS = """
+    #image-caption {
+        height: 1;
+        padding: 0 1;
+    }
+
+    #image-area {
+        height: 1fr;
+    }
+    """
+
+    def __init__(self, image_urls: list):
+        super().__init__()
+        self.image_urls = image_urls
+        self.image_idx = 0
+        self._image = None  # (png_bytes, width, height) of the current image
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Static("", id="image-caption", markup=False)
+        yield Container(id="image-area")
+        yield Footer()
+
+    def on_mount(self):
+        """Start loading the first image."""
+        self._show_image(0)
+
+    def on_resize(self, event):
+        """Redraw the image to fit the new size."""
+        self.call_after_refresh(self._draw)
+
+    def _show_image(self, idx: int):
+        """Switch to an image, loading it off the event loop."""
+        self.image_idx = idx
+        self._image = None
+        self._write(_KITTY_DELETE_ALL)
+        self.query_one("#image-caption", Static).update(
+            f"Loading image {idx + 1}/{len(self.image_urls)}..."
+        )
+        self._load_image(idx)
+
+    @work(thread=True, exclusive=True)
+    def _load_image(self, idx: int):
+        """Download (or read from cache) and decode an image on a worker thread."""
+        image_url = self.image_urls[idx]
+        try:
+            image = load_png_for_kitty(get_image_path(image_url))
+        except Exception as e:
+            self.app.call_from_thread(self._image_failed, idx, e)
+            return
+        self.app.call_from_thread(self._image_loaded, idx, image)
+
+    def _image_loaded(self, idx: int, image: tuple):
+        """Show a loaded image, unless the user has already moved on."""
+        if idx != self.image_idx:
+            return
+        self._image = image
+        self.query_one("#image-caption", Static).update(
+            f"Image {idx + 1}/{len(self.image_urls)} ({len(image[0]):,} bytes)"
+        )
+        self.call_after_refresh(self._draw)
+
+    def _image_failed(self, idx: int, error: Exception):
+        """Report an image that could not be loaded."""
+        if idx != self.image_idx:
+            return
+        self.query_one("#image-caption", Static).update(
+            f"Error loading image {idx + 1}/{len(self.image_urls)}: {error}"
+        )
+
+    def _draw(self):
+        """Place the current image over the image area, scaled to fit."""
+        if self._image is None or not self.is_current:
+            return
+        png, width, height = self._image
+        region = self.query_one("#image-area").content_region
+        if region.width < 1 or region.height < 1:
+            return
+
+        # Give Kitty one dimension and let it keep the aspect ratio; terminal
+        # cells are roughly twice as tall as they are wide
+        if region.width * height / (width * 2) <= region.height:
+            keys = b"q=2,c=%d," % region.width
+        else:
+            keys = b"q=2,r=%d," % region.height
+
+        sequence = build_kitty_sequence(io.BytesIO(png), len(png), keys)
+        # Save the cursor, move to the area's top-left cell, draw, restore
+        self._write(
+            f"{_KITTY_DELETE_ALL}\0337\033[{region.y + 1};{region.x + 1}H"
+            f"{sequence.decode('ascii')}\0338"
+        )
+
+    def _write(self, data: str):
+        """Write escape sequences straight to the terminal through the app's driver."""
+        driver = terminal_writer(self.app)
+        if driver is not None:
+            driver.write(data)
+            driver.flush()
+
+    def action_next_image(self):
+        """Show the next image."""
+        if self.image_idx < len(self.image_urls) - 1:
+            self._show_image(self.image_idx + 1)
+
+    def action_previous_image(self):
+        """Show the previous image."""
+        if self.image_idx > 0:
+            self._show_image(self.image_idx - 1)
+
+    def action_dismiss(self):
+        """Remove the image and return to the post."""
+        self._write(_KITTY_DELETE_ALL)
+        self.app.pop_screen()
+
+
 class PostDetailScreen(Screen):
     """Screen to show full post details."""
 
@@ -332,8 +802,7 @@ class PostDetailScreen(Screen):
             self.post_data['_engagement_loaded'] = True
 
             # Refresh the display
-            detail_widget = self.query_one("#post-detail", Static)
-            detail_widget.update(self._format_post())
+            self.query_one("#post-detail-body", Static).update(self._render_body())
 
             if len(self.post_data['engagement_history']) > 0:
                 self.notify(f"Loaded {len(self.post_data['engagement_history'])} engagement snapshots", severity="information")
@@ -351,15 +820,6 @@ class PostDetailScreen(Screen):
         try:
             # Use a short timeout for connecting
             async with websockets.connect(uri, open_timeout=1) as websocket:
-                
-                def json_serializer(obj):
-                    if isinstance(obj, datetime):
-                        return obj.isoformat()
-                    # Add this to handle Path objects if they appear
-                    if isinstance(obj, Path):
-                        return str(obj)
-                    raise TypeError(f"Type {type(obj)} not serializable")
-                
                 payload = json.dumps({
                     "type": "post_detail",
                     "data": self.post_data
@@ -374,15 +834,24 @@ class PostDetailScreen(Screen):
 
     def compose(self) -> ComposeResult:
         yield Header()
+        # The marked line has its own widget so marking a post re-renders
+        # just that line, not the engagement tables and text around it
         yield VerticalScroll(
-            Static(self._format_post(), id="post-detail")
+            Static(self._render_header(), id="post-detail-header"),
+            Static(self._render_marked(), id="post-detail-marked"),
+            Static(self._render_body(), id="post-detail-body"),
+            id="post-detail"
         )
         yield Footer()
 
-    def _format_post(self) -> str:
-        """Format post data for display."""
-        author = self.post_data.get("author", {})
-        posted_at = self.post_data.get("posted_at", {})
+    def _refresh_marked(self):
+        """Re-render the marked line after the post's actions changed."""
+        self.query_one("#post-detail-marked", Static).update(self._render_marked())
+
+    def _render_header(self) -> Text:
+        """Build the styled date, author, URL and ID lines shown for the post."""
+        author = self.post_data.get("author") or _EMPTY
+        posted_at = self.post_data.get("posted_at") or _EMPTY
 
         # Construct name from first_name and last_name if 'name' field doesn't exist
         name = author.get('name')
@@ -392,36 +861,42 @@ class PostDetailScreen(Screen):
             name = f"{first_name} {last_name}".strip() or 'N/A'
 
         lines = [
-            f"[bold cyan]Date:[/bold cyan] {posted_at.get('date', 'N/A')}",
-            f"[bold cyan]Author:[/bold cyan] {author.get('username', 'N/A')}",
-            f"[bold cyan]Name:[/bold cyan] {name}",
-            f"[bold cyan]URL:[/bold cyan] {self.post_data.get('url', 'N/A')}",
+            [("Date:", "bold cyan"), f" {posted_at.get('date', 'N/A')}"],
+            [("Author:", "bold cyan"), f" {author.get('username', 'N/A')}"],
+            [("Name:", "bold cyan"), f" {name}"],
+            [("URL:", "bold cyan"), f" {self.post_data.get('url', 'N/A')}"],
         ]
 
         # Add URN if available
         urn = self.post_data.get('full_urn')
         if urn:
-            lines.append(f"[bold cyan]Full URN:[/bold cyan] {urn}")
-            lines.append("[dim]Press 'u' to copy URN to clipboard[/dim]")
+            lines.append([("Full URN:", "bold cyan"), f" {urn}"])
+            lines.append([("Press 'u' to copy URN to clipboard", "dim")])
 
         # Add post_id if available (for debugging)
         post_id = self.post_data.get('post_id')
         if post_id:
-            lines.append(f"[bold cyan]Post ID:[/bold cyan] [dim]{post_id}[/dim]")
+            lines.append([("Post ID:", "bold cyan"), " ", (str(post_id), "dim")])
 
-        # Add marked status
+        return assemble_lines(lines)
+
+    def _render_marked(self) -> Text:
+        """Build the styled line showing the post's marked status."""
         if self.current_actions:
-            actions_display = ''.join(sorted(self.current_actions))
-            lines.append(f"[bold cyan]Marked:[/bold cyan] [bold green]{actions_display}[/bold green]")
-        else:
-            lines.append(f"[bold cyan]Marked:[/bold cyan] No")
+            actions_display = format_actions_display(self.current_actions)
+            return Text.assemble(("Marked:", "bold cyan"), " ", (actions_display, "bold green"))
+        return Text.assemble(("Marked:", "bold cyan"), " No")
+
+    def _render_body(self) -> Text:
+        """Build the styled engagement, text and media sections shown for the post."""
+        lines = []
 
         # Add engagement data if available
         engagement_history = self.post_data.get("engagement_history", [])
 
         if engagement_history:
-            lines.append("")
-            lines.append("[bold cyan]Engagement:[/bold cyan]")
+            lines.append([])
+            lines.append([("Engagement:", "bold cyan")])
 
             # Case 1: More than one snapshot, show historical trend
             if len(engagement_history) > 1:
@@ -429,11 +904,11 @@ class PostDetailScreen(Screen):
                 previous = engagement_history[-2]
 
                 # Display historical timeline table
-                lines.append("")
-                lines.append("[bold]Historical Timeline:[/bold]")
-                lines.append("┌─────────────────────┬────────────┬──────────┬──────────┐")
-                lines.append("│ Date                │ Reactions  │ Comments │ Reposts  │")
-                lines.append("├─────────────────────┼────────────┼──────────┼──────────┤")
+                lines.append([])
+                lines.append([("Historical Timeline:", "bold")])
+                lines.append(["┌─────────────────────┬────────────┬──────────┬──────────┐"])
+                lines.append(["│ Date                │ Reactions  │ Comments │ Reposts  │"])
+                lines.append(["├─────────────────────┼────────────┼──────────┼──────────┤"])
 
                 display_history = engagement_history[-10:]
                 for snapshot in display_history:
@@ -447,16 +922,16 @@ class PostDetailScreen(Screen):
                     reactions = snapshot.get("reactions", 0)
                     comments = snapshot.get("comments", 0)
                     reposts = snapshot.get("reposts", 0)
-                    lines.append(f"│ {date_display:<19} │ {reactions:>10} │ {comments:>8} │ {reposts:>8} │")
+                    lines.append([f"│ {date_display:<19} │ {reactions:>10} │ {comments:>8} │ {reposts:>8} │"])
 
-                lines.append("└─────────────────────┴────────────┴──────────┴──────────┘")
+                lines.append(["└─────────────────────┴────────────┴──────────┴──────────┘"])
 
                 # Display summary with trend
-                lines.append("")
-                lines.append("[bold]Summary:[/bold]")
-                lines.append("┌─────────────────┬──────────┬──────────┬────────────┐")
-                lines.append("│ Metric          │ Current  │ Change   │ Trend      │")
-                lines.append("├─────────────────┼──────────┼──────────┼────────────┤")
+                lines.append([])
+                lines.append([("Summary:", "bold")])
+                lines.append(["┌─────────────────┬──────────┬──────────┬────────────┐"])
+                lines.append(["│ Metric          │ Current  │ Change   │ Trend      │"])
+                lines.append(["├─────────────────┼──────────┼──────────┼────────────┤"])
 
                 metric_keys = [("Reactions", "reactions"), ("Comments", "comments"), ("Reposts", "reposts")]
                 if current.get("views") is not None:
@@ -468,9 +943,9 @@ class PostDetailScreen(Screen):
                     change = current_val - prev_val
                     change_str = f"+{change}" if change > 0 else str(change)
                     trend = "↗" if change > 0 else ("↘" if change < 0 else "→")
-                    lines.append(f"│ {metric_name:<15} │ {current_val:>8} │ {change_str:>8} │ {trend:<10} │")
+                    lines.append([f"│ {metric_name:<15} │ {current_val:>8} │ {change_str:>8} │ {trend:<10} │"])
 
-                lines.append("└─────────────────┴──────────┴──────────┴────────────┘")
+                lines.append(["└─────────────────┴──────────┴──────────┴────────────┘"])
 
                 # Show time range and total change
                 first_snapshot = engagement_history[0]
@@ -480,16 +955,16 @@ class PostDetailScreen(Screen):
                     last_dt = datetime.fromisoformat(last_snapshot.get("_downloaded_at", "").replace('Z', '+00:00'))
                     days_elapsed = (last_dt - first_dt).total_seconds() / 86400
                     time_range = f"{first_dt.strftime('%b %d')} → {last_dt.strftime('%b %d %H:%M')}"
-                    lines.append(f"[dim]Tracked: {time_range} ({len(engagement_history)} snapshots over {days_elapsed:.1f} days)[/dim]")
+                    lines.append([(f"Tracked: {time_range} ({len(engagement_history)} snapshots over {days_elapsed:.1f} days)", "dim")])
                 except:
-                    lines.append(f"[dim]Tracked: {len(engagement_history)} snapshots[/dim]")
+                    lines.append([(f"Tracked: {len(engagement_history)} snapshots", "dim")])
 
             # Case 2: Exactly one snapshot, show a simple table
             elif len(engagement_history) == 1:
                 snapshot = engagement_history[0]
-                lines.append("┌─────────────────┬──────────┐")
-                lines.append("│ Metric          │ Count    │")
-                lines.append("├─────────────────┼──────────┤")
+                lines.append(["┌─────────────────┬──────────┐"])
+                lines.append(["│ Metric          │ Count    │"])
+                lines.append(["├─────────────────┼──────────┤"])
 
                 metrics = [
                     ("Reactions", snapshot.get("reactions", 0)),
@@ -500,41 +975,42 @@ class PostDetailScreen(Screen):
                     metrics.append(("Views", snapshot.get("views", 0)))
 
                 for metric_name, value in metrics:
-                    lines.append(f"│ {metric_name:<15} │ {value:>8} │")
+                    lines.append([f"│ {metric_name:<15} │ {value:>8} │"])
 
-                lines.append("└─────────────────┴──────────┘")
+                lines.append(["└─────────────────┴──────────┘"])
                 date_str = snapshot.get("_downloaded_at", "")
                 if date_str:
-                    lines.append(f"[dim]Snapshot from: {date_str[:16]}[/dim]")
+                    lines.append([(f"Snapshot from: {date_str[:16]}", "dim")])
         
         else:
             # Case 3: No engagement history at all
-            lines.append("")
-            lines.append("[bold cyan]Engagement:[/bold cyan]")
-            lines.append("[dim]No engagement data available.[/dim]")
+            lines.append([])
+            lines.append([("Engagement:", "bold cyan")])
+            lines.append([("No engagement data available.", "dim")])
 
         lines.extend([
-            "",
-            "[bold cyan]Text:[/bold cyan]",
-            self.post_data.get("text", "No text available."),
+            [],
+            [("Text:", "bold cyan")],
+            [str(self.post_data.get("text", "No text available."))],
         ])
 
         # Add media information
-        media = self.post_data.get("media", {})
-        if media and media.get("type") in ["image", "video"]:
-            lines.append("")
-            lines.append(f"[bold cyan]Media:[/bold cyan] {media.get('type', 'unknown').title()}")
-
-            if media.get("type") in ["image", "images"]:
-                if media.get("type") == "image" and media.get("url"):
-                    lines.append(f"[dim]Image URL: {media.get('url')}[/dim]")
-                elif media.get("type") == "images":
-                    lines.append(f"[dim]{len(media.get('images', []))} Images[/dim]")
+        media = self.post_data.get("media") or _EMPTY
+        media_type = media.get("type")
+        if media_type in _MEDIA_TYPES:
+            lines.append([])
+            lines.append([("Media:", "bold cyan"), f" {media_type.title()}"])
+
+            if media_type in _IMAGE_MEDIA_TYPES:
+                if media_type == "image" and media.get("url"):
+                    lines.append([(f"Image URL: {media.get('url')}", "dim")])
+                elif media_type == "images":
+                    lines.append([(f"{len(media.get('images', []))} Images", "dim")])
 
                 if self.use_kitty_images:
-                    lines.append("[yellow]Press 'i' to view image(s) in terminal[/yellow]")
+                    lines.append([("Press 'i' to view image(s) in terminal", "yellow")])
 
-        return "\n".join(lines)
+        return assemble_lines(lines)
 
     def action_dismiss(self):
         """Return to main screen."""
@@ -550,28 +1026,26 @@ class PostDetailScreen(Screen):
             self.notify("Run with --kitty-images to view images in terminal", severity="warning")
             return
 
-        media = self.post_data.get("media", {})
-        if not media:
-            return
-
-        images_to_show = []
-        if media.get("type") == "image":
-            url = media.get("url")
-            if url:
-                images_to_show.append(url)
-        elif media.get("type") == "images":
-            for img in media.get("images", []):
-                url = img.get("url")
-                if url:
-                    images_to_show.append(url)
+        images_to_show = get_post_image_urls(self.post_data)
 
         if images_to_show:
-            # Suspend the app to show image directly in terminal
+            # In Kitty, draw inside the app instead of suspending it. The
+            # screen loads the first image itself; the rest are downloaded
+            # in parallel meanwhile so paging through them doesn't wait
+            if kitty_inline_supported(self.app):
+                prefetch_images(images_to_show[1:])
+                self.app.push_screen(KittyImageScreen(images_to_show))
+                return
+
+            # Otherwise suspend the app to show image directly in terminal,
+            # downloading the next images while the current one is viewed
+            downloads = prefetch_images(images_to_show)
             with self.app.suspend():
                 for i, image_url in enumerate(images_to_show):
                     print("\n" + "="*80)
                     print(f"Displaying image {i+1}/{len(images_to_show)} (press Enter to return/continue)...")
                     print("="*80 + "\n")
+                    downloads[i].result()
                     display_image_kitty_to_terminal(image_url)
                     print("\n" + "="*80)
                     if i < len(images_to_show) - 1:
@@ -584,7 +1058,7 @@ class PostDetailScreen(Screen):
         """Open the post URL in the default browser."""
         url = self.post_data.get("url")
         if url:
-            subprocess.run(["open", url])
+            webbrowser.open(url, new=2)
 
     def action_copy_urn(self):
         """Copy the full URN to clipboard."""
@@ -616,8 +1090,7 @@ class PostDetailScreen(Screen):
             self.update_callback(self.post_idx, self.current_actions)
 
         # Update the display
-        detail_widget = self.query_one("#post-detail", Static)
-        detail_widget.update(self._format_post())
+        self._refresh_marked()
 
     def action_mark_with_actions(self):
         """Open modal to mark the current post with multiple actions."""
@@ -632,13 +1105,99 @@ class PostDetailScreen(Screen):
                 self.update_callback(self.post_idx, None)
 
             # Update the display
-            detail_widget = self.query_one("#post-detail", Static)
-            detail_widget.update(self._format_post())
+            self._refresh_marked()
 
         modal = ActionModal(self.current_actions.copy())
         self.app.push_screen(modal, handle_actions)
 
 
+def get_text_preview(post: dict) -> str:
+    """
+    Get the post text truncated to 100 characters for TODO listings.
+
+    The preview is computed on first use and kept on the post as
+    '_text_preview', so re-opening the TODO list or quitting doesn't
+    slice the same text again.
+
+    Args:
+        post: Post dictionary
+
+    Returns:
+        Text preview, with "..." appended if the text was truncated
+    """
+    preview = post.get("_text_preview")
+    if preview is None:
+        text = post.get("text") or ""
+        preview = text[:100] + "..." if len(text) > 100 else text
+        post["_text_preview"] = preview
+    return preview
+
+
+def render_todos(posts: list, actions: list = None, markup: bool = True):
+    """
+    Render the TODO list of marked posts.
+
+    Shared by TodoScreen (styled Text) and the quit-with-todos summary
+    printed to the terminal (plain text, with each post's actions).
+
+    Args:
+        posts: Marked posts, in display order
+        actions: Optional action key sets, parallel to posts
+        markup: If True, return styled Text; otherwise a plain string
+
+    Returns:
+        The rendered TODO list
+    """
+    if not posts:
+        if markup:
+            return Text("No posts marked for response.", style="yellow")
+        return "\nNo posts marked for response.\n"
+
+    title = "TODO: LinkedIn Posts to Respond To"
+    if markup:
+        lines = [[(title, "bold cyan")], ["=" * 80], []]
+    else:
+        lines = [[], ["=" * 80], [title], ["=" * 80], []]
+
+    for idx, post in enumerate(posts, 1):
+        author = post.get("author") or _EMPTY
+        posted_at = post.get("posted_at") or _EMPTY
+        username = author.get('username', 'N/A')
+
+        # Construct name from first_name and last_name if 'name' field doesn't exist
+        name = author.get('name')
+        if not name:
+            first_name = author.get('first_name', '')
+            last_name = author.get('last_name', '')
+            name = f"{first_name} {last_name}".strip() or 'N/A'
+
+        fields = [
+            ("Date", posted_at.get('date', 'N/A')),
+            ("URL", post.get("url", "N/A")),
+            ("Profile", f"{name} (@{username})"),
+            ("Preview", get_text_preview(post)),
+        ]
+        if markup:
+            lines.append([(f"({idx})", "bold yellow"), " Respond to post by ", (str(username), "bold")])
+        else:
+            post_actions = actions[idx - 1] if actions else ()
+            action_list = ", ".join(
+                ActionModal.ACTIONS.get(a, {}).get('name', a) for a in sorted(post_actions)
+            )
+            lines.append([f"({idx}) Actions: [{action_list}]"])
+            fields.insert(0, ("Author", username))
+
+        lines.extend(["    ", (f"{label}:", "cyan"), f" {value}"] for label, value in fields)
+        lines.append([])
+
+    if markup:
+        return assemble_lines(lines)
+    return "\n".join(
+        "".join(segment if isinstance(segment, str) else segment[0] for segment in line)
+        for line in lines
+    )
+
+
 class TodoScreen(Screen):
     """Screen to show TODO list of marked posts."""
 
@@ -649,6 +1208,7 @@ class TodoScreen(Screen):
     def __init__(self, marked_posts_data: list):
         super().__init__()
         self.marked_posts_data = marked_posts_data
+        self._rendered = None  # Cached _format_todos() output
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -657,43 +1217,15 @@ class TodoScreen(Screen):
         )
         yield Footer()
 
-    def _format_todos(self) -> str:
-        """Format TODO list for display."""
-        if not self.marked_posts_data:
-            return "[yellow]No posts marked for response.[/yellow]"
+    def _format_todos(self) -> Text:
+        """Format TODO list for display (the list is fixed, so render once)."""
+        if self._rendered is None:
+            self._rendered = self._render_todos()
+        return self._rendered
 
-        lines = [
-            "[bold cyan]TODO: LinkedIn Posts to Respond To[/bold cyan]",
-            "=" * 80,
-            ""
-        ]
-
-        for idx, post in enumerate(self.marked_posts_data, 1):
-            author = post.get("author", {})
-            posted_at = post.get("posted_at", {})
-            text = post.get("text", "")
-            url = post.get("url", "N/A")
-
-            # Construct name from first_name and last_name if 'name' field doesn't exist
-            name = author.get('name')
-            if not name:
-                first_name = author.get('first_name', '')
-                last_name = author.get('last_name', '')
-                name = f"{first_name} {last_name}".strip() or 'N/A'
-
-            # Truncate text for preview
-            text_preview = text[:100] + "..." if len(text) > 100 else text
-
-            lines.extend([
-                f"[bold yellow]({idx})[/bold yellow] Respond to post by [bold]{author.get('username', 'N/A')}[/bold]",
-                f"    [cyan]Date:[/cyan] {posted_at.get('date', 'N/A')}",
-                f"    [cyan]URL:[/cyan] {url}",
-                f"    [cyan]Profile:[/cyan] {name} (@{author.get('username', 'N/A')})",
-                f"    [cyan]Preview:[/cyan] {text_preview}",
-                ""
-            ])
-
-        return "\n".join(lines)
+    def _render_todos(self) -> Text:
+        """Build the styled text shown for the TODO list."""
+        return render_todos(self.marked_posts_data)
 
     def action_dismiss(self):
         """Return to main screen."""
@@ -795,6 +1327,33 @@ class ActionModal(Screen):
         self.dismiss(self.selected_actions)
 
 
+# Marked-column text for every combination of action keys, e.g. {'q', 'a'} -> "aq"
+_ACTION_DISPLAY = {
+    frozenset(keys): ''.join(sorted(keys))
+    for count in range(len(ActionModal.ACTIONS) + 1)
+    for keys in combinations(ActionModal.ACTIONS, count)
+}
+
+
+def format_actions_display(actions) -> str:
+    """
+    Format a set of action keys for display, sorted for a consistent order.
+
+    Args:
+        actions: Action keys (any iterable), or None
+
+    Returns:
+        The keys joined in sorted order (e.g. "aq"), or "" for no actions
+    """
+    if not actions:
+        return ""
+    display = _ACTION_DISPLAY.get(frozenset(actions))
+    if display is None:
+        # Keys outside ActionModal.ACTIONS
+        display = ''.join(sorted(actions))
+    return display
+
+
 class RunHistoryScreen(Screen):
     """Screen to show download run history."""
 
@@ -833,6 +1392,7 @@ class RunHistoryScreen(Screen):
     def load_runs(self):
         """Load and display run history."""
         try:
+            from supabase_client import get_supabase_client
             client = get_supabase_client()
 
             # Use Supabase RPC function to execute custom SQL
@@ -1137,6 +1697,7 @@ class RunStatisticsScreen(Screen):
     def on_mount(self):
         """Load statistics on mount."""
         try:
+            from supabase_client import get_supabase_client
             client = get_supabase_client()
 
             # Fetch all runs to calculate statistics
@@ -1367,15 +1928,23 @@ class MainScreen(Screen):
         Binding("k", "cursor_up", "Up", show=False),
     ]
 
-    def __init__(self, data_source: str, use_db: bool = False, use_kitty_images: bool = False, websocket_port: int = None):
+    def __init__(self, data_source: str, use_db: bool = False, use_kitty_images: bool = False, websocket_port: int = None,
+                 days: int = None):
         super().__init__()
         self.data_source = data_source
         self.use_db = use_db
         self.use_kitty_images = use_kitty_images
         self.websocket_port = websocket_port
+        self.days = days  # Only load posts from the last N days (None for all)
         self.posts = []
         self.marked_posts = {}  # Maps post_idx to {"actions": set(), "timestamp": datetime}
-        self.post_index_map = {}  # Maps row key to post index
+        self._search_texts = []  # get_search_text() of each post, parallel to self.posts
+        self._search_corpus = b""  # All search texts joined by _SEARCH_SEPARATOR
+        self._search_offsets = []  # Start of each post's text in the corpus, plus its end
+        self._row_cells = []  # _post_row() of each post, parallel to self.posts
+        self._applied_filter = None  # (filter type, text) the table currently shows, None for all posts
+        self._filter_matches = []  # Post indices the applied filter matched
+        self._prefetch_executor = None  # Background image downloads, see _prefetch_images
         self.filter_active = False
         self.filter_text = ""
         self.filter_locked = False
@@ -1415,8 +1984,16 @@ class MainScreen(Screen):
         """
         posts = []
 
+        # With --days, only posts from the last N days are loaded. The bound is
+        # in posted_at_formatted's fixed-width "YYYY-MM-DD HH:MM:SS" form, so it
+        # compares as a plain string both in the query and in Python
+        since_str = None
+        if self.days:
+            since_str = (datetime.now(timezone.utc) - timedelta(days=self.days)).strftime("%Y-%m-%d %H:%M:%S")
+
         if self.use_db:
             try:
+                from supabase_client import get_supabase_client
                 client = get_supabase_client()
 
                 # Get the latest import timestamp to define "new"
@@ -1425,27 +2002,33 @@ class MainScreen(Screen):
                 latest_result = client.table('posts').select('first_seen_at').order('first_seen_at', desc=True).limit(1).execute()
                 latest_import_timestamp = latest_result.data[0]['first_seen_at'] if latest_result.data else None
 
-                # Build query for main posts data from the new view
-                main_posts_query = client.table('v_main_post_view').select('*')
-
-                if self.show_new_only and latest_import_timestamp:
-                    latest_dt = datetime.fromisoformat(latest_import_timestamp)
-                    cutoff_dt = latest_dt - timedelta(minutes=5)
-                    cutoff_timestamp = cutoff_dt.isoformat()
-                    main_posts_query = main_posts_query.gte('first_seen_at', cutoff_timestamp)
+                # Posts first seen within 5 minutes of the latest import count as new
+                new_cutoff_dt = None
+                if latest_import_timestamp:
+                    new_cutoff_dt = datetime.fromisoformat(latest_import_timestamp) - timedelta(minutes=5)
+
+                # Build query for main posts data from the new view. The view
+                # carries raw_json too, so the full post comes back in this
+                # same round trip instead of a second posts query by post_id.
+                # Only the columns used below are selected, so Postgres skips
+                # computing the rest of the view per row
+                main_posts_query = client.table('v_main_post_view').select(
+                    'post_id, platform, posted_at_formatted, author_username, text_preview, '
+                    'media_indicator, marked_indicator, first_seen_at, raw_json'
+                )
+
+                if self.show_new_only and new_cutoff_dt:
+                    main_posts_query = main_posts_query.gte('first_seen_at', new_cutoff_dt.isoformat())
+
+                # Filter by date in the query, so older posts (and their
+                # raw_json) are never sent
+                if since_str:
+                    main_posts_query = main_posts_query.gte('posted_at_formatted', since_str)
 
                 if verbose:
                     self.notify("Loading posts from Supabase view...", timeout=10)
                 main_posts_result = main_posts_query.execute()
                 main_posts_data = main_posts_result.data
-                
-                # Fetch raw_json separately for post detail screen, keyed by post_id
-                raw_json_map = {}
-                if main_posts_data:
-                    post_ids_for_raw_json = [row['post_id'] for row in main_posts_data]
-                    raw_json_result = client.table('posts').select('post_id, raw_json').in_('post_id', post_ids_for_raw_json).execute()
-                    for row in raw_json_result.data:
-                        raw_json_map[row['post_id']] = row['raw_json']
 
                 if verbose:
                     self.notify(f"Loaded {len(main_posts_data)} main posts, now loading engagement history...", timeout=10)
@@ -1459,8 +2042,11 @@ class MainScreen(Screen):
                 logger.info(f"Total posts loaded for main view: {len(main_posts_data)}")
                 logger.info(f"Total post_ids extracted: {len(post_ids)}")
 
-                # Separate recent posts (last 15 days) from older posts
+                # Separate recent posts (last 15 days) from older posts.
+                # posted_at_formatted is fixed-width "YYYY-MM-DD HH:MM:SS", so it
+                # compares correctly as a string against a cutoff in the same format
                 cutoff_date = datetime.now(timezone.utc) - timedelta(days=15)
+                cutoff_str = cutoff_date.strftime("%Y-%m-%d %H:%M:%S")
                 recent_post_ids = []
                 old_post_ids = []
 
@@ -1471,17 +2057,8 @@ class MainScreen(Screen):
 
                     # Use posted_at_formatted to determine post age (actual post date, not import date)
                     posted_at = row.get('posted_at_formatted')
-                    if posted_at:
-                        try:
-                            # posted_at_formatted is like "2025-11-30 22:56:19"
-                            posted_at_dt = datetime.strptime(posted_at, "%Y-%m-%d %H:%M:%S")
-                            if posted_at_dt >= cutoff_date:
-                                recent_post_ids.append(post_id)
-                            else:
-                                old_post_ids.append(post_id)
-                        except:
-                            # If parsing fails, treat as old (will be lazy loaded)
-                            old_post_ids.append(post_id)
+                    if posted_at and posted_at >= cutoff_str:
+                        recent_post_ids.append(post_id)
                     else:
                         old_post_ids.append(post_id)
 
@@ -1526,8 +2103,8 @@ class MainScreen(Screen):
                 if verbose:
                     self.notify(f"Processing {len(main_posts_data)} posts...", timeout=5)
                 for row in main_posts_data:
-                    # Use raw_json_map to get the full post data
-                    post = json.loads(raw_json_map.get(row['post_id'], '{}'))
+                    # Use raw_json to get the full post data
+                    post = json_loads(row.get('raw_json') or '{}')
                     post['first_seen_at'] = row['first_seen_at']
                     post['post_id'] = row['post_id']
                     post['text_preview'] = row['text_preview']
@@ -1538,10 +2115,8 @@ class MainScreen(Screen):
                     post['platform'] = row['platform'] # Add platform for table
 
                     # Mark as new if it belongs to the latest import batch (within 5 minutes)
-                    if latest_import_timestamp and row['first_seen_at']:
-                        latest_dt = datetime.fromisoformat(latest_import_timestamp)
-                        row_dt = datetime.fromisoformat(row['first_seen_at'])
-                        post['_is_new'] = (latest_dt - row_dt) <= timedelta(minutes=5)
+                    if new_cutoff_dt and row['first_seen_at']:
+                        post['_is_new'] = datetime.fromisoformat(row['first_seen_at']) >= new_cutoff_dt
                     else:
                         post['_is_new'] = False
 
@@ -1572,13 +2147,15 @@ class MainScreen(Screen):
                 traceback.print_exc()
                 return []
         else:
-            # Legacy file loading
-            json_files = glob.glob(f"{self.data_source}/*.json")
-            for file_path in json_files:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        posts.extend(data)
+            # Legacy file loading (cached after the first parse)
+            posts = load_posts_dir(self.data_source)
+            if since_str:
+                # JSON dumps carry the date as posted_at.date (same format);
+                # posted_at_formatted only exists on rows from the view
+                posts = [
+                    post for post in posts
+                    if (post.get('posted_at_formatted') or (post.get('posted_at') or _EMPTY).get('date') or '') >= since_str
+                ]
 
         return posts
 
@@ -1614,25 +2191,89 @@ class MainScreen(Screen):
 
 
 
-        # Sort by date, newest first (already handled by view, but good for consistency)
-        self.posts.sort(key=lambda x: datetime.fromisoformat(x.get('posted_at_formatted').replace(' ', 'T')), reverse=True)
+        # Sort by date, newest first (already handled by view, but good for consistency).
+        # posted_at_formatted is fixed-width "YYYY-MM-DD HH:MM:SS", so sort on the
+        # string itself rather than building a datetime per post
+        self.posts.sort(key=lambda x: x.get('posted_at_formatted') or '', reverse=True)
+
+        # Build the content filter's search text once per load, not per keystroke.
+        # Kept beside the posts rather than in them, as bytes aren't JSON-serializable
+        self._search_texts = [get_search_text(post) for post in self.posts]
+        self._build_search_corpus()
+        # Likewise the table cells, so re-filtering only looks rows up
+        self._row_cells = [self._post_row(post) for post in self.posts]
 
         # Populate table
         table = self.query_one(DataTable)
         table.clear()
-        self.post_index_map.clear()
-        
-        for idx, post in enumerate(self.posts):
-            self._add_post_to_table(idx, post, table)
-            
+
+        self._add_posts_to_table(list(enumerate(self.posts)), table)
+        self._applied_filter = None
+        self._filter_matches = []
+
         self.update_status_bar(len(self.posts), total_loaded)
 
+        if self.use_kitty_images:
+            self._prefetch_images()
+
+    def _build_search_corpus(self):
+        """Join the posts' search texts so a full content scan is one bytes.find loop.
+
+        self._search_offsets holds where each post's text starts in the
+        corpus, with a final entry for the end, so a match position maps back
+        to its post with bisect.
+        """
+        offsets = []
+        start = 0
+        for text in self._search_texts:
+            offsets.append(start)
+            start += len(text) + len(_SEARCH_SEPARATOR)
+        offsets.append(start)
+        self._search_corpus = _SEARCH_SEPARATOR.join(self._search_texts)
+        self._search_offsets = offsets
+
+    def _search_corpus_matches(self, needle: bytes) -> list:
+        """Return the indices of the posts whose search text contains needle."""
+        corpus = self._search_corpus
+        offsets = self._search_offsets
+        matches = []
+        pos = corpus.find(needle)
+        while pos >= 0:
+            idx = bisect_right(offsets, pos) - 1
+            matches.append(idx)
+            # One hit per post is enough, resume at the next post's text
+            pos = corpus.find(needle, offsets[idx + 1])
+        return matches
+
+    def _prefetch_images(self):
+        """Warm the image cache for the newest posts on background threads."""
+        urls = []
+        for post in self.posts[:PREFETCH_IMAGE_LIMIT]:
+            for url in get_post_image_urls(post):
+                if not get_cached_image_path(url).exists():
+                    urls.append(url)
+        if not urls:
+            return
+
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=PREFETCH_WORKERS,
+                thread_name_prefix="image-prefetch"
+            )
+        for url in urls:
+            self._prefetch_executor.submit(prefetch_image, url)
+
+    def on_unmount(self) -> None:
+        """Drop pending image prefetches so they don't hold up exit."""
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+
     def on_data_table_row_selected(self, event):
         """Handle row selection (Enter key)."""
         row_key = event.row_key
 
-        if row_key is not None and row_key in self.post_index_map:
-            post_idx = self.post_index_map[row_key]
+        post_idx = self._post_idx(row_key)
+        if post_idx is not None:
             post = self.posts[post_idx]
 
             # Get current actions if post is marked
@@ -1660,76 +2301,82 @@ class MainScreen(Screen):
 
         # Update table cell if we have the row_key (coming from table view)
         if row_key:
-            table = self.query_one(DataTable)
-            table.update_cell(row_key, "marked", self._format_actions_display(actions) if actions else "")
+            self._show_mark(self.query_one(DataTable), row_key, actions)
+
+    def _post_idx(self, row_key):
+        """Return the index into self.posts of the post shown in a row (rows are keyed by it)."""
+        if row_key is None or row_key.value is None:
+            return None
+        return int(row_key.value)
+
+    def _cursor_row_key(self, table: DataTable):
+        """Return the row key under the table cursor, or None if there is none."""
+        if not table.is_valid_coordinate(table.cursor_coordinate):
+            return None
+        return table.coordinate_to_cell_key(table.cursor_coordinate).row_key
 
     def action_mark_post(self):
         """Mark/unmark the current post with 'save' action only."""
         table = self.query_one(DataTable)
-        cursor_row = table.cursor_row
+        row_key = self._cursor_row_key(table)
 
-        # Get all row keys and use the cursor index to find the correct one
-        if cursor_row is not None:
-            row_keys = list(table.rows.keys())
-            if cursor_row < len(row_keys):
-                row_key = row_keys[cursor_row]
+        post_idx = self._post_idx(row_key)
+        if post_idx is not None:
 
-                if row_key in self.post_index_map:
-                    post_idx = self.post_index_map[row_key]
-
-                    if post_idx in self.marked_posts:
-                        # Unmark the post completely
-                        del self.marked_posts[post_idx]
-                        table.update_cell(row_key, "marked", "")
-                    else:
-                        # Mark with 'save' action only
-                        self.marked_posts[post_idx] = {
-                            "actions": {'s'},
-                            "timestamp": datetime.now(timezone.utc)
-                        }
-                        table.update_cell(row_key, "marked", self._format_actions_display({'s'}))
+            if post_idx in self.marked_posts:
+                # Unmark the post completely
+                del self.marked_posts[post_idx]
+                self._show_mark(table, row_key, None)
+            else:
+                # Mark with 'save' action only
+                self.marked_posts[post_idx] = {
+                    "actions": {'s'},
+                    "timestamp": datetime.now(timezone.utc)
+                }
+                self._show_mark(table, row_key, {'s'})
 
     def _format_actions_display(self, actions: set) -> str:
         """Format action set for display in the marked column."""
-        if not actions:
-            return ""
-        # Sort actions for consistent display (e.g., "aq" for autoreact and queue)
-        return ''.join(sorted(actions))
+        return format_actions_display(actions)
+
+    def _show_mark(self, table: DataTable, row_key, actions: set | None):
+        """Show a row's mark state in its "marked" column.
+
+        DataTable rows are not widgets and cannot carry CSS classes, so the
+        mark is shown as text. update_cell only stores the value and
+        schedules a repaint; it does not re-measure the column.
+        """
+        table.update_cell(row_key, "marked", self._format_actions_display(actions))
 
     def action_mark_with_actions(self):
         """Open modal to mark the current post with multiple actions."""
         table = self.query_one(DataTable)
-        cursor_row = table.cursor_row
-
-        if cursor_row is not None:
-            row_keys = list(table.rows.keys())
-            if cursor_row < len(row_keys):
-                row_key = row_keys[cursor_row]
-
-                if row_key in self.post_index_map:
-                    post_idx = self.post_index_map[row_key]
-
-                    # Get existing actions if post is already marked
-                    existing_actions = set()
-                    if post_idx in self.marked_posts:
-                        existing_actions = self.marked_posts[post_idx]["actions"].copy()
-
-                    # Open the action modal with a callback
-                    def handle_actions(selected_actions):
-                        """Handle the selected actions from the modal."""
-                        if selected_actions:
-                            self.marked_posts[post_idx] = {
-                                "actions": selected_actions,
-                                "timestamp": datetime.now(timezone.utc)
-                            }
-                            table.update_cell(row_key, "marked", self._format_actions_display(selected_actions))
-                        elif post_idx in self.marked_posts:
-                            # If no actions selected, unmark the post
-                            del self.marked_posts[post_idx]
-                            table.update_cell(row_key, "marked", "")
-
-                    modal = ActionModal(existing_actions)
-                    self.app.push_screen(modal, handle_actions)
+        row_key = self._cursor_row_key(table)
+
+        post_idx = self._post_idx(row_key)
+        if post_idx is not None:
+
+            # Get existing actions if post is already marked
+            existing_actions = set()
+            if post_idx in self.marked_posts:
+                existing_actions = self.marked_posts[post_idx]["actions"].copy()
+
+            # Open the action modal with a callback
+            def handle_actions(selected_actions):
+                """Handle the selected actions from the modal."""
+                if selected_actions:
+                    self.marked_posts[post_idx] = {
+                        "actions": selected_actions,
+                        "timestamp": datetime.now(timezone.utc)
+                    }
+                    self._show_mark(table, row_key, selected_actions)
+                elif post_idx in self.marked_posts:
+                    # If no actions selected, unmark the post
+                    del self.marked_posts[post_idx]
+                    self._show_mark(table, row_key, None)
+
+            modal = ActionModal(existing_actions)
+            self.app.push_screen(modal, handle_actions)
 
     def action_cursor_down(self):
         """Move cursor down in the table."""
@@ -1764,18 +2411,14 @@ class MainScreen(Screen):
     def action_open_url(self):
         """Open the URL of the currently selected post in the default browser."""
         table = self.query_one(DataTable)
-        cursor_row = table.cursor_row
-
-        if cursor_row is not None:
-            row_keys = list(table.rows.keys())
-            if cursor_row < len(row_keys):
-                row_key = row_keys[cursor_row]
-                if row_key in self.post_index_map:
-                    post_idx = self.post_index_map[row_key]
-                    post = self.posts[post_idx]
-                    url = post.get("url")
-                    if url:
-                        subprocess.run(["open", url])
+        row_key = self._cursor_row_key(table)
+
+        post_idx = self._post_idx(row_key)
+        if post_idx is not None:
+            post = self.posts[post_idx]
+            url = post.get("url")
+            if url:
+                webbrowser.open(url, new=2)
 
     def action_start_filter(self):
         """Start filter mode."""
@@ -1913,6 +2556,7 @@ class MainScreen(Screen):
         marked_posts_data = []
         for idx in sorted(self.marked_posts.keys()):
             post = self.posts[idx].copy()
+            post.pop("_text_preview", None)  # Display-only, see get_text_preview
 
             # Add action metadata to the post
             mark_info = self.marked_posts[idx]
@@ -1941,12 +2585,6 @@ class MainScreen(Screen):
 
         try:
             with open(filename, 'w') as f:
-                # Helper for datetime serialization if needed (though posts usually have strings)
-                def json_serializer(obj):
-                    if isinstance(obj, datetime):
-                        return obj.isoformat()
-                    raise TypeError(f"Type {type(obj)} not serializable")
-
                 json.dump(export_data, f, indent=2, default=json_serializer)
             
             self.notify(f"Saved {len(marked_posts_data)} posts to {filename}", severity="information")
@@ -1956,163 +2594,148 @@ class MainScreen(Screen):
 
     def apply_filter(self):
         """Apply filter to the posts and refresh the table."""
+        filter_type = self.current_filter_type
+        filter_key = (filter_type, self.filter_text) if self.filter_text else None
+        if filter_key == self._applied_filter:
+            # e.g. a character typed and deleted again within the debounce delay
+            return
+
         table = self.query_one(DataTable)
         table.clear()
-        self.post_index_map.clear()
 
-        count = 0
+        posts = self.posts
+        previous, self._applied_filter = self._applied_filter, filter_key
+
+        # Substring filters only narrow as their text grows, so extending the
+        # previous filter of the same type just re-checks the posts it matched
+        candidates = range(len(posts))
+        if (previous is not None and previous[0] == filter_type
+                and filter_type not in _RANGE_FILTER_TYPES
+                and previous[1].lower() in self.filter_text.lower()):
+            candidates = self._filter_matches
+
         if not self.filter_text:
             # No filter, show all posts
-            for idx, post in enumerate(self.posts):
-                self._add_post_to_table(idx, post, table)
-            count = len(self.posts)
-        else:
+            matches = list(enumerate(posts))
+        elif filter_type in ("username", "platform"):
             filter_lower = self.filter_text.lower()
+            field = "author_username" if filter_type == "username" else "platform"
+            matches = [
+                (idx, posts[idx]) for idx in candidates
+                if filter_lower in (posts[idx].get(field) or "").lower()
+            ]
+        elif filter_type in ("min_date", "max_date"):
+            # Date filters compare the "YYYY-MM-DD" prefix of posted_at_formatted
+            # as a string, so the filter date is parsed (and normalized) only once
+            try:
+                filter_date_str = datetime.strptime(self.filter_text, "%Y-%m-%d").strftime("%Y-%m-%d")
+            except ValueError:
+                bound = "min" if filter_type == "min_date" else "max"
+                self.notify(f"Invalid {bound} date format: {self.filter_text}. Use YYYY-MM-DD.", severity="error")
+                # If date is invalid, no posts match this filter until corrected
+                self.update_status_bar(0, len(posts))
+                return
+
+            # Ignore time for the date comparison
+            if filter_type == "min_date":
+                matches = [
+                    (idx, post) for idx, post in enumerate(posts)
+                    if (date_str := (post.get("posted_at_formatted") or "")[:10]) and date_str >= filter_date_str
+                ]
+            else:
+                matches = [
+                    (idx, post) for idx, post in enumerate(posts)
+                    if (date_str := (post.get("posted_at_formatted") or "")[:10]) and date_str <= filter_date_str
+                ]
+        elif filter_type == "min_engagements":
+            try:
+                min_engagements = int(self.filter_text)
+            except ValueError:
+                self.notify(f"Invalid minimum engagements number: {self.filter_text}. Enter an integer.", severity="error")
+                self.update_status_bar(0, len(posts))
+                return
+
+            def engagement_match(post: dict) -> bool:
+                """Sum reactions, comments, reposts from the latest snapshot."""
+                engagement_history = post.get("engagement_history")
+                if not engagement_history:
+                    # If no engagement history, it matches if min_engagements is 0
+                    return min_engagements == 0
+                latest_snapshot = engagement_history[-1]
+                total_engagements = (
+                    latest_snapshot.get("reactions", 0) +
+                    latest_snapshot.get("comments", 0) +
+                    latest_snapshot.get("reposts", 0)
+                )
+                return total_engagements >= min_engagements
+
+            matches = [(idx, post) for idx, post in enumerate(posts) if engagement_match(post)]
+        else: # Default content filter or if current_filter_type is not recognized/None
+            needle = self.filter_text.lower().encode('utf-8')
+            if _SEARCH_SEPARATOR in needle:
+                matches = []
+            elif isinstance(candidates, range):
+                # Scanning every post: let bytes.find walk the joined corpus
+                matches = [(idx, posts[idx]) for idx in self._search_corpus_matches(needle)]
+            else:
+                search_texts = self._search_texts
+                matches = [
+                    (idx, posts[idx]) for idx in candidates
+                    if needle in search_texts[idx]
+                ]
 
-            for idx, post in enumerate(self.posts):
-                filter_match = False # Assume no match initially
-
-                if self.current_filter_type == "username":
-                    username = post.get("author_username", "").lower()
-                    if filter_lower in username:
-                        filter_match = True
-                elif self.current_filter_type == "platform":
-                    platform = post.get("platform", "").lower()
-                    if filter_lower in platform:
-                        filter_match = True
-                elif self.current_filter_type == "min_date":
-                    try:
-                        # Convert filter text to datetime object
-                        filter_date = datetime.strptime(self.filter_text, "%Y-%m-%d")
-                        post_date_str = post.get("posted_at_formatted", "")
-                        if post_date_str:
-                            # Parse post date, ignore time for min_date comparison
-                            post_date = datetime.strptime(post_date_str.split(" ")[0], "%Y-%m-%d")
-                            if post_date >= filter_date:
-                                filter_match = True
-                    except ValueError:
-                        self.notify(f"Invalid min date format: {self.filter_text}. Use YYYY-MM-DD.", severity="error")
-                        # If date is invalid, no posts match this filter until corrected
-                        continue 
-                elif self.current_filter_type == "max_date":
-                    try:
-                        filter_date = datetime.strptime(self.filter_text, "%Y-%m-%d")
-                        post_date_str = post.get("posted_at_formatted", "")
-                        if post_date_str:
-                            post_date = datetime.strptime(post_date_str.split(" ")[0], "%Y-%m-%d")
-                            if post_date <= filter_date:
-                                filter_match = True
-                    except ValueError:
-                        self.notify(f"Invalid max date format: {self.filter_text}. Use YYYY-MM-DD.", severity="error")
-                        continue
-                elif self.current_filter_type == "min_engagements":
-                    try:
-                        min_engagements = int(self.filter_text)
-                        # Sum reactions, comments, reposts from the latest snapshot
-                        engagement_history = post.get("engagement_history", [])
-                        if engagement_history:
-                            latest_snapshot = engagement_history[-1]
-                            total_engagements = (
-                                latest_snapshot.get("reactions", 0) +
-                                latest_snapshot.get("comments", 0) +
-                                latest_snapshot.get("reposts", 0)
-                            )
-                            if total_engagements >= min_engagements:
-                                filter_match = True
-                        elif min_engagements == 0: # If no engagement history, it matches if min_engagements is 0
-                            filter_match = True
-                    except ValueError:
-                        self.notify(f"Invalid minimum engagements number: {self.filter_text}. Enter an integer.", severity="error")
-                        continue
-                else: # Default content filter or if current_filter_type is not recognized/None
-                    searchable = post.get("_searchable", "")
-                    if filter_lower in searchable:
-                        filter_match = True
-
-                if filter_match:
-                    self._add_post_to_table(idx, post, table)
-                    count += 1
-                    
-        self.update_status_bar(count, len(self.posts))
-
-    def _add_post_to_table(self, idx: int, post: dict, table: DataTable):
-        """Helper to add a single post to the DataTable."""
-        date_str = post.get("posted_at_formatted", "")
-        username = post.get("author_username", "")
-        
-        # Map platform to 2-letter code
-        platform_full = post.get("platform", "").lower()
-        platform_map = {
-            'linkedin': 'LI',
-            'substack': 'SB',
-            'youtube': 'YT',
-            'twitter': 'X',
-            'instagram': 'IG',
-            'bluesky': 'BS'
-        }
-        platform = platform_map.get(platform_full, platform_full[:2].upper() if platform_full else "")
-        
-        text_preview = post.get("text_preview", "")
-        media_indicator = post.get("media_indicator", "")
-        marked_indicator = post.get("marked_indicator", "")
-        new_indicator = "🆕" if post.get("_is_new") else ""
+        self._filter_matches = [idx for idx, _ in matches]
+        self._add_posts_to_table(matches, table)
+        self.update_status_bar(len(matches), len(posts))
+
+    def _add_posts_to_table(self, indexed_posts: list, table: DataTable):
+        """Add (post_idx, post) pairs to the DataTable in a single batch.
 
-        row_key = table.add_row(date_str, username, platform, text_preview, media_indicator, marked_indicator, new_indicator)
-        self.post_index_map[row_key] = idx
+        Each row is keyed by its post index, so row keys map straight back to
+        self.posts and stay the same when the table is re-filtered. Cells come
+        from the precomputed self._row_cells; only the marked column of posts
+        marked this session is filled in here.
+        """
+        row_cells = self._row_cells
+        marked_posts = self.marked_posts
+        with self.app.batch_update():
+            for idx, _ in indexed_posts:
+                cells = row_cells[idx]
+                if idx in marked_posts:
+                    marked = self._format_actions_display(marked_posts[idx]["actions"])
+                    cells = (*cells[:5], marked, cells[6])
+                table.add_row(*cells, key=str(idx))
+
+    def _post_row(self, post: dict) -> tuple:
+        """Build the DataTable row cells for a post."""
+        get = post.get
+
+        # Map platform to 2-letter code
+        platform_full = (get("platform") or "").lower()
+        platform = PLATFORM_CODES.get(platform_full) or platform_full[:2].upper()
+
+        return (
+            get("posted_at_formatted", ""),
+            get("author_username", ""),
+            platform,
+            get("text_preview", ""),
+            get("media_indicator", ""),
+            get("marked_indicator", ""),
+            "🆕" if get("_is_new") else ""
+        )
 
 
     def action_quit_with_todos(self):
         """Print TODO list with action metadata and quit."""
         self.app.exit()
 
-        if not self.marked_posts:
-            print("\nNo posts marked for response.\n")
-            return
-
-        print("\n" + "="*80)
-        print("TODO: LinkedIn Posts to Respond To")
-        print("="*80 + "\n")
-
-        # Action name mapping for display
-        action_names = {
-            'q': 'Queue for repost',
-            'a': 'Autoreact',
-            'c': 'Autocomment',
-            'n': 'Manual comment',
-            't': 'Autorepost with thoughts',
-            'r': 'Manual repost with thoughts',
-            's': 'Save'
-        }
+        marked = sorted(self.marked_posts.items())
+        posts = [self.posts[post_idx] for post_idx, _ in marked]
+        actions = [mark_info["actions"] for _, mark_info in marked]
 
-        for idx, post_idx in enumerate(sorted(self.marked_posts.keys()), 1):
-            post = self.posts[post_idx]
-            mark_info = self.marked_posts[post_idx]
-            author = post.get("author", {})
-            posted_at = post.get("posted_at", {})
-            text = post.get("text", "")
-            url = post.get("url", "N/A")
-
-            # Construct name from first_name and last_name if 'name' field doesn't exist
-            name = author.get('name')
-            if not name:
-                first_name = author.get('first_name', '')
-                last_name = author.get('last_name', '')
-                name = f"{first_name} {last_name}".strip() or 'N/A'
-
-            # Format actions for display
-            actions = mark_info["actions"]
-            action_list = ", ".join(action_names.get(a, a) for a in sorted(actions))
-
-            # Truncate text for preview
-            text_preview = text[:100] + "..." if len(text) > 100 else text
-
-            print(f"({idx}) Actions: [{action_list}]")
-            print(f"    Author: {author.get('username', 'N/A')}")
-            print(f"    Date: {posted_at.get('date', 'N/A')}")
-            print(f"    URL: {url}")
-            print(f"    Profile: {name} (@{author.get('username', 'N/A')})")
-            print(f"    Preview: {text_preview}")
-            print()
+        # Write the whole list at once rather than a print() per line
+        sys.stdout.write(render_todos(posts, actions, markup=False) + "\n")
+        sys.stdout.flush()
 
 
 class LinkedInPostsApp(App):
@@ -2122,15 +2745,17 @@ class LinkedInPostsApp(App):
         Binding("ctrl+c", "quit", "Quit"),
     ]
 
-    def __init__(self, data_source: str, use_db: bool = False, use_kitty_images: bool = False, websocket_port: int = None):
+    def __init__(self, data_source: str, use_db: bool = False, use_kitty_images: bool = False, websocket_port: int = None,
+                 days: int = None):
         super().__init__()
         self.data_source = data_source
         self.use_db = use_db
         self.use_kitty_images = use_kitty_images
         self.websocket_port = websocket_port
+        self.days = days
 
     def on_mount(self) -> None:
-        self.push_screen(MainScreen(self.data_source, self.use_db, self.use_kitty_images, self.websocket_port))
+        self.push_screen(MainScreen(self.data_source, self.use_db, self.use_kitty_images, self.websocket_port, self.days))
 
     def compose(self) -> ComposeResult:
         # Empty compose as we push the main screen immediately
@@ -2155,6 +2780,12 @@ def main():
         help="Port for the websocket server for external visualization"
     )
 
+    parser.add_argument(
+        "--days",
+        type=int,
+        help="Only load posts from the last N days (filtered in the database query)"
+    )
+
     group = parser.add_mutually_exclusive_group()
     group.add_argument(
         "--data-dir",
@@ -2187,7 +2818,8 @@ def main():
         data_source, 
         use_db=use_db, 
         use_kitty_images=args.kitty_images,
-        websocket_port=args.websocket_port
+        websocket_port=args.websocket_port,
+        days=args.days
     )
     app.run()
 
@@ -12,11 +12,16 @@ import sys
 import asyncio
 import websockets
 import hashlib
+import shutil
 import subprocess
+import functools
 import logging
+import mmap
 import uuid
+import webbrowser
 from pathlib import Path
 from datetime import datetime, timedelta
+from itertools import combinations
 from supabase_client import get_supabase_client
 from textual.app import App, ComposeResult
 from textual.widgets import DataTable, Footer, Header, Static, Input, Checkbox
@@ -25,6 +30,13 @@ from textual.binding import Binding
 from textual.screen import Screen
 from textual import events
 
+# Use orjson for parsing posts if available (several times faster)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 # Cache directory for downloaded images
 CACHE_DIR = Path("cache/images")
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
@@ -58,47 +70,53 @@ REVERSE_ACTION_TYPE_MAP = {v: k for k, v in ACTION_TYPE_MAP.items()}
 
 
 def sync_actions_to_db(post_id: str, added_actions: set, removed_actions: set):
-    """Sync action changes to Supabase."""
+    """Sync action changes to Supabase (one insert and one delete at most)."""
     try:
         client = get_supabase_client()
-        
-        # Handle additions
-        for action_key in added_actions:
-            action_type = ACTION_TYPE_MAP.get(action_key)
-            if action_type:
-                try:
-                    # Check if already exists to avoid duplicates (though not unique constrained, it's cleaner)
-                    # For simplicity in this TUI, we just insert. The UUID ensures no PK collision.
-                    client.table('action_queue').insert({
+
+        # Handle additions with a single bulk insert
+        added_types = [ACTION_TYPE_MAP[key] for key in added_actions if key in ACTION_TYPE_MAP]
+        if added_types:
+            try:
+                # Check if already exists to avoid duplicates (though not unique constrained, it's cleaner)
+                # For simplicity in this TUI, we just insert. The UUID ensures no PK collision.
+                created_at = datetime.now().isoformat()
+                client.table('action_queue').insert([
+                    {
                         'action_id': str(uuid.uuid4()),
                         'post_id': post_id,
                         'action_type': action_type,
                         'status': 'pending',
-                        'created_at': datetime.now().isoformat()
-                    }).execute()
-                    logger.info(f"Added action {action_type} for {post_id}")
-                except Exception as e:
-                    logger.error(f"Error adding action {action_type} for {post_id}: {e}")
-
-        # Handle removals
-        for action_key in removed_actions:
-            action_type = ACTION_TYPE_MAP.get(action_key)
-            if action_type:
-                try:
-                    client.table('action_queue').delete().eq('post_id', post_id).eq('action_type', action_type).execute()
-                    logger.info(f"Removed action {action_type} for {post_id}")
-                except Exception as e:
-                    logger.error(f"Error removing action {action_type} for {post_id}: {e}")
-                    
+                        'created_at': created_at
+                    }
+                    for action_type in added_types
+                ]).execute()
+                logger.info(f"Added actions {added_types} for {post_id}")
+            except Exception as e:
+                logger.error(f"Error adding actions {added_types} for {post_id}: {e}")
+
+        # Handle removals with a single delete
+        removed_types = [ACTION_TYPE_MAP[key] for key in removed_actions if key in ACTION_TYPE_MAP]
+        if removed_types:
+            try:
+                client.table('action_queue').delete().eq('post_id', post_id).in_('action_type', removed_types).execute()
+                logger.info(f"Removed actions {removed_types} for {post_id}")
+            except Exception as e:
+                logger.error(f"Error removing actions {removed_types} for {post_id}: {e}")
+
     except Exception as e:
         logger.error(f"Error in sync_actions_to_db: {e}")
 
 
+@functools.lru_cache(maxsize=4096)
 def get_cached_image_path(image_url: str) -> Path:
     """
     Get the cached image path for a given URL.
     Creates a cache filename based on MD5 hash of the URL.
 
+    Results are memoized, so repeat lookups for the same image (prefetch,
+    then display) skip the hashing and URL parsing.
+
     Args:
         image_url: URL of the image
 
@@ -106,12 +124,15 @@ def get_cached_image_path(image_url: str) -> Path:
         Path to the cached image file
     """
     # Generate MD5 hash of URL
-    url_hash = hashlib.md5(image_url.encode('utf-8')).hexdigest()
+    url_hash = hashlib.md5(image_url.encode('utf-8'), usedforsecurity=False).hexdigest()
 
-    # Try to determine extension from URL
-    from urllib.parse import urlparse
-    parsed = urlparse(image_url)
-    path = parsed.path.lower()
+    # Try to determine extension from the URL path. Sliced out by hand
+    # (dropping fragment, query, scheme and host) as urlparse costs far more
+    path = image_url.split('#', 1)[0].split('?', 1)[0].lower()
+    host_start = path.find('://')
+    if host_start >= 0:
+        path_start = path.find('/', host_start + 3)
+        path = path[path_start:] if path_start >= 0 else ''
 
     # Default to jpg if we can't determine extension
     ext = '.jpg'
@@ -125,64 +146,99 @@ def get_cached_image_path(image_url: str) -> Path:
     return CACHE_DIR / f"{url_hash}{ext}"
 
 
-def download_image(image_url: str) -> bytes:
+@functools.lru_cache(maxsize=1)
+def get_image_http_client():
     """
-    Download an image from URL with proper User-Agent header.
+    Get the HTTP client shared by all image downloads in this session.
 
-    Args:
-        image_url: URL of the image
+    Keeping one client keeps connections to the thumbnail CDN alive between
+    downloads, so only the first image pays for DNS and the TLS handshake.
 
     Returns:
-        Image data as bytes
+        httpx.Client instance
     """
-    from urllib.request import Request, urlopen
+    import httpx
 
-    req = Request(
-        image_url,
+    return httpx.Client(
         headers={
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
-        }
+        },
+        timeout=10,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=8)
     )
-    with urlopen(req, timeout=10) as response:
-        return response.read()
 
 
-def get_image_data(image_url: str) -> bytes:
+def download_image(image_url: str) -> bytes:
     """
-    Get image data, using cache if available, otherwise download and cache.
+    Download an image from URL with proper User-Agent header.
 
     Args:
-        image_url: URL or path to the image
+        image_url: URL of the image
 
     Returns:
         Image data as bytes
     """
-    from urllib.parse import urlparse
+    response = get_image_http_client().get(image_url)
+    response.raise_for_status()
+    return response.content
 
-    parsed = urlparse(image_url)
 
-    # If it's a local file, just read it
-    if parsed.scheme not in ('http', 'https'):
-        with open(image_url, 'rb') as f:
-            return f.read()
+def get_image_path(image_url: str) -> Path:
+    """
+    Get a local path for an image, downloading it into the cache if needed.
+
+    Only an uncached image is ever held in memory, while it is written out;
+    cached and local images are left on disk for the caller to stream.
+
+    Args:
+        image_url: URL or path to the image
+
+    Returns:
+        Path to the local image file
+    """
+    # If it's a local file, use it directly
+    if not image_url.startswith(('http://', 'https://')):
+        return Path(image_url)
 
     # Check cache first
     cache_path = get_cached_image_path(image_url)
     if cache_path.exists():
-        # print(f"Using cached image: {cache_path.name}")
-        with open(cache_path, 'rb') as f:
-            return f.read()
+        return cache_path
+
+    # Download and cache via a part file, so an interrupted write never
+    # leaves a truncated image behind to be served as a cache hit
+    part_path = cache_path.with_name(cache_path.name + '.part')
+    part_path.write_bytes(download_image(image_url))
+    part_path.replace(cache_path)
 
-    # Download and cache
-    # print(f"Downloading image...")
-    image_data = download_image(image_url)
+    return cache_path
 
-    # Save to cache
-    with open(cache_path, 'wb') as f:
-        f.write(image_data)
-    # print(f"Cached image: {cache_path.name}")
 
-    return image_data
+@functools.lru_cache(maxsize=1)
+def find_icat_cmd():
+    """
+    Find a command that displays images with Kitty's icat kitten.
+
+    The result is cached, so the lookup only happens on the first image view.
+
+    Returns:
+        Command as a list (e.g. ['kitty', '+icat']), or None if not found
+    """
+    for cmd in ['kitty', 'icat', '/Applications/Kitty.app/Contents/MacOS/kitty']:
+        if shutil.which(cmd):
+            return [cmd] if cmd == 'icat' else [cmd, '+icat']
+    return None
+
+
+# Kitty graphics protocol escape sequences, pre-encoded so the transmit loop
+# only concatenates bytes. The first chunk carries the transmit-and-display
+# header; m=1 means more chunks follow and m=0 marks the last one.
+_KITTY_FIRST = b"\033_Ga=T,f=100,m=1;"
+_KITTY_ONLY = b"\033_Ga=T,f=100,m=0;"
+_KITTY_MID = b"\033_Gm=1;"
+_KITTY_END = b"\033_Gm=0;"
+_KITTY_TERM = b"\033\\"
 
 
 def display_image_kitty_to_terminal(image_url: str):
@@ -194,44 +250,22 @@ def display_image_kitty_to_terminal(image_url: str):
         image_url: URL or path to the image
     """
     import subprocess
-    import tempfile
-    from urllib.request import urlopen
-    from urllib.parse import urlparse
 
     try:
-        # Get image data (from cache or download)
-        image_data = get_image_data(image_url)
+        # Get the image file (from cache or download)
+        image_path = get_image_path(image_url)
+        image_size = image_path.stat().st_size
 
         # Method 1: Try using icat command (most reliable for Kitty)
         try:
-            # Try different icat command variations
-            icat_cmd = None
-            for cmd in ['kitty', 'icat', '/Applications/Kitty.app/Contents/MacOS/kitty']:
-                try:
-                    result = subprocess.run([cmd, '+icat' if cmd == 'kitty' else '--version'],
-                                          capture_output=True,
-                                          timeout=1)
-                    if result.returncode == 0:
-                        icat_cmd = [cmd, '+icat'] if cmd == 'kitty' else [cmd]
-                        break
-                except (FileNotFoundError, subprocess.TimeoutExpired):
-                    continue
-
+            icat_cmd = find_icat_cmd()
             if not icat_cmd:
                 raise FileNotFoundError("icat not found")
 
-            # Save to temp file
-            with tempfile.NamedTemporaryFile(mode='wb', suffix='.jpg', delete=False) as tmp:
-                tmp.write(image_data)
-                tmp_path = tmp.name
-
-            # Display with icat
-            print(f"Image size: {len(image_data):,} bytes\n")
-            display_cmd = icat_cmd + ['--align', 'left', tmp_path]
+            # Display with icat straight from the image file
+            print(f"Image size: {image_size:,} bytes\n")
+            display_cmd = icat_cmd + ['--align', 'left', str(image_path)]
             subprocess.run(display_cmd)
-
-            # Clean up
-            Path(tmp_path).unlink()
             return
 
         except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.CalledProcessError):
@@ -239,25 +273,30 @@ def display_image_kitty_to_terminal(image_url: str):
             pass
 
         # Method 2: Use Kitty graphics protocol directly
-        print(f"Image size: {len(image_data):,} bytes")
-
-        # Encode image as base64
-        encoded = base64.standard_b64encode(image_data).decode('ascii')
-
-        # Split into chunks
-        chunk_size = 4096
-        chunks = [encoded[i:i+chunk_size] for i in range(0, len(encoded), chunk_size)]
-        print(f"Transmitting {len(chunks)} chunks...\n")
-
-        # Output Kitty graphics protocol escape sequences
-        for i, chunk in enumerate(chunks):
-            if i == 0:
-                sys.stdout.buffer.write(f"\033_Ga=T,f=100;{chunk}\033".encode('ascii'))
-            elif i == len(chunks) - 1:
-                sys.stdout.buffer.write(f"\033_Gm=0;{chunk}\033".encode('ascii'))
-            else:
-                sys.stdout.buffer.write(f"\033_Gm=1;{chunk}\033".encode('ascii'))
+        print(f"Image size: {image_size:,} bytes")
+
+        # Encode in 3072-byte windows, each of which becomes exactly one
+        # 4096-character base64 chunk, appending every escape sequence to one
+        # buffer so the whole image goes out in a single write
+        block_size = 3072
+        num_chunks = max(1, -(-image_size // block_size))
+        print(f"Transmitting {num_chunks} chunks...\n")
+
+        # Build Kitty graphics protocol escape sequences (m=1: more chunks follow),
+        # encoding straight from a memory map of the file rather than a copy of it
+        sequence = bytearray()
+        with open(image_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                for i in range(num_chunks):
+                    more = i < num_chunks - 1
+                    if i == 0:
+                        sequence += _KITTY_FIRST if more else _KITTY_ONLY
+                    else:
+                        sequence += _KITTY_MID if more else _KITTY_END
+                    sequence += base64.standard_b64encode(view[i * block_size:(i + 1) * block_size])
+                    sequence += _KITTY_TERM
 
+        sys.stdout.buffer.write(sequence)
         sys.stdout.buffer.flush()
         print("\n(Image should appear above if you're in Kitty terminal)")
 
@@ -382,8 +421,7 @@ class PostDetailScreen(Screen):
             self.post_data['_engagement_loaded'] = True
 
             # Refresh the display
-            detail_widget = self.query_one("#post-detail", Static)
-            detail_widget.update(self._format_post())
+            self.query_one("#post-detail-body", Static).update(self._format_body())
 
             if len(self.post_data['engagement_history']) > 0:
                 self.notify(f"Loaded {len(self.post_data['engagement_history'])} stats snapshots", severity="information")
@@ -424,13 +462,22 @@ class PostDetailScreen(Screen):
 
     def compose(self) -> ComposeResult:
         yield Header()
+        # The marked line has its own widget so marking a post re-renders
+        # just that line, not the statistics tables and description around it
         yield VerticalScroll(
-            Static(self._format_post(), id="post-detail")
+            Static(self._format_header(), id="post-detail-header"),
+            Static(self._format_marked(), id="post-detail-marked"),
+            Static(self._format_body(), id="post-detail-body"),
+            id="post-detail"
         )
         yield Footer()
 
-    def _format_post(self) -> str:
-        """Format post data for display."""
+    def _refresh_marked(self):
+        """Re-render the marked line after the post's actions changed."""
+        self.query_one("#post-detail-marked", Static).update(self._format_marked())
+
+    def _format_header(self) -> str:
+        """Format the date, channel, URL and ID lines for display."""
         author = self.post_data.get("author", {})
         posted_at = self.post_data.get("posted_at", {})
 
@@ -458,12 +505,18 @@ class PostDetailScreen(Screen):
         if post_id:
             lines.append(f"[bold cyan]Post ID:[/bold cyan] [dim]{post_id}[/dim]")
 
-        # Add marked status
+        return "\n".join(lines)
+
+    def _format_marked(self) -> str:
+        """Format the post's marked status line for display."""
         if self.current_actions:
-            actions_display = ''.join(sorted(self.current_actions))
-            lines.append(f"[bold cyan]Marked:[/bold cyan] [bold green]{actions_display}[/bold green]")
-        else:
-            lines.append(f"[bold cyan]Marked:[/bold cyan] No")
+            actions_display = format_actions_display(self.current_actions)
+            return f"[bold cyan]Marked:[/bold cyan] [bold green]{actions_display}[/bold green]"
+        return "[bold cyan]Marked:[/bold cyan] No"
+
+    def _format_body(self) -> str:
+        """Format the statistics, description and thumbnail sections for display."""
+        lines = []
 
         # Add engagement data if available
         engagement_history = self.post_data.get("engagement_history", [])
@@ -618,7 +671,7 @@ class PostDetailScreen(Screen):
         """Open the post URL in the default browser."""
         url = self.post_data.get("url")
         if url:
-            subprocess.run(["open", url])
+            webbrowser.open(url, new=2)
 
     def action_copy_urn(self):
         """Copy the full URN to clipboard."""
@@ -650,8 +703,7 @@ class PostDetailScreen(Screen):
             self.update_callback(self.post_idx, self.current_actions)
 
         # Update the display
-        detail_widget = self.query_one("#post-detail", Static)
-        detail_widget.update(self._format_post())
+        self._refresh_marked()
 
     def action_mark_with_actions(self):
         """Open modal to mark the current post with multiple actions."""
@@ -666,8 +718,7 @@ class PostDetailScreen(Screen):
                 self.update_callback(self.post_idx, None)
 
             # Update the display
-            detail_widget = self.query_one("#post-detail", Static)
-            detail_widget.update(self._format_post())
+            self._refresh_marked()
 
         modal = ActionModal(self.current_actions.copy())
         self.app.push_screen(modal, handle_actions)
@@ -820,6 +871,33 @@ class ActionModal(Screen):
         self.dismiss(self.selected_actions)
 
 
+# Marked-column text for every combination of action keys, e.g. {'q', 'a'} -> "aq"
+_ACTION_DISPLAY = {
+    frozenset(keys): ''.join(sorted(keys))
+    for count in range(len(ActionModal.ACTIONS) + 1)
+    for keys in combinations(ActionModal.ACTIONS, count)
+}
+
+
+def format_actions_display(actions) -> str:
+    """
+    Format a set of action keys for display, sorted for a consistent order.
+
+    Args:
+        actions: Action keys (any iterable), or None
+
+    Returns:
+        The keys joined in sorted order (e.g. "aq"), or "" for no actions
+    """
+    if not actions:
+        return ""
+    display = _ACTION_DISPLAY.get(frozenset(actions))
+    if display is None:
+        # Keys outside ActionModal.ACTIONS
+        display = ''.join(sorted(actions))
+    return display
+
+
 class MainScreen(Screen):
     """Main screen for the YouTube posts viewer."""
 
@@ -879,7 +957,9 @@ class MainScreen(Screen):
         self.websocket_port = websocket_port
         self.posts = []
         self.marked_posts = {}  # Maps post_idx to {"actions": set(), "timestamp": datetime}
-        self.post_index_map = {}  # Maps row key to post index
+        self._visible_post_indices = []  # Index into self.posts of each table row, in row order
+        self._row_cells = []  # _post_row() of each post, parallel to self.posts
+        self._applied_filter = ""  # Filter text the table currently shows
         self.filter_active = False
         self.filter_text = ""
         self.filter_locked = False
@@ -931,33 +1011,35 @@ class MainScreen(Screen):
                 
             latest_import_timestamp = latest_result.data[0]['first_seen_at'] if latest_result.data else None
 
-            # Build query for main posts data from the new view
-            main_posts_query = client.table('v_main_post_view').select('*').eq('platform', 'youtube')
+            # Videos first seen within 5 minutes of the latest import count as new
+            new_cutoff_dt = None
+            if latest_import_timestamp:
+                new_cutoff_dt = datetime.fromisoformat(latest_import_timestamp) - timedelta(minutes=5)
+
+            # Build query for main posts data from the new view. The view
+            # carries raw_json too, so the full post comes back in this same
+            # round trip instead of a second posts query by post_id. Only the
+            # columns used below are selected, so Postgres skips computing the
+            # rest of the view (e.g. the raw_json-based media_indicator) per row
+            main_posts_query = client.table('v_main_post_view').select(
+                'post_id, urn, posted_at_formatted, author_username, text_preview, '
+                'marked_indicator, first_seen_at, raw_json'
+            ).eq('platform', 'youtube')
 
-            if self.show_new_only and latest_import_timestamp:
-                latest_dt = datetime.fromisoformat(latest_import_timestamp)
-                cutoff_dt = latest_dt - timedelta(minutes=5)
-                cutoff_timestamp = cutoff_dt.isoformat()
-                main_posts_query = main_posts_query.gte('first_seen_at', cutoff_timestamp)
+            if self.show_new_only and new_cutoff_dt:
+                main_posts_query = main_posts_query.gte('first_seen_at', new_cutoff_dt.isoformat())
 
             if verbose:
                 self.notify("Loading videos from Supabase view...", timeout=10)
             main_posts_result = main_posts_query.execute()
             main_posts_data = main_posts_result.data
             
-            # Fetch raw_json separately for post detail screen, keyed by post_id
-            raw_json_map = {}
+            # Fetch media info (thumbnails) for the videos, keyed by post_id
             post_media_map = {}
             if main_posts_data:
-                post_ids_for_raw_json = [row['post_id'] for row in main_posts_data]
-                
-                # Fetch raw_json
-                raw_json_result = client.table('posts').select('post_id, raw_json').in_('post_id', post_ids_for_raw_json).execute()
-                for row in raw_json_result.data:
-                    raw_json_map[row['post_id']] = row['raw_json']
-                    
-                # Fetch media info (thumbnails)
-                media_result = client.table('post_media').select('post_id, media_type, media_url, local_file_path').in_('post_id', post_ids_for_raw_json).execute()
+                post_ids_for_media = [row['post_id'] for row in main_posts_data]
+
+                media_result = client.table('post_media').select('post_id, media_type, media_url, local_file_path').in_('post_id', post_ids_for_media).execute()
                 for row in media_result.data:
                     pid = row['post_id']
                     if pid not in post_media_map:
@@ -984,8 +1066,11 @@ class MainScreen(Screen):
             logger.info("Starting smart engagement history load for main view (YouTube)")
             logger.info(f"Total posts loaded for main view: {len(main_posts_data)}")
             
-            # Separate recent posts (last 15 days) from older posts
-            cutoff_date = datetime.now() - timedelta(days=15)
+            # Separate recent posts (last 15 days) from older posts.
+            # posted_at_formatted is fixed-width "YYYY-MM-DD HH:MM:SS" (e.g.
+            # "2025-11-30 22:56:19"), so it compares correctly as a string
+            # against a cutoff in the same format, without a strptime per row
+            cutoff_str = (datetime.now() - timedelta(days=15)).strftime("%Y-%m-%d %H:%M:%S")
             recent_post_ids = []
             old_post_ids = []
 
@@ -996,16 +1081,8 @@ class MainScreen(Screen):
 
                 # Use posted_at_formatted to determine post age (actual post date, not import date)
                 posted_at = row.get('posted_at_formatted')
-                if posted_at:
-                    try:
-                        # posted_at_formatted is like "2025-11-30 22:56:19"
-                        posted_at_dt = datetime.strptime(posted_at, "%Y-%m-%d %H:%M:%S")
-                        if posted_at_dt >= cutoff_date:
-                            recent_post_ids.append(post_id)
-                        else:
-                            old_post_ids.append(post_id)
-                    except:
-                        old_post_ids.append(post_id)
+                if posted_at and posted_at >= cutoff_str:
+                    recent_post_ids.append(post_id)
                 else:
                     old_post_ids.append(post_id)
 
@@ -1042,8 +1119,8 @@ class MainScreen(Screen):
             if verbose:
                 self.notify(f"Processing {len(main_posts_data)} videos...", timeout=5)
             for row in main_posts_data:
-                # Use raw_json_map to get the full post data
-                post = json.loads(raw_json_map.get(row['post_id'], '{}'))
+                # Use raw_json to get the full post data
+                post = json_loads(row.get('raw_json') or '{}')
                 post['first_seen_at'] = row['first_seen_at']
                 post['post_id'] = row['post_id']
                 post['text_preview'] = row['text_preview']
@@ -1071,10 +1148,8 @@ class MainScreen(Screen):
                     }
 
                 # Mark as new if it belongs to the latest import batch (within 5 minutes)
-                if latest_import_timestamp and row['first_seen_at']:
-                    latest_dt = datetime.fromisoformat(latest_import_timestamp)
-                    row_dt = datetime.fromisoformat(row['first_seen_at'])
-                    post['_is_new'] = (latest_dt - row_dt) <= timedelta(minutes=5)
+                if new_cutoff_dt and row['first_seen_at']:
+                    post['_is_new'] = datetime.fromisoformat(row['first_seen_at']) >= new_cutoff_dt
                 else:
                     post['_is_new'] = False
 
@@ -1119,7 +1194,7 @@ class MainScreen(Screen):
                     pid = post.get('post_id')
                     if pid and pid in actions_map:
                         post['_db_actions'] = actions_map[pid]
-                        post['marked_indicator'] = ''.join(sorted(actions_map[pid]))
+                        post['marked_indicator'] = format_actions_display(actions_map[pid])
                     else:
                         post['_db_actions'] = set()
                         post['marked_indicator'] = ""
@@ -1156,13 +1231,15 @@ class MainScreen(Screen):
         self.posts = self.load_posts(verbose=verbose)
         total_loaded = len(self.posts)
 
-        # Sort by date, newest first
-        self.posts.sort(key=lambda x: datetime.fromisoformat(x.get('posted_at_formatted').replace(' ', 'T')), reverse=True)
+        # Sort by date, newest first. posted_at_formatted is fixed-width
+        # "YYYY-MM-DD HH:MM:SS", so sort on the string itself rather than
+        # parsing a datetime per video (and don't fail on a missing date)
+        self.posts.sort(key=lambda x: x.get('posted_at_formatted') or '', reverse=True)
 
         # Populate table
         table = self.query_one(DataTable)
         table.clear()
-        self.post_index_map.clear()
+        self._visible_post_indices.clear()
         self.marked_posts.clear()
         
         for idx, post in enumerate(self.posts):
@@ -1172,24 +1249,20 @@ class MainScreen(Screen):
                     "actions": post['_db_actions'],
                     "timestamp": datetime.now()
                 }
-            date_str = post.get("posted_at_formatted", "")
-            username = post.get("author_username", "")
-            text_preview = post.get("text_preview", "")
-            media_indicator = "Video"
-            marked_indicator = post.get("marked_indicator", "")
-            new_indicator = "🆕" if post.get("_is_new") else ""
-
-            row_key = table.add_row(date_str, username, text_preview, media_indicator, marked_indicator, new_indicator)
-            self.post_index_map[row_key] = idx
-            
+
+        # Build the table cells once per load rather than on every filter
+        self._row_cells = [self._post_row(post) for post in self.posts]
+        self._add_posts_to_table(list(enumerate(self.posts)), table)
+        self._applied_filter = ""
+
         self.update_status_bar(len(self.posts), total_loaded)
 
     def on_data_table_row_selected(self, event):
         """Handle row selection (Enter key)."""
         row_key = event.row_key
 
-        if row_key is not None and row_key in self.post_index_map:
-            post_idx = self.post_index_map[row_key]
+        post_idx = self._row_post_idx(event.cursor_row)
+        if post_idx is not None:
             post = self.posts[post_idx]
 
             # Get current actions if post is marked
@@ -1238,57 +1311,56 @@ class MainScreen(Screen):
             table = self.query_one(DataTable)
             table.update_cell(row_key, "marked", self._format_actions_display(actions) if actions else "")
 
+    def _cursor_row_key(self, table: DataTable):
+        """Return the row key under the table cursor, or None if there is none."""
+        if not table.is_valid_coordinate(table.cursor_coordinate):
+            return None
+        return table.coordinate_to_cell_key(table.cursor_coordinate).row_key
+
+    def _row_post_idx(self, row: int):
+        """Return the index into self.posts of the post shown in a table row, or None."""
+        if 0 <= row < len(self._visible_post_indices):
+            return self._visible_post_indices[row]
+        return None
+
     def action_mark_post(self):
         """Mark/unmark the current post with 'save' action only."""
         table = self.query_one(DataTable)
-        cursor_row = table.cursor_row
-
-        # Get all row keys and use the cursor index to find the correct one
-        if cursor_row is not None:
-            row_keys = list(table.rows.keys())
-            if cursor_row < len(row_keys):
-                row_key = row_keys[cursor_row]
+        row_key = self._cursor_row_key(table)
 
-                if row_key in self.post_index_map:
-                    post_idx = self.post_index_map[row_key]
+        post_idx = self._row_post_idx(table.cursor_row)
+        if post_idx is not None:
 
-                    # Toggle behavior: if marked at all, unmark completely. Else mark with 's'.
-                    if post_idx in self.marked_posts:
-                        self._update_post_mark(post_idx, None, row_key)
-                    else:
-                        self._update_post_mark(post_idx, {'s'}, row_key)
+            # Toggle behavior: if marked at all, unmark completely. Else mark with 's'.
+            if post_idx in self.marked_posts:
+                self._update_post_mark(post_idx, None, row_key)
+            else:
+                self._update_post_mark(post_idx, {'s'}, row_key)
 
     def _format_actions_display(self, actions: set) -> str:
         """Format action set for display in the marked column."""
-        if not actions:
-            return ""
-        return ''.join(sorted(actions))
+        return format_actions_display(actions)
 
     def action_mark_with_actions(self):
         """Open modal to mark the current post with multiple actions."""
         table = self.query_one(DataTable)
-        cursor_row = table.cursor_row
+        row_key = self._cursor_row_key(table)
 
-        if cursor_row is not None:
-            row_keys = list(table.rows.keys())
-            if cursor_row < len(row_keys):
-                row_key = row_keys[cursor_row]
+        post_idx = self._row_post_idx(table.cursor_row)
+        if post_idx is not None:
 
-                if row_key in self.post_index_map:
-                    post_idx = self.post_index_map[row_key]
-
-                    # Get existing actions if post is already marked
-                    existing_actions = set()
-                    if post_idx in self.marked_posts:
-                        existing_actions = self.marked_posts[post_idx]["actions"].copy()
+            # Get existing actions if post is already marked
+            existing_actions = set()
+            if post_idx in self.marked_posts:
+                existing_actions = self.marked_posts[post_idx]["actions"].copy()
 
-                    # Open the action modal with a callback
-                    def handle_actions(selected_actions):
-                        """Handle the selected actions from the modal."""
-                        self._update_post_mark(post_idx, selected_actions, row_key)
+            # Open the action modal with a callback
+            def handle_actions(selected_actions):
+                """Handle the selected actions from the modal."""
+                self._update_post_mark(post_idx, selected_actions, row_key)
 
-                    modal = ActionModal(existing_actions)
-                    self.app.push_screen(modal, handle_actions)
+            modal = ActionModal(existing_actions)
+            self.app.push_screen(modal, handle_actions)
 
     def action_cursor_down(self):
         """Move cursor down in the table."""
@@ -1314,18 +1386,12 @@ class MainScreen(Screen):
     def action_open_url(self):
         """Open the URL of the currently selected post in the default browser."""
         table = self.query_one(DataTable)
-        cursor_row = table.cursor_row
-
-        if cursor_row is not None:
-            row_keys = list(table.rows.keys())
-            if cursor_row < len(row_keys):
-                row_key = row_keys[cursor_row]
-                if row_key in self.post_index_map:
-                    post_idx = self.post_index_map[row_key]
-                    post = self.posts[post_idx]
-                    url = post.get("url")
-                    if url:
-                        subprocess.run(["open", url])
+        post_idx = self._row_post_idx(table.cursor_row)
+        if post_idx is not None:
+            post = self.posts[post_idx]
+            url = post.get("url")
+            if url:
+                webbrowser.open(url, new=2)
 
     def action_start_filter(self):
         """Start filter mode."""
@@ -1434,42 +1500,66 @@ class MainScreen(Screen):
 
     def apply_filter(self):
         """Apply filter to the posts and refresh the table."""
+        if self.filter_text == self._applied_filter:
+            # e.g. a character typed and deleted again within the debounce delay
+            return
+
+        filter_lower = self.filter_text.lower()
+
+        # Matches only narrow as the filter text grows, so extending the
+        # previous filter just re-checks the rows currently shown
+        candidates = range(len(self.posts))
+        if self._applied_filter and self._applied_filter.lower() in filter_lower:
+            candidates = list(self._visible_post_indices)
+        self._applied_filter = self.filter_text
+
         table = self.query_one(DataTable)
         table.clear()
-        self.post_index_map.clear()
+        self._visible_post_indices.clear()
 
-        count = 0
         if not self.filter_text:
             # No filter, show all posts
-            for idx, post in enumerate(self.posts):
-                self._add_post_to_table(idx, post, table)
-            count = len(self.posts)
+            matches = list(enumerate(self.posts))
         else:
-            # Use simple substring matching for speed
-            filter_lower = self.filter_text.lower()
+            # Use simple substring matching for speed, in text and author
+            posts = self.posts
+            matches = [
+                (idx, posts[idx]) for idx in candidates
+                if filter_lower in (posts[idx].get("text", "") + " " + posts[idx].get("author_username", "")).lower()
+            ]
 
-            for idx, post in enumerate(self.posts):
-                # Search in text and author
-                searchable = (post.get("text", "") + " " + post.get("author_username", "")).lower()
+        self._add_posts_to_table(matches, table)
+        self.update_status_bar(len(matches), len(self.posts))
 
-                # Simple substring match
-                if filter_lower in searchable:
-                    self._add_post_to_table(idx, post, table)
-                    count += 1
-                    
-        self.update_status_bar(count, len(self.posts))
-        
-    def _add_post_to_table(self, idx: int, post: dict, table: DataTable):
-        """Helper to add a single post row to the table."""
-        date_str = post.get("posted_at_formatted", "")
-        username = post.get("author_username", "")
-        text_preview = post.get("text_preview", "")
-        media_indicator = "Video"
-        marked_indicator = post.get("marked_indicator", "")
-        new_indicator = "🆕" if post.get("_is_new") else ""
-
-        row_key = table.add_row(date_str, username, text_preview, media_indicator, marked_indicator, new_indicator)
-        self.post_index_map[row_key] = idx
+    def _add_posts_to_table(self, indexed_posts: list, table: DataTable):
+        """Add (post_idx, post) pairs to the DataTable with one add_rows call.
+
+        Cells come from the precomputed self._row_cells; only the marked
+        column of marked posts is filled in here.
+        """
+        row_cells = self._row_cells
+        marked_posts = self.marked_posts
+        rows = []
+        for idx, _ in indexed_posts:
+            cells = row_cells[idx]
+            if idx in marked_posts:
+                marked = self._format_actions_display(marked_posts[idx]["actions"])
+                cells = (*cells[:4], marked, cells[5])
+            rows.append(cells)
+        with self.app.batch_update():
+            table.add_rows(rows)
+        self._visible_post_indices.extend(idx for idx, _ in indexed_posts)
+
+    def _post_row(self, post: dict) -> tuple:
+        """Build the DataTable row cells for a video."""
+        return (
+            post.get("posted_at_formatted", ""),
+            post.get("author_username", ""),
+            post.get("text_preview", ""),
+            "Video",
+            post.get("marked_indicator", ""),
+            "🆕" if post.get("_is_new") else ""
+        )
 
 
     def action_quit_with_todos(self):
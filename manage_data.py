@@ -7,18 +7,19 @@ Now uses Supabase with AWS-style identifiers and time-series tracking.
 """
 
 import json
-import glob
 import argparse
 import os
 import socket
 import logging
+from collections import deque
+from itertools import islice
 from pathlib import Path
 from datetime import datetime, timezone
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from supabase_client import get_supabase_client
 from db_utils import generate_aws_id, PREFIX_POST, PREFIX_DOWNLOAD, PREFIX_RUN, PREFIX_MEDIA
-from media_cache import download_and_cache_media, download_multiple_media
+from media_cache import download_multiple_media, media_loader
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -88,33 +89,20 @@ def complete_download_run(client, run_id, stats, error_message=None):
     }).eq('run_id', run_id).execute()
 
 
-def extract_and_store_media(client, post_id: str, post_data: dict) -> dict:
+def get_media_urls(post_data: dict) -> list:
     """
-    Extract media from post JSON and create post_media records.
+    Extract media URLs from post JSON.
 
     Args:
-        client: Supabase client
-        post_id: The post's ID
         post_data: Full post JSON data
 
     Returns:
-        Dictionary with media extraction statistics:
-            - media_ids: List of created media_ids
-            - media_count: Number of media items processed
-            - media_cached: Number of media items successfully cached
-            - media_errors: Number of media items that failed
+        List of {'url': ..., 'type': 'image'|'video'} dictionaries
     """
-    stats = {
-        'media_ids': [],
-        'media_count': 0,
-        'media_cached': 0,
-        'media_errors': 0
-    }
-
     media = post_data.get('media', {})
 
     if not media or not media.get('type'):
-        return stats
+        return []
 
     media_urls = []
 
@@ -138,78 +126,258 @@ def extract_and_store_media(client, post_id: str, post_data: dict) -> dict:
             'type': 'video'
         })
 
+    return media_urls
+
+
+def build_media_row(post_id: str, url: str, result: dict) -> dict:
+    """
+    Build a post_media row for a downloaded and cached media item.
+
+    Args:
+        post_id: The post's ID
+        url: Original media URL
+        result: Result dictionary from download_and_cache_media
+
+    Returns:
+        Row dictionary ready to insert into post_media
+    """
+    now = datetime.now(timezone.utc).isoformat()
+
+    # Initialize ai_analysis_log
+    ai_log = [{
+        'timestamp': now,
+        'event': 'media_downloaded',
+        'status': 'success',
+        'details': {
+            'file_size': result['file_size'],
+            'mime_type': result.get('mime_type'),
+            'md5_sum': result['md5_sum']
+        }
+    }]
+
+    return {
+        'media_id': generate_aws_id(PREFIX_MEDIA),
+        'post_id': post_id,
+        'media_type': result['media_type'],
+        'media_url': url,
+        'local_file_path': str(result['local_path']),
+        'md5_sum': result['md5_sum'],
+        'file_size': result['file_size'],
+        'mime_type': result.get('mime_type'),
+        'width': result.get('width'),
+        'height': result.get('height'),
+        'ai_analysis_status': 'not_started',
+        'ai_analysis_log': json.dumps(ai_log),
+        'created_at': now,
+        'updated_at': now
+    }
+
+
+def extract_media_rows(
+    client,
+    post_id: str,
+    post_data: dict,
+    max_workers: int = 5,
+    skip_existing: bool = True
+) -> dict:
+    """
+    Extract media from post JSON, download it, and build post_media rows.
+
+    Nothing is written to post_media; callers store stats['rows'] themselves
+    with store_media_rows (see extract_and_store_media, or backfill_media.py
+    which batches rows across many posts).
+
+    Args:
+        client: Supabase client
+        post_id: The post's ID
+        post_data: Full post JSON data
+        max_workers: Maximum concurrent downloads for this post
+        skip_existing: Look up media already stored for the post and skip
+            downloading it. Pass False when the post is known to have no
+            post_media rows; duplicates are ignored on insert either way.
+
+    Returns:
+        Dictionary with media extraction statistics:
+            - media_ids: List of media_ids (existing and new)
+            - media_count: Number of media items processed
+            - media_cached: Number of media items successfully cached
+            - media_errors: Number of media items that failed
+            - rows: New post_media rows to insert
+    """
+    stats = {
+        'media_ids': [],
+        'media_count': 0,
+        'media_cached': 0,
+        'media_errors': 0,
+        'rows': []
+    }
+
+    media_urls = get_media_urls(post_data)
     if not media_urls:
         return stats
 
     stats['media_count'] = len(media_urls)
 
-    # Download and cache media (sequentially for now to avoid overwhelming the system)
-    for media_item in media_urls:
-        url = media_item['url']
-        media_type = media_item['type']
-
+    # Skip media already stored for this post (one query for all its URLs)
+    pending = media_urls
+    if skip_existing:
         try:
-            # Check if this media URL already exists for this post
-            existing_result = client.table('post_media').select('media_id').eq(
+            existing_result = client.table('post_media').select('media_id, media_url').eq(
                 'post_id', post_id
-            ).eq('media_url', url).execute()
-
-            if existing_result.data:
+            ).execute()
+        except Exception as e:
+            logger.error(f"  ✗ Error checking existing media for post {post_id}: {e}")
+            stats['media_errors'] += len(media_urls)
+            return stats
+
+        existing = {row['media_url']: row['media_id'] for row in existing_result.data}
+        pending = []
+        for media_item in media_urls:
+            url = media_item['url']
+            if url in existing:
                 logger.debug(f"Media already exists for post {post_id}: {url[:50]}...")
-                stats['media_ids'].append(existing_result.data[0]['media_id'])
+                stats['media_ids'].append(existing[url])
                 stats['media_cached'] += 1
+            else:
+                pending.append(media_item)
+
+    if not pending:
+        return stats
+
+    # Download and cache the media (shared with other posts fetching the same URL)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+        futures = [
+            (
+                media_item['url'],
+                executor.submit(
+                    media_loader.load, media_item['url'],
+                    media_type=media_item['type'], timeout=30
+                )
+            )
+            for media_item in pending
+        ]
+        logger.info(f"Downloading {len(pending)} media item(s) for post {post_id}")
+
+        # Collect in submission order so rows keep the post's media order
+        for url, future in futures:
+            try:
+                result = future.result()
+                row = build_media_row(post_id, url, result)
+
+                stats['rows'].append(row)
+                stats['media_ids'].append(row['media_id'])
+                stats['media_cached'] += 1
+                logger.info(f"  ✓ Cached media {row['media_id']}: {result['md5_sum'][:8]}... ({result['file_size']:,} bytes)")
+
+            except Exception as e:
+                logger.error(f"  ✗ Error processing media {url[:50]}...: {e}")
+                stats['media_errors'] += 1
+                # Don't fail the entire import for media errors
                 continue
 
-            # Download and cache the media
-            logger.info(f"Downloading media for post {post_id}: {url[:50]}...")
-            result = download_and_cache_media(url, media_type=media_type, timeout=30)
-
-            # Create media_id
-            media_id = generate_aws_id(PREFIX_MEDIA)
-
-            # Initialize ai_analysis_log
-            ai_log = [{
-                'timestamp': datetime.now(timezone.utc).isoformat(),
-                'event': 'media_downloaded',
-                'status': 'success',
-                'details': {
-                    'file_size': result['file_size'],
-                    'mime_type': result.get('mime_type'),
-                    'md5_sum': result['md5_sum']
-                }
-            }]
-
-            # Insert into post_media table
-            client.table('post_media').insert({
-                'media_id': media_id,
-                'post_id': post_id,
-                'media_type': result['media_type'],
-                'media_url': url,
-                'local_file_path': str(result['local_path']),
-                'md5_sum': result['md5_sum'],
-                'file_size': result['file_size'],
-                'mime_type': result.get('mime_type'),
-                'width': result.get('width'),
-                'height': result.get('height'),
-                'ai_analysis_status': 'not_started',
-                'ai_analysis_log': json.dumps(ai_log),
-                'created_at': datetime.now(timezone.utc).isoformat(),
-                'updated_at': datetime.now(timezone.utc).isoformat()
-            }).execute()
-
-            stats['media_ids'].append(media_id)
-            stats['media_cached'] += 1
-            logger.info(f"  ✓ Cached media {media_id}: {result['md5_sum'][:8]}... ({result['file_size']:,} bytes)")
+    return stats
+
+
+def store_media_rows(client, rows: list):
+    """
+    Insert post_media rows in one request, ignoring media already stored.
+
+    Conflicts on (post_id, media_url) are skipped, so re-runs and racing
+    workers don't fail on duplicates.
+
+    Args:
+        client: Supabase client
+        rows: Rows built by extract_media_rows
+
+    Raises:
+        Exception: If the insert fails
+    """
+    client.table('post_media').upsert(
+        rows, on_conflict='post_id,media_url', ignore_duplicates=True
+    ).execute()
+
+
+def extract_and_store_media(client, post_id: str, post_data: dict, skip_existing: bool = True) -> dict:
+    """
+    Extract media from post JSON and create post_media records.
+
+    Args:
+        client: Supabase client
+        post_id: The post's ID
+        post_data: Full post JSON data
+        skip_existing: Skip media already stored for the post (pass False
+            for a post that was just created)
+
+    Returns:
+        Dictionary with media extraction statistics:
+            - media_ids: List of created media_ids
+            - media_count: Number of media items processed
+            - media_cached: Number of media items successfully cached
+            - media_errors: Number of media items that failed
+    """
+    stats = extract_media_rows(client, post_id, post_data, skip_existing=skip_existing)
+    rows = stats.pop('rows')
 
+    if rows:
+        try:
+            # Insert all of this post's new media in one request
+            store_media_rows(client, rows)
         except Exception as e:
-            logger.error(f"  ✗ Error processing media {url[:50]}...: {e}")
-            stats['media_errors'] += 1
-            # Don't fail the entire import for media errors
-            continue
+            logger.error(f"  ✗ Error storing media for post {post_id}: {e}")
+            new_ids = {row['media_id'] for row in rows}
+            stats['media_ids'] = [media_id for media_id in stats['media_ids'] if media_id not in new_ids]
+            stats['media_cached'] -= len(rows)
+            stats['media_errors'] += len(rows)
 
     return stats
 
 
+def load_json_file(fpath):
+    """Read and parse one JSON file.
+
+    Runs on a reader thread, so errors are returned rather than raised and
+    reported in file order by the caller.
+
+    Args:
+        fpath: Path to the JSON file
+
+    Returns:
+        Parsed JSON data, or the exception raised while reading it
+    """
+    try:
+        with open(fpath, 'rb') as f:
+            return json.loads(f.read())
+    except Exception as e:
+        return e
+
+
+def iter_json_files(files, workers=8):
+    """Parse JSON files on a thread pool, yielding results in file order.
+
+    Only a small window of files (two per worker) is read ahead of the
+    consumer, so a large directory is never held in memory all at once;
+    executor.map() would submit every file up front.
+
+    Args:
+        files: Paths of the JSON files
+        workers: Number of reader threads
+
+    Yields:
+        (path, parsed data or the exception raised while reading it)
+    """
+    files = iter(files)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque(
+            (fpath, executor.submit(load_json_file, fpath))
+            for fpath in islice(files, workers * 2)
+        )
+        while pending:
+            fpath, future = pending.popleft()
+            for next_path in islice(files, 1):
+                pending.append((next_path, executor.submit(load_json_file, next_path)))
+            yield fpath, future.result()
+
+
 def import_directory(client, directory, run_id=None):
     """Import all JSON files from a directory.
 
@@ -221,7 +389,13 @@ def import_directory(client, directory, run_id=None):
     Returns:
         Dictionary with import statistics and run_id
     """
-    files = glob.glob(f"{directory}/*.json")
+    # scandir's entries carry the file type from the directory read, so
+    # listing costs no extra stat per file (hidden files skipped, as glob does)
+    with os.scandir(directory) as entries:
+        files = [
+            entry.path for entry in entries
+            if entry.name.endswith('.json') and not entry.name.startswith('.') and entry.is_file()
+        ]
     print(f"Scanning {len(files)} files in {directory}...")
 
     # Create download run if not provided
@@ -239,10 +413,11 @@ def import_directory(client, directory, run_id=None):
         "media_errors": 0
     }
 
-    for fpath in files:
+    # Read and parse the files on a small thread pool, a few files ahead of the import
+    for fpath, data in iter_json_files(files, workers=min(8, len(files) or 1)):
         try:
-            with open(fpath, 'r') as f:
-                data = json.load(f)
+            if isinstance(data, Exception):
+                raise data
 
             if not isinstance(data, list):
                 # Handle single object files if necessary
@@ -313,7 +488,7 @@ def import_directory(client, directory, run_id=None):
 
                         # Extract and store media for new posts
                         try:
-                            media_stats = extract_and_store_media(client, post_id, post)
+                            media_stats = extract_and_store_media(client, post_id, post, skip_existing=False)
                             stats["media_total"] += media_stats['media_count']
                             stats["media_cached"] += media_stats['media_cached']
                             stats["media_errors"] += media_stats['media_errors']
@@ -6,15 +6,20 @@ Handles downloading, caching, and verification of media files (images, videos, d
 with MD5-based deduplication and integrity checking.
 """
 
+import functools
 import hashlib
 import mimetypes
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Dict, Tuple, List
 from urllib.parse import urlparse
-from urllib.request import Request, urlopen
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import logging
 
+import httpx
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
@@ -59,6 +64,21 @@ EXT_TO_MEDIA_TYPE = {
 # Default User-Agent for downloads
 DEFAULT_USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
 
+# Keep-alive pool for media downloads, sized for the threaded scripts
+# (e.g. backfill_media.py --concurrency) so parallel downloads from the
+# same CDN reuse connections instead of each doing a new TLS handshake
+DOWNLOAD_POOL_LIMITS = httpx.Limits(
+    max_connections=32,
+    max_keepalive_connections=32,
+    keepalive_expiry=60
+)
+
+# Retries for rate-limited (HTTP 429) downloads, with exponential backoff
+RATE_LIMIT_RETRIES = 4
+RATE_LIMIT_BASE_DELAY = 1.0
+# Longest wait honoured from a Retry-After header, so one response can't stall a worker
+RATE_LIMIT_MAX_DELAY = 60.0
+
 
 def calculate_md5(file_path: Path, chunk_size: int = 8192) -> str:
     """
@@ -75,7 +95,7 @@ def calculate_md5(file_path: Path, chunk_size: int = 8192) -> str:
         FileNotFoundError: If file doesn't exist
         IOError: If file cannot be read
     """
-    md5_hash = hashlib.md5()
+    md5_hash = hashlib.md5(usedforsecurity=False)
 
     try:
         with open(file_path, 'rb') as f:
@@ -100,7 +120,7 @@ def calculate_md5_from_bytes(data: bytes) -> str:
     Returns:
         MD5 checksum as hex string
     """
-    return hashlib.md5(data).hexdigest()
+    return hashlib.md5(data, usedforsecurity=False).hexdigest()
 
 
 def get_extension_from_url(url: str) -> str:
@@ -211,30 +231,60 @@ def verify_cached_media(local_path: Path, expected_md5: str) -> bool:
         return False
 
 
-def download_media(media_url: str, timeout: int = 30) -> Tuple[bytes, Optional[str]]:
+@functools.lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """
+    Get the HTTP client shared by all media downloads (thread-safe).
+
+    Returns:
+        httpx.Client instance
+    """
+    return httpx.Client(
+        headers={'User-Agent': DEFAULT_USER_AGENT},
+        follow_redirects=True,
+        limits=DOWNLOAD_POOL_LIMITS
+    )
+
+
+def download_media(
+    media_url: str,
+    timeout: int = 30,
+    retries: int = RATE_LIMIT_RETRIES
+) -> Tuple[bytes, Optional[str]]:
     """
-    Download media from URL with proper headers.
+    Download media from URL with proper headers, over the shared
+    keep-alive client.
+
+    HTTP 429 responses are retried with exponential backoff, honouring the
+    server's Retry-After header when it gives one in seconds (capped at
+    RATE_LIMIT_MAX_DELAY).
 
     Args:
         media_url: URL of the media
         timeout: Download timeout in seconds
+        retries: Maximum retries after a 429 response
 
     Returns:
         Tuple of (media data as bytes, MIME type)
 
     Raises:
-        urllib.error.URLError: If download fails
-        urllib.error.HTTPError: If HTTP error occurs
+        httpx.TransportError: If download fails
+        httpx.HTTPStatusError: If HTTP error occurs
     """
-    req = Request(
-        media_url,
-        headers={'User-Agent': DEFAULT_USER_AGENT}
-    )
+    client = get_http_client()
+
+    for attempt in range(retries + 1):
+        response = client.get(media_url, timeout=timeout)
+        if response.status_code != 429 or attempt == retries:
+            response.raise_for_status()
+            mime_type = response.headers.get('Content-Type', '').split(';')[0].strip()
+            return response.content, mime_type if mime_type else None
 
-    with urlopen(req, timeout=timeout) as response:
-        data = response.read()
-        mime_type = response.headers.get('Content-Type', '').split(';')[0].strip()
-        return data, mime_type if mime_type else None
+        retry_after = (response.headers.get('Retry-After') or '').strip()
+        delay = float(retry_after) if retry_after.isdigit() else RATE_LIMIT_BASE_DELAY * 2 ** attempt
+        delay = min(delay, RATE_LIMIT_MAX_DELAY)
+        logger.warning(f"Rate limited downloading {media_url}, retrying in {delay:.1f}s")
+        time.sleep(delay)
 
 
 def get_image_dimensions(file_path: Path) -> Optional[Tuple[int, int]]:
@@ -407,6 +457,73 @@ def download_multiple_media(
     return results
 
 
+class MediaLoader:
+    """
+    Coalesce downloads of the same media URL across threads.
+
+    Concurrent callers asking for a URL that is already downloading wait on
+    the same in-flight download instead of fetching it again, and recent
+    successful results are remembered (up to max_results URLs) so posts
+    that repost the same media later in a run reuse them too.
+    """
+
+    def __init__(self, max_results: int = 10_000):
+        self.max_results = max_results
+        self._inflight: Dict[str, Future] = {}
+        self._results: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, media_url: str, media_type: Optional[str] = None, timeout: int = 30) -> Dict:
+        """
+        Download and cache media, sharing the work with other callers.
+
+        Args:
+            media_url: URL of the media to download
+            media_type: Optional media type override ('image', 'video', 'document')
+            timeout: Download timeout in seconds
+
+        Returns:
+            Result dictionary (same as download_and_cache_media)
+
+        Raises:
+            Exception: If download or caching fails
+        """
+        with self._lock:
+            if media_url in self._results:
+                self._results.move_to_end(media_url)
+                return self._results[media_url]
+
+            future = self._inflight.get(media_url)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[media_url] = future
+
+        if not is_owner:
+            logger.debug(f"Waiting for in-flight download: {media_url}")
+            return future.result()
+
+        try:
+            result = download_and_cache_media(media_url, media_type=media_type, timeout=timeout)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            with self._lock:
+                self._results[media_url] = result
+                if len(self._results) > self.max_results:
+                    self._results.popitem(last=False)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(media_url, None)
+
+
+# Shared loader for callers that download media from many threads
+media_loader = MediaLoader()
+
+
 def find_cached_by_md5(md5_sum: str) -> Optional[Path]:
     """
     Find a cached file by its MD5 checksum.
@@ -437,7 +554,7 @@ def find_cached_by_url(url: str) -> Optional[Path]:
         Path to the cached file, or None if not found
     """
     # Calculate MD5 of the URL (legacy method)
-    url_md5 = hashlib.md5(url.encode('utf-8')).hexdigest()
+    url_md5 = hashlib.md5(url.encode('utf-8'), usedforsecurity=False).hexdigest()
 
     # Search in all cache directories
     for cache_dir in CACHE_DIRS.values():
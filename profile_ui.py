@@ -8,8 +8,8 @@ from textual.screen import Screen
 from textual import events
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Callable
-import subprocess
 import re
+import webbrowser
 
 from profile_manager import ProfileManager
 from tag_manager import TagManager
@@ -703,6 +703,7 @@ class ProfileManagementScreen(Screen):
         self.tag_manager = TagManager()
         self.profiles = []
         self.profile_index_map = {}  # Maps row key to profile index
+        self._row_keys = []  # Row keys in table order, rebuilt with the table
         self.current_filter_tags = []
         self.current_filter_match_all = False
 
@@ -745,6 +746,7 @@ class ProfileManagementScreen(Screen):
         table = self.query_one(DataTable)
         table.clear()
         self.profile_index_map.clear()
+        self._row_keys = []
 
         target_row_idx = None
         for idx, profile in enumerate(self.profiles):
@@ -771,6 +773,7 @@ class ProfileManagementScreen(Screen):
                 str(profile.get('post_count', 0))
             )
             self.profile_index_map[row_key] = idx
+            self._row_keys.append(row_key)
 
             # Track the row index if this is the profile we want to restore cursor to
             if preserve_cursor_profile_id and profile['profile_id'] == preserve_cursor_profile_id:
@@ -823,7 +826,7 @@ class ProfileManagementScreen(Screen):
         cursor_row = table.cursor_row
 
         if cursor_row is not None:
-            row_keys = list(table.rows.keys())
+            row_keys = self._row_keys
             if cursor_row < len(row_keys):
                 row_key = row_keys[cursor_row]
 
@@ -841,7 +844,7 @@ class ProfileManagementScreen(Screen):
         cursor_row = table.cursor_row
 
         if cursor_row is not None:
-            row_keys = list(table.rows.keys())
+            row_keys = self._row_keys
             if cursor_row < len(row_keys):
                 row_key = row_keys[cursor_row]
 
@@ -866,7 +869,7 @@ class ProfileManagementScreen(Screen):
         cursor_row = table.cursor_row
 
         if cursor_row is not None:
-            row_keys = list(table.rows.keys())
+            row_keys = self._row_keys
             if cursor_row < len(row_keys):
                 row_key = row_keys[cursor_row]
 
@@ -923,7 +926,7 @@ class ProfileManagementScreen(Screen):
         cursor_row = table.cursor_row
 
         if cursor_row is not None:
-            row_keys = list(table.rows.keys())
+            row_keys = self._row_keys
             if cursor_row < len(row_keys):
                 row_key = row_keys[cursor_row]
 
@@ -932,7 +935,7 @@ class ProfileManagementScreen(Screen):
                     profile = self.profiles[profile_idx]
                     username = profile['username']
                     url = f"https://linkedin.com/in/{username}"
-                    subprocess.run(["open", url])
+                    webbrowser.open(url, new=2)
 
     def action_back_to_main(self):
         """Return to the main posts screen."""
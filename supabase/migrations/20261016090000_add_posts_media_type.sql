@@ -0,0 +1,17 @@
+-- ============================================
+-- Add Index: posts with media
+-- ============================================
+-- Purpose: Let "posts with media" be filtered server-side instead of
+-- downloading and parsing every post's raw_json. Indexes the expression
+-- raw_json -> 'media' ->> 'type' rather than adding a stored generated
+-- column, so the table is not rewritten and the posts write path is
+-- unchanged. Queries must repeat the expression exactly to use the index.
+--
+-- Note: like main_post_view, this casts raw_json to jsonb, so every
+-- raw_json must be valid JSON for the index to build.
+-- ============================================
+
+-- Partial index matching the backfill query: newest posts that have media
+CREATE INDEX IF NOT EXISTS idx_posts_media_first_seen
+    ON posts (first_seen_at DESC)
+    WHERE (raw_json::jsonb -> 'media' ->> 'type') IS NOT NULL;
@@ -0,0 +1,33 @@
+-- ============================================
+-- Function: posts_needing_media
+-- ============================================
+-- Purpose: Return posts that have media in raw_json but no post_media
+-- records yet, as a single index-driven anti-join. Used by
+-- backfill_media.py via supabase rpc().
+-- ============================================
+
+CREATE OR REPLACE FUNCTION public.posts_needing_media(
+    start_date TIMESTAMPTZ DEFAULT NULL,
+    lim INTEGER DEFAULT NULL
+)
+RETURNS TABLE (post_id TEXT, raw_json JSONB, first_seen_at TIMESTAMPTZ)
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+SET search_path = public
+AS $$
+    SELECT p.post_id::text, p.raw_json::jsonb, p.first_seen_at::timestamptz
+    FROM posts p
+    WHERE (p.raw_json::jsonb -> 'media' ->> 'type') IS NOT NULL
+      AND (start_date IS NULL OR p.first_seen_at >= start_date)
+      AND NOT EXISTS (
+          SELECT 1 FROM post_media pm WHERE pm.post_id = p.post_id
+      )
+    ORDER BY p.first_seen_at DESC
+    LIMIT lim;
+$$;
+
+-- Makes the NOT EXISTS probe an index-only lookup
+CREATE INDEX IF NOT EXISTS idx_post_media_post_id ON post_media (post_id);
+
+COMMENT ON FUNCTION public.posts_needing_media(TIMESTAMPTZ, INTEGER) IS 'Posts with media in raw_json and no post_media rows, newest first.';
@@ -0,0 +1,29 @@
+-- ============================================
+-- Function: rename_media_ids
+-- ============================================
+-- Purpose: Rename many post_media IDs in one statement. old_ids[i] is
+-- renamed to new_ids[i]. Used by fix_postmedia_ids.py via supabase
+-- rpc() instead of one UPDATE request per row.
+-- ============================================
+
+CREATE OR REPLACE FUNCTION public.rename_media_ids(
+    old_ids TEXT[],
+    new_ids TEXT[]
+)
+RETURNS INTEGER
+LANGUAGE sql
+VOLATILE
+SECURITY INVOKER
+SET search_path = public
+AS $$
+    WITH renamed AS (
+        UPDATE post_media pm
+        SET media_id = m.new_id
+        FROM unnest(old_ids, new_ids) AS m(old_id, new_id)
+        WHERE pm.media_id = m.old_id
+        RETURNING 1
+    )
+    SELECT count(*)::integer FROM renamed;
+$$;
+
+COMMENT ON FUNCTION public.rename_media_ids(TEXT[], TEXT[]) IS 'Rename post_media.media_id old_ids[i] -> new_ids[i]; returns rows updated.';
@@ -0,0 +1,15 @@
+-- ============================================
+-- Index: post_media legacy pm- IDs
+-- ============================================
+-- Purpose: Let fix_postmedia_ids.py find records still using the legacy
+-- pm- prefix (media_id LIKE 'pm-%') with an index scan instead of a
+-- sequential scan of post_media. The partial index is tiny and shrinks
+-- to nothing once the IDs are migrated.
+--
+-- Not built CONCURRENTLY because migrations run inside a transaction;
+-- on a very large table build it manually with CREATE INDEX CONCURRENTLY.
+-- ============================================
+
+CREATE INDEX IF NOT EXISTS post_media_pm_prefix_idx
+    ON post_media (media_id text_pattern_ops)
+    WHERE media_id LIKE 'pm-%';
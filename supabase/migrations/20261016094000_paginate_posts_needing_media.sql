@@ -0,0 +1,48 @@
+-- ============================================
+-- Function: posts_needing_media (keyset pagination)
+-- ============================================
+-- Purpose: Let backfill_media.py stream candidate posts a page at a time
+-- instead of loading every post at once. Pages are ordered by
+-- (first_seen_at, post_id) DESC with NULL first_seen_at last (compared as
+-- -infinity, so those posts still page correctly); pass the last row of
+-- the previous page as after_first_seen_at/after_post_id to fetch the
+-- next one. A NULL after_post_id means the first page.
+-- ============================================
+
+DROP FUNCTION IF EXISTS public.posts_needing_media(TIMESTAMPTZ, INTEGER);
+
+CREATE OR REPLACE FUNCTION public.posts_needing_media(
+    start_date TIMESTAMPTZ DEFAULT NULL,
+    lim INTEGER DEFAULT NULL,
+    after_first_seen_at TIMESTAMPTZ DEFAULT NULL,
+    after_post_id TEXT DEFAULT NULL
+)
+RETURNS TABLE (post_id TEXT, raw_json JSONB, first_seen_at TIMESTAMPTZ)
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+SET search_path = public
+AS $$
+    SELECT p.post_id::text, p.raw_json::jsonb, p.first_seen_at::timestamptz
+    FROM posts p
+    WHERE (p.raw_json::jsonb -> 'media' ->> 'type') IS NOT NULL
+      AND (start_date IS NULL OR p.first_seen_at >= start_date)
+      AND (
+          after_post_id IS NULL
+          OR (COALESCE(p.first_seen_at, '-infinity'::timestamptz), p.post_id)
+             < (COALESCE(after_first_seen_at, '-infinity'::timestamptz), after_post_id)
+      )
+      AND NOT EXISTS (
+          SELECT 1 FROM post_media pm WHERE pm.post_id = p.post_id
+      )
+    ORDER BY COALESCE(p.first_seen_at, '-infinity'::timestamptz) DESC, p.post_id DESC
+    LIMIT lim;
+$$;
+
+-- Cover the keyset order so each page is a short index range scan
+DROP INDEX IF EXISTS idx_posts_media_first_seen;
+CREATE INDEX IF NOT EXISTS idx_posts_media_first_seen
+    ON posts (COALESCE(first_seen_at, '-infinity'::timestamptz) DESC, post_id DESC)
+    WHERE (raw_json::jsonb -> 'media' ->> 'type') IS NOT NULL;
+
+COMMENT ON FUNCTION public.posts_needing_media(TIMESTAMPTZ, INTEGER, TIMESTAMPTZ, TEXT) IS 'Posts with media in raw_json and no post_media rows, newest first, keyset-paginated on (first_seen_at, post_id), NULL first_seen_at last.';
@@ -0,0 +1,42 @@
+-- ============================================
+-- Constraint: one post_media row per (post_id, media_url)
+-- ============================================
+-- Purpose: Let media be inserted with ON CONFLICT (post_id, media_url)
+-- DO NOTHING (PostgREST upsert with ignore_duplicates) instead of
+-- checking for existing rows before every insert. Re-runs and
+-- concurrent backfill workers then can't create duplicate media rows.
+--
+-- DATA CHANGE: this migration DELETES duplicate post_media rows (all but
+-- the oldest per (post_id, media_url)) so the unique index can be built.
+-- Deleted rows are copied to post_media_dedup_archive first; list them
+-- with SELECT media_id, post_id, media_url FROM post_media_dedup_archive.
+-- ============================================
+
+-- Same columns as post_media, no constraints; RLS with no policies keeps
+-- it out of the public API
+CREATE TABLE IF NOT EXISTS post_media_dedup_archive (LIKE post_media);
+ALTER TABLE post_media_dedup_archive ENABLE ROW LEVEL SECURITY;
+
+-- Remove duplicates left by earlier check-then-insert races, keeping the
+-- oldest row for each (post_id, media_url). Rows with a NULL created_at
+-- sort after dated ones, so they are dropped rather than kept forever.
+WITH ranked AS (
+    SELECT ctid,
+           ROW_NUMBER() OVER (
+               PARTITION BY post_id, media_url
+               ORDER BY created_at NULLS LAST, media_id
+           ) AS rn
+    FROM post_media
+),
+deleted AS (
+    DELETE FROM post_media pm
+    USING ranked
+    WHERE pm.ctid = ranked.ctid
+      AND ranked.rn > 1
+    RETURNING pm.*
+)
+INSERT INTO post_media_dedup_archive
+SELECT * FROM deleted;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_post_media_post_id_media_url
+    ON post_media (post_id, media_url);
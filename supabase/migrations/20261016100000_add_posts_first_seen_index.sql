@@ -0,0 +1,14 @@
+-- ============================================
+-- Index: posts by first_seen_at
+-- ============================================
+-- Purpose: Serve the viewers' "latest import" lookup (ORDER BY
+-- first_seen_at DESC LIMIT 1) and the show-new-only filter
+-- (first_seen_at >= cutoff) from an index instead of a sequential
+-- scan and sort of posts on every load.
+--
+-- Not built CONCURRENTLY because migrations run inside a transaction;
+-- on a very large table build it manually with CREATE INDEX CONCURRENTLY.
+-- ============================================
+
+CREATE INDEX IF NOT EXISTS idx_posts_first_seen_at
+    ON posts (first_seen_at DESC);
@@ -3,8 +3,16 @@ Supabase client configuration and connection management.
 """
 import os
 from typing import Optional
+import httpx
 from dotenv import load_dotenv
-from supabase import create_client, Client
+from supabase import create_client, Client, ClientOptions
+
+# HTTP/2 needs the h2 package (httpx[http2]); fall back to HTTP/1.1 keep-alive
+try:
+    import h2  # noqa: F401
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
 
 # Load environment variables from .env file
 load_dotenv()
@@ -13,6 +21,15 @@ load_dotenv()
 SUPABASE_URL: Optional[str] = os.getenv("SUPABASE_URL")
 SUPABASE_API_KEY: Optional[str] = os.getenv("SUPABASE_API_KEY")
 
+# Shared keep-alive connection pool, sized for the threaded scripts
+# (e.g. backfill_media.py --concurrency) rather than httpx's default of 10
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=64,
+    keepalive_expiry=60
+)
+HTTP_TIMEOUT = 120
+
 _supabase_client: Optional[Client] = None
 
 
@@ -34,7 +51,16 @@ def get_supabase_client() -> Client:
         if not SUPABASE_API_KEY:
             raise ValueError("SUPABASE_API_KEY environment variable is not set")
 
-        _supabase_client = create_client(SUPABASE_URL, SUPABASE_API_KEY)
+        http_client = httpx.Client(
+            limits=HTTP_POOL_LIMITS,
+            timeout=HTTP_TIMEOUT,
+            http2=HAS_HTTP2
+        )
+        _supabase_client = create_client(
+            SUPABASE_URL,
+            SUPABASE_API_KEY,
+            options=ClientOptions(httpx_client=http_client)
+        )
 
     return _supabase_client
 
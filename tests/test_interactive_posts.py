@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for interactive_posts.py: legacy JSON dumps and Kitty inline image support.
+
+Run with: python -m unittest tests.test_interactive_posts
+"""
+import json
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import interactive_posts
+
+
+def posted(days_ago: int) -> str:
+    """Return a posted_at.date string from `days_ago` days back."""
+    return (datetime.now(timezone.utc) - timedelta(days=days_ago)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class LegacyDaysFilterTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.data_dir = Path(tmp.name) / "linkedin"
+        self.data_dir.mkdir()
+        cache_patch = mock.patch.object(interactive_posts, 'POSTS_CACHE_DIR', Path(tmp.name) / "cache")
+        cache_patch.start()
+        self.addCleanup(cache_patch.stop)
+
+        # Legacy dumps carry posted_at.date, not posted_at_formatted
+        posts = [
+            {'urn': 'recent', 'posted_at': {'date': posted(1)}},
+            {'urn': 'old', 'posted_at': {'date': posted(30)}},
+            {'urn': 'undated'},
+        ]
+        (self.data_dir / "posts.json").write_text(json.dumps(posts))
+
+    def load(self, days):
+        screen = interactive_posts.MainScreen(str(self.data_dir), use_db=False, days=days)
+        return [post['urn'] for post in screen.load_posts(verbose=False)]
+
+    def test_days_keeps_recent_posts(self):
+        self.assertEqual(self.load(days=7), ['recent'])
+
+    def test_no_days_keeps_all_posts(self):
+        self.assertEqual(sorted(self.load(days=None)), ['old', 'recent', 'undated'])
+
+
+
+class KittyInlineSupportTest(unittest.TestCase):
+
+    @mock.patch.dict(interactive_posts.os.environ, {'KITTY_WINDOW_ID': '1'})
+    def test_no_driver_falls_back(self):
+        # An app that is not running (or a Textual without _driver) has no writer
+        app = interactive_posts.App()
+        self.assertIsNone(interactive_posts.terminal_writer(app))
+        self.assertFalse(interactive_posts.kitty_inline_supported(app))
+
+    @mock.patch.dict(interactive_posts.os.environ, {'KITTY_WINDOW_ID': '1'})
+    def test_driver_enables_inline(self):
+        app = interactive_posts.App()
+        app._driver = mock.Mock(is_headless=False)
+        self.assertIs(interactive_posts.terminal_writer(app), app._driver)
+        self.assertTrue(interactive_posts.kitty_inline_supported(app))
+
+
+if __name__ == '__main__':
+    unittest.main()
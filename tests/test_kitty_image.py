@@ -79,25 +79,25 @@ def display_image_kitty(image_url: str):
 
         print(f"Image size: {len(image_data):,} bytes")
 
-        # Encode image as base64
-        encoded = base64.standard_b64encode(image_data).decode('ascii')
-        print(f"Encoded size: {len(encoded):,} chars")
-
-        # Split into chunks
-        chunk_size = 4096
-        chunks = [encoded[i:i+chunk_size] for i in range(0, len(encoded), chunk_size)]
-        print(f"Split into {len(chunks)} chunks")
+        # Encode in 3072-byte windows, each of which becomes exactly one
+        # 4096-character base64 chunk
+        block_size = 3072
+        num_chunks = max(1, -(-len(image_data) // block_size))
+        print(f"Encoded size: {-(-len(image_data) // 3) * 4:,} chars")
+        print(f"Split into {num_chunks} chunks")
         print("Transmitting using graphics protocol...\n")
 
-        # Output Kitty graphics protocol escape sequences
-        for i, chunk in enumerate(chunks):
-            if i == 0:
-                sys.stdout.buffer.write(f"\033_Ga=T,f=100;{chunk}\033\\".encode('ascii'))
-            elif i == len(chunks) - 1:
-                sys.stdout.buffer.write(f"\033_Gm=0;{chunk}\033\\".encode('ascii'))
-            else:
-                sys.stdout.buffer.write(f"\033_Gm=1;{chunk}\033\\".encode('ascii'))
-
+        # Build all Kitty graphics protocol escape sequences (m=1: more chunks
+        # follow) into one buffer and write it with a single call
+        sequence = bytearray()
+        view = memoryview(image_data)
+        for i in range(num_chunks):
+            more = b"m=1;" if i < num_chunks - 1 else b"m=0;"
+            sequence += b"\033_Ga=T,f=100," + more if i == 0 else b"\033_G" + more
+            sequence += base64.standard_b64encode(view[i * block_size:(i + 1) * block_size])
+            sequence += b"\033\\"
+
+        sys.stdout.buffer.write(sequence)
         sys.stdout.buffer.flush()
         sys.stdout.write("\n")
         sys.stdout.flush()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for the REST insert retry and bisection in archive/migrate_data.py.
+
+Run with: python -m unittest tests.test_migrate_data
+"""
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / "archive")]
+
+import migrate_data
+from postgrest.exceptions import APIError
+
+
+class FakeTable:
+    """Stand-in for a postgrest table builder that fails scripted upserts."""
+
+    def __init__(self, failures):
+        # Called with the rows of each upsert; returns an exception to raise, or None
+        self.failures = failures
+        self.upserts = []
+
+    def upsert(self, rows, **kwargs):
+        self.upserts.append(list(rows))
+        error = self.failures(rows)
+        result = mock.Mock()
+        if error is not None:
+            result.execute.side_effect = error
+        return result
+
+
+def make_migrator(table: FakeTable) -> migrate_data.DataMigrator:
+    """Build a DataMigrator that talks to `table` instead of Supabase."""
+    migrator = migrate_data.DataMigrator.__new__(migrate_data.DataMigrator)
+    migrator._tables = {'posts': table}
+    return migrator
+
+
+@mock.patch.object(migrate_data, 'RETRY_BASE_DELAY', 0)
+class InsertBatchTest(unittest.TestCase):
+
+    def test_api_error_503_is_retried(self):
+        calls = []
+
+        def failures(rows):
+            calls.append(rows)
+            if len(calls) == 1:
+                return APIError({'message': 'Service Unavailable', 'code': '503'})
+            return None
+
+        table = FakeTable(failures)
+        rows = [{'post_id': str(i)} for i in range(4)]
+        successful, errors = make_migrator(table)._insert_batch('posts', rows, 1)
+
+        self.assertEqual((successful, errors), (4, 0))
+        # Retried whole, not bisected
+        self.assertEqual(table.upserts, [rows, rows])
+
+    def test_api_error_codes(self):
+        self.assertTrue(migrate_data.is_transient_error(APIError({'code': '502'})))
+        self.assertFalse(migrate_data.is_transient_error(APIError({'code': '23505'})))
+        self.assertFalse(migrate_data.is_transient_error(APIError({'code': 'PGRST116'})))
+        self.assertFalse(migrate_data.is_transient_error(APIError({})))
+
+    def test_single_bad_row_sends_no_empty_upsert(self):
+        def failures(rows):
+            if any(row['post_id'] == 'bad' for row in rows):
+                return APIError({'message': 'bad row', 'code': '23502'})
+            return None
+
+        table = FakeTable(failures)
+        rows = [{'post_id': 'ok1'}, {'post_id': 'bad'}, {'post_id': 'ok2'}]
+        successful, errors = make_migrator(table)._insert_batch('posts', rows, 1)
+
+        self.assertEqual((successful, errors), (2, 1))
+        self.assertNotIn([], table.upserts)
+
+    def test_one_row_batch_failure(self):
+        table = FakeTable(lambda rows: APIError({'message': 'bad row', 'code': '23502'}))
+        successful, errors = make_migrator(table)._insert_batch('posts', [{'post_id': 'bad'}], 1)
+
+        self.assertEqual((successful, errors), (0, 1))
+        self.assertEqual(table.upserts, [[{'post_id': 'bad'}]])
+
+
+if __name__ == '__main__':
+    unittest.main()